@@ -0,0 +1,253 @@
+import tracemalloc
+from timeit import timeit
+
+from ruffini import Monomial, Polynomial, factorize, dense, sparse
+
+
+# Memory
+def memory_per_term(polynomials=1, terms=10000):
+    """
+    Bytes allocated for each term when creating `polynomials`
+    polynomials with `terms` terms each; the polynomials have
+    the same variables, but different coefficients.
+    """
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    stored = [Polynomial([Monomial(n * terms + i + 1, x=i % 100, y=i // 100) for i in range(terms)])
+              for n in range(polynomials)]
+
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (end - start) / (polynomials * terms)
+
+def product_peak_memory(terms=500):
+    """
+    Peak bytes allocated and seconds needed to multiply
+    two sparse polynomials in four variables with `terms`
+    terms each, storing all the products of the terms
+    (schoolbook) and merging them with a heap
+    """
+
+    a = Polynomial([Monomial(i % 9 + 1, w=i % 5, x=i // 5 % 5, y=i // 25 % 5, z=i // 125) for i in range(terms)])
+    b = Polynomial([Monomial(i % 7 - 3, w=i // 125, x=i % 5, y=i // 5 % 5, z=i // 25 % 5) for i in range(terms)])
+
+    methods = (lambda: Polynomial([s * t for s in a for t in b]),
+               lambda: Polynomial._from_trusted(sparse.heap_product(a, b)))
+    results = []
+
+    for method in methods:
+        tracemalloc.start()
+        seconds = timeit(method, number=1)
+        results.append((tracemalloc.get_traced_memory()[1], seconds))
+        tracemalloc.stop()
+
+    return results
+
+
+# Speed
+def integer_product(terms=60, repeat=5):
+    """
+    Seconds needed to compute the cube of a polynomial
+    with `terms` terms and integer coefficients
+    """
+
+    polynomial = Polynomial([Monomial(i + 1, x=i % 7, y=i % 5, z=i % 3) for i in range(terms)])
+
+    return timeit(lambda: polynomial * polynomial * polynomial, number=repeat) / repeat
+
+def univariate_product(degree=5000, repeat=1):
+    """
+    Seconds needed to compute the square of
+    an univariate polynomial of the given degree
+    """
+
+    polynomial = Polynomial([Monomial(i % 19 - 9, x=i) for i in range(degree + 1)])
+
+    return timeit(lambda: polynomial * polynomial, number=repeat) / repeat
+
+def dense_products(lengths=(16, 32, 64, 128, 256, 512, 1024, 2048)):
+    """
+    Seconds needed to compute the square of a dense polynomial
+    (a list of integer coefficients) with each product method,
+    for every length in `lengths`: they show where each method
+    becomes faster than the previous one
+    """
+
+    methods = (dense.schoolbook_product, dense.karatsuba_product, dense.ntt_product)
+    results = {}
+
+    for length in lengths:
+        coefficients = [i % 19 - 9 for i in range(length)]
+        repeat = max(1, 512 // length)
+        results[length] = [timeit(lambda: method(coefficients, coefficients), number=repeat) / repeat
+                           for method in methods]
+
+    return results
+
+def multivariate_products(degrees=(4, 8, 16), variables="xy"):
+    """
+    Seconds needed to compute the square of a polynomial
+    containing every term of degree lower than `degree` in
+    each variable, with the schoolbook method, with the heap
+    and with the Kronecker substitution, for every degree
+    in `degrees`
+    """
+
+    results = {}
+
+    for degree in degrees:
+        terms = []
+        for i in range(degree ** len(variables)):
+            exponents = {v: i // degree ** n % degree for n, v in enumerate(variables)}
+            terms.append(Monomial(i % 19 - 9, exponents))
+
+        polynomial = Polynomial(terms)
+        names = tuple(sorted(variables))
+
+        methods = (lambda: Polynomial([a * b for a in polynomial for b in polynomial]),
+                   lambda: sparse.heap_product(polynomial, polynomial),
+                   lambda: dense.kronecker_product(polynomial, polynomial, names))
+        results[degree] = [timeit(method, number=1) for method in methods]
+
+    return results
+
+def power(exp=50, repeat=5):
+    """
+    Seconds needed to expand `(x + y + 1)**exp` and
+    `(x**3 + 2x + 1)**(10 * exp)`
+    """
+
+    multivariate = Polynomial(Monomial(x=1), Monomial(y=1), 1)
+    univariate = Polynomial(Monomial(x=3), Monomial(2, x=1), 1)
+
+    return (timeit(lambda: multivariate ** exp, number=repeat) / repeat,
+            timeit(lambda: univariate ** (10 * exp), number=repeat) / repeat)
+
+def evaluation(points=1000):
+    """
+    Seconds needed to evaluate a polynomial in two variables
+    in `points` points with :func:`Polynomial.eval` and with
+    the function returned by :func:`Polynomial.compile`
+    """
+
+    polynomial = Polynomial([Monomial(i % 19 - 9, x=i % 7, y=i // 7) for i in range(49)])
+    values = [(i % 13 - 6, i % 11 - 5) for i in range(points)]
+
+    def compiled():
+        function = polynomial.compile()
+        for x, y in values:
+            function(x, y)
+
+    return (timeit(lambda: [polynomial.eval(x=x, y=y) for x, y in values], number=1),
+            timeit(compiled, number=1))
+
+def comparison(terms=1000, repeat=100):
+    """
+    Seconds needed to hash a polynomial with `terms`
+    terms and to compare it with an equal one
+    """
+
+    a = Polynomial([Monomial(i + 1, x=i % 10, y=i // 10) for i in range(terms)])
+    b = Polynomial(list(reversed(a)))
+
+    return timeit(lambda: hash(a) and a == b, number=repeat) / repeat
+
+def summation(terms=5000):
+    """
+    Seconds needed to sum `terms` monomials with
+    the builtin `sum()` and with :func:`Polynomial.sum`
+    """
+
+    monomials = [Monomial(i + 1, x=i % 50, y=i // 50) for i in range(terms)]
+
+    return (timeit(lambda: sum(monomials), number=1),
+            timeit(lambda: Polynomial.sum(monomials), number=1))
+
+def greatest_common_divisor(degree=30):
+    """
+    Seconds needed to compute the gcd of two univariate
+    polynomials of degree `2 * degree` (with a common factor
+    of degree `degree`) with :func:`Polynomial.gcd` and with
+    the euclidean algorithm, whose rational coefficients grow,
+    and of two polynomials with three variables
+    """
+
+    def univariate(seed):
+        return Polynomial([Monomial((seed * i * i + 7 * i) % 19 - 9, x=i) for i in range(degree + 1)])
+
+    common = univariate(3)
+    a, b = common * univariate(5), common * univariate(11)
+
+    def euclid(a, b):
+        while b:
+            a, b = b, a % b
+        return a
+
+    multivariate = Polynomial([Monomial(i + 1, x=i, y=(i * 3) % 5, z=(i * 2) % 7) for i in range(8)])
+    c = multivariate * Polynomial(Monomial(x=2), Monomial(-2, y=3), Monomial(z=1), 5)
+    d = multivariate * Polynomial(Monomial(y=4), Monomial(3, x=1, z=2), -1)
+
+    return (timeit(lambda: a.gcd(b), number=1),
+            timeit(lambda: euclid(a, b), number=1),
+            timeit(lambda: c.gcd(d), number=1))
+
+def factorization():
+    """
+    Seconds needed to factorize `(2x - 1)**10 (x + 3)**5 (x**2 + 1)`,
+    whose repeated factors are found by the square-free decomposition
+    """
+
+    polynomial = Polynomial(Monomial(2, x=1), -1)**10 * Polynomial(Monomial(x=1), 3)**5 * Polynomial(Monomial(x=2), 1)
+
+    return timeit(lambda: factorize(polynomial), number=1)
+
+def irreducible_factorization(degree=100):
+    """
+    Seconds needed to factorize a polynomial of degree
+    `degree`, product of two irreducible polynomials
+    """
+
+    a = Polynomial([Monomial((i * 7) % 11 - 5, x=i) for i in range(degree * 2 // 5)] + [Monomial(x=degree * 2 // 5)])
+    b = Polynomial([Monomial((i * 5) % 13 - 6, x=i) for i in range(degree * 3 // 5)] + [Monomial(3, x=degree * 3 // 5)])
+    polynomial = a * b
+
+    return timeit(lambda: factorize(polynomial), number=1)
+
+
+# Run the benchmarks
+if __name__ == "__main__":
+    print("memory:")
+    print(f"  1 polynomial: {memory_per_term(1):.0f} bytes per term")
+    print(f"  10 polynomials: {memory_per_term(10):.0f} bytes per term")
+    schoolbook, heap = product_peak_memory()
+    print(f"  sparse product peak (schoolbook, heap): {schoolbook[0] / 2**20:.2f} MiB in {schoolbook[1]:.2f} s, "
+          f"{heap[0] / 2**20:.2f} MiB in {heap[1]:.2f} s")
+
+    print("speed:")
+    print(f"  integer product: {integer_product():.4f} s")
+    print(f"  univariate product (degree 5000): {univariate_product():.4f} s")
+
+    multivariate, univariate = power()
+    print(f"  (x + y + 1)**50: {multivariate:.4f} s")
+    print(f"  (x**3 + 2x + 1)**500: {univariate:.4f} s")
+    evaluated, compiled = evaluation()
+    print(f"  evaluation in 1000 points: {evaluated:.4f} s, compiled: {compiled:.4f} s")
+    print(f"  hash and comparison: {comparison():.5f} s")
+    summed, built = summation()
+    print(f"  sum of 5000 monomials: {summed:.4f} s, Polynomial.sum: {built:.4f} s")
+    modular, euclid, multivariate = greatest_common_divisor()
+    print(f"  gcd (degree 60): {modular:.4f} s, euclid: {euclid:.4f} s, 3 variables: {multivariate:.4f} s")
+    print(f"  factorization of (2x - 1)**10 (x + 3)**5 (x**2 + 1): {factorization():.4f} s")
+    print(f"  factorization of a polynomial of degree 100: {irreducible_factorization():.4f} s")
+
+    print("dense products (schoolbook, karatsuba, ntt):")
+    for length, times in dense_products().items():
+        print(f"  {length} terms: " + ", ".join(f"{t:.5f} s" for t in times))
+
+    print("multivariate products (schoolbook, heap, kronecker):")
+    for variables, degrees in (("xy", (4, 8, 16, 32)), ("xyz", (3, 5, 8))):
+        for degree, times in multivariate_products(degrees, variables).items():
+            print(f"  {len(variables)} variables, degree {degree}: " + ", ".join(f"{t:.5f} s" for t in times))
@@ -1,11 +1,17 @@
 import unittest, doctest
 
-from ruffini import variables, monomials, polynomials, fpolynomials, equations
+from ruffini import variables, rings, dense, sparse, evaluation, divisors, factors, monomials, polynomials, fpolynomials, equations
 
 
 # Create the suite
 suite = unittest.TestSuite()
 suite.addTest(doctest.DocTestSuite(variables))
+suite.addTest(doctest.DocTestSuite(rings))
+suite.addTest(doctest.DocTestSuite(dense))
+suite.addTest(doctest.DocTestSuite(sparse))
+suite.addTest(doctest.DocTestSuite(evaluation))
+suite.addTest(doctest.DocTestSuite(divisors))
+suite.addTest(doctest.DocTestSuite(factors))
 suite.addTest(doctest.DocTestSuite(monomials))
 suite.addTest(doctest.DocTestSuite(polynomials))
 suite.addTest(doctest.DocTestSuite(fpolynomials))
@@ -1,4 +1,5 @@
 from .variables import *
+from .rings import *
 from .monomials import *
 from .polynomials import *
 from .fpolynomials import *
@@ -7,8 +8,11 @@ from .equations import *
 
 __all__ = [
            "VariablesDict",                      # variables.py
+           "lex", "grlex", "grevlex",
+           "Ring", "ZZ", "QQ", "RR", "GF",       # rings.py
+           "ModularInteger",
            "Monomial", "gcd", "lcm", "Variable", # monomials.py
-           "Polynomial",                         # polynomials.py
+           "Polynomial", "PolynomialBuilder",    # polynomials.py
            "FPolynomial", "factorize",           # fpolynomials.py
            "Equation"
 ]
@@ -0,0 +1,833 @@
+"""
+Dense representation of univariate polynomials.
+
+A dense polynomial is a list of coefficients, where the
+i-th element is the coefficient of the term of degree i:
+`3x**2 + 1`, for example, is `[1, 0, 3]`.
+The null polynomial is the empty list.
+
+These functions are used by :class:`Polynomial` when
+it has a single variable and enough terms.
+
+Products are computed with the schoolbook method, with the
+Karatsuba's algorithm or with a number-theoretic transform
+(for integer coefficients), depending on the length of the
+shortest factor: the thresholds can be tuned by changing
+`KARATSUBA_THRESHOLD` and `NTT_THRESHOLD` (run `make benchmark`
+to see where each method becomes the fastest).
+
+The functions whose name ends with `_modulo` work with
+integer coefficients modulo a prime number (or any integer,
+when no inverse is needed), kept between 0 and `prime - 1`:
+they're used by the modular algorithms of :mod:`ruffini.divisors`
+and :mod:`ruffini.factors`.
+"""
+
+from .rings import is_prime, inverse
+from .variables import VariablesDict
+from .monomials import Monomial, divide_coefficients
+
+
+KARATSUBA_THRESHOLD = 64
+NTT_THRESHOLD = 256
+
+# The number-theoretic transforms are computed modulo
+# primes lower than 2**31, such that 2**NTT_ORDER divides
+# p - 1: the longest transform has 2**NTT_ORDER elements
+NTT_ORDER = 20
+NTT_PRIMES = []
+
+
+def strip(coefficients):
+    """
+    Removes the null coefficients of the highest
+    degrees (in place), then returns the list
+
+    >>> strip([1, 2, 0, 0])
+    [1, 2]
+
+    :type coefficients: list
+    :rtype: list
+    """
+
+    while coefficients and not coefficients[-1]:
+        coefficients.pop()
+
+    return coefficients
+
+def add(a, b):
+    """
+    Sums two dense polynomials
+
+    >>> add([1, 2, 3], [1, -2])
+    [2, 0, 3]
+    >>> add([1, 2], [1, -2])
+    [2]
+
+    :type a: list
+    :type b: list
+    :rtype: list
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
+
+    result = list(a)
+    for i, coefficient in enumerate(b):
+        result[i] += coefficient
+
+    return strip(result)
+
+def subtract(a, b):
+    """
+    Subtracts two dense polynomials
+
+    >>> subtract([1, 2, 3], [1, 2, 3])
+    []
+
+    :type a: list
+    :type b: list
+    :rtype: list
+    """
+
+    return add(a, [-coefficient for coefficient in b])
+
+def multiply(a, b):
+    """
+    Multiplies two dense polynomials, choosing the
+    fastest method for their length
+
+    >>> multiply([1, 1], [-1, 1])
+    [-1, 0, 1]
+
+    :type a: list
+    :type b: list
+    :rtype: list
+    """
+
+    if not a or not b:
+        return []
+
+    size = min(len(a), len(b))
+
+    if size >= NTT_THRESHOLD and all(type(c) is int for c in a) and all(type(c) is int for c in b):
+        return ntt_product(a, b)
+    elif size >= KARATSUBA_THRESHOLD:
+        return karatsuba_product(a, b)
+
+    return schoolbook_product(a, b)
+
+def schoolbook_product(a, b):
+    """
+    Multiplies two dense polynomials by multiplying
+    every coefficient of `a` by every coefficient of `b`
+
+    >>> schoolbook_product([1, 2], [3, 4])
+    [3, 10, 8]
+
+    :type a: list
+    :type b: list
+    :rtype: list
+    """
+
+    if not a or not b:
+        return []
+
+    return strip(_schoolbook(a, b))
+
+def karatsuba_product(a, b):
+    """
+    Multiplies two dense polynomials with the Karatsuba's
+    algorithm, which needs three products of half-length
+    polynomials instead of four; the recursion stops when a
+    factor is shorter than `KARATSUBA_THRESHOLD`.
+
+    It works with coefficients of any ring.
+
+    >>> karatsuba_product([1, 2], [3, 4])
+    [3, 10, 8]
+
+    :type a: list
+    :type b: list
+    :rtype: list
+    """
+
+    if not a or not b:
+        return []
+
+    return strip(_karatsuba(a, b))
+
+def ntt_product(a, b):
+    """
+    Multiplies two dense polynomials with integer coefficients
+    with the number-theoretic transform: the product is
+    computed modulo as many primes as needed to contain its
+    coefficients, then rebuilt with the chinese remainder theorem.
+
+    >>> ntt_product([1, 2], [3, -4])
+    [3, 2, -8]
+    >>> ntt_product([10**20], [10**20, 1])
+    [10000000000000000000000000000000000000000, 100000000000000000000]
+
+    If the product is too long or its coefficients are
+    too big, it uses :func:`karatsuba_product`.
+
+    :type a: list
+    :type b: list
+    :rtype: list
+    """
+
+    if not a or not b:
+        return []
+
+    length = len(a) + len(b) - 1
+    size = 1 << (length - 1).bit_length()
+
+    # the coefficients of the product are lower than bound / 2
+    bound = 2 * min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+
+    # find the residues of the product modulo some primes
+    residues = []
+    modulus = 1
+
+    while modulus <= bound:
+        prime = _ntt_prime(len(residues))
+        if size > 2**NTT_ORDER or prime is None:
+            return karatsuba_product(a, b)
+
+        prime, root = prime
+        root = pow(root, 2**NTT_ORDER // size, prime)
+
+        fa = [c % prime for c in a] + [0] * (size - len(a))
+        fb = [c % prime for c in b] + [0] * (size - len(b))
+        _transform(fa, root, prime)
+        _transform(fb, root, prime)
+
+        product = [x * y % prime for x, y in zip(fa, fb)]
+        _inverse_transform(product, inverse(root, prime), prime)
+
+        residues.append((prime, product[:length]))
+        modulus *= prime
+
+    # rebuild the coefficients (Garner's algorithm)
+    prime, result = residues[0]
+    modulus = prime
+
+    for prime, product in residues[1:]:
+        factor = inverse(modulus % prime, prime)
+        result = [x + modulus * ((y - x) * factor % prime) for x, y in zip(result, product)]
+        modulus *= prime
+
+    # use the symmetric representation
+    half = modulus // 2
+    return strip([x - modulus if x > half else x for x in result])
+
+def divide(a, b):
+    """
+    Divides two dense polynomials with the long
+    division, returning the quotient and the remainder
+
+    >>> divide([-1, 0, 0, 1], [-1, 1])
+    ([1, 1, 1], [])
+    >>> divide([1, 0, 1], [0, 2])
+    ([0, Fraction(1, 2)], [1])
+
+    It raises a ZeroDivisionError if `b` is null.
+
+    :type a: list
+    :type b: list
+    :rtype: tuple
+    :raise: ZeroDivisionError
+    """
+
+    if not b:
+        raise ZeroDivisionError("polynomial division by zero")
+
+    # x - root: use the Ruffini's rule
+    if len(b) == 2 and b[1] == 1 and len(a) > 1:
+        quotient, remainder = synthetic_division(a, -b[0])
+        return strip(quotient), strip([remainder])
+
+    remainder = list(a)
+    quotient = [0] * max(len(a) - len(b) + 1, 0)
+    leading = b[-1]
+
+    for i in range(len(quotient) - 1, -1, -1):
+        coefficient = remainder[i + len(b) - 1]
+        if not coefficient:
+            continue
+
+        factor = divide_coefficients(coefficient, leading)
+        quotient[i] = factor
+        _add_at(remainder, [-factor * c for c in b], i)
+
+    return strip(quotient), strip(remainder[:len(b) - 1])
+
+def power(coefficients, exp):
+    """
+    Raises a dense polynomial to a power with the J.C.P.
+    Miller's recurrence: if `f = a0 + a1x + ... + adx**d` and
+    `f**n = b0 + b1x + ...`, then `b0 = a0**n` and
+
+    `bk = (sum((n*i - k + i) * ai * b(k-i) for i in 1...d)) / (k * a0)`
+
+    so every coefficient of the result costs a product for
+    every term of `f`, without any intermediate polynomial
+
+    >>> power([1, 1], 4)
+    [1, 4, 6, 4, 1]
+    >>> power([0, 0, 2], 3)
+    [0, 0, 0, 0, 0, 0, 8]
+
+    The coefficients are divided, so they can't
+    be elements of a finite field.
+
+    :type coefficients: list
+    :type exp: int
+    :rtype: list
+    """
+
+    if not coefficients:
+        return [1] if not exp else []
+
+    # factor out the lowest power of x, so that a0 isn't null
+    shift = 0
+    while not coefficients[shift]:
+        shift += 1
+    coefficients = coefficients[shift:]
+
+    degree = len(coefficients) - 1
+    first = coefficients[0]
+
+    # only the not-null coefficients are used
+    terms = [(i, c) for i, c in enumerate(coefficients) if i and c]
+
+    result = [0] * (degree * exp + 1)
+    result[0] = first ** exp
+
+    for k in range(1, len(result)):
+        total = 0
+        for i, coefficient in terms:
+            if i > k:
+                break
+            total += ((exp + 1) * i - k) * coefficient * result[k - i]
+
+        result[k] = divide_coefficients(total, k * first)
+
+    return [0] * (shift * exp) + result
+
+def evaluate(coefficients, value):
+    """
+    Evaluates a dense polynomial with
+    the Horner's method
+
+    >>> evaluate([1, 0, 3], 2)
+    13
+
+    :type coefficients: list
+    :type value: int, float, Fraction, ModularInteger
+    :rtype: int, float, Fraction, ModularInteger
+    """
+
+    result = 0
+
+    for coefficient in reversed(coefficients):
+        result = result * value + coefficient
+
+    return result
+
+def synthetic_division(coefficients, root):
+    """
+    Divides a dense polynomial by `(x - root)`
+    with the Ruffini's rule, returning the
+    quotient and the remainder
+
+    >>> synthetic_division([-2, -3, 2, 3], 1)
+    ([2, 5, 3], 0)
+    >>> synthetic_division([1, 0, 1], 1)
+    ([1, 1], 2)
+
+    :type coefficients: list
+    :type root: int, float, Fraction, ModularInteger
+    :rtype: tuple
+    """
+
+    if not coefficients:
+        return [], 0
+
+    quotient = [0] * (len(coefficients) - 1)
+    carry = 0
+
+    for i in range(len(coefficients) - 1, 0, -1):
+        carry = carry * root + coefficients[i]
+        quotient[i - 1] = carry
+
+    return quotient, carry * root + coefficients[0]
+
+def reduce_modulo(coefficients, modulus):
+    """
+    Reduces the (integer) coefficients of a dense
+    polynomial modulo an integer, between 0 and `modulus - 1`
+
+    >>> reduce_modulo([-1, 7, 10], 7)
+    [6, 0, 3]
+    >>> reduce_modulo([1, 14], 7)
+    [1]
+
+    :type coefficients: list
+    :type modulus: int
+    :rtype: list
+    """
+
+    return strip([c % modulus for c in coefficients])
+
+def multiply_modulo(a, b, modulus):
+    """
+    Multiplies two dense polynomials whose coefficients
+    are modulo an integer (between 0 and `modulus - 1`)
+
+    >>> multiply_modulo([1, 1], [6, 1], 7)
+    [6, 0, 1]
+
+    The coefficients are packed into two big integers,
+    which are multiplied by Python (Kronecker substitution).
+
+    :type a: list
+    :type b: list
+    :type modulus: int
+    :rtype: list
+    """
+
+    if not a or not b:
+        return []
+
+    # every coefficient of the product fits in `bits` bits
+    bits = 2 * (modulus - 1).bit_length() + min(len(a), len(b)).bit_length()
+
+    product = _pack(a, bits) * _pack(b, bits)
+    mask = (1 << bits) - 1
+    result = []
+
+    for _ in range(len(a) + len(b) - 1):
+        result.append((product & mask) % modulus)
+        product >>= bits
+
+    return strip(result)
+
+def divide_modulo(a, b, modulus):
+    """
+    Divides two dense polynomials whose coefficients are
+    modulo an integer, returning the quotient and the remainder
+
+    >>> divide_modulo([6, 0, 1], [1, 1], 7)
+    ([6, 1], [])
+    >>> divide_modulo([1, 0, 1], [0, 2], 7)
+    ([0, 4], [1])
+
+    The leading coefficient of `b` must be invertible, so
+    `modulus` can be any integer only if `b` is monic.
+    It raises a ZeroDivisionError if `b` is null.
+
+    :type a: list
+    :type b: list
+    :type modulus: int
+    :rtype: tuple
+    :raise: ZeroDivisionError
+    """
+
+    b = reduce_modulo(b, modulus)
+    if not b:
+        raise ZeroDivisionError("polynomial division by zero")
+
+    remainder = list(a)
+    quotient = [0] * max(len(a) - len(b) + 1, 0)
+    factor = inverse(b[-1], modulus)
+
+    # the remainder is reduced only when its
+    # leading coefficient is needed
+    for i in range(len(quotient) - 1, -1, -1):
+        coefficient = remainder[i + len(b) - 1] * factor % modulus
+        if not coefficient:
+            continue
+
+        quotient[i] = coefficient
+        for j, c in enumerate(b):
+            remainder[i + j] -= coefficient * c
+
+    return strip(quotient), reduce_modulo(remainder[:len(b) - 1], modulus)
+
+def gcd_modulo(a, b, prime):
+    """
+    Returns the monic greatest common divisor of two dense
+    polynomials whose coefficients are modulo a prime,
+    with the euclidean algorithm
+
+    >>> gcd_modulo([6, 0, 1], [1, 2, 1], 7)
+    [1, 1]
+    >>> gcd_modulo([1, 1], [2], 7)
+    [1]
+
+    The gcd of two null polynomials is null.
+
+    :type a: list
+    :type b: list
+    :type prime: int
+    :rtype: list
+    """
+
+    a = reduce_modulo(a, prime)
+    b = reduce_modulo(b, prime)
+
+    while b:
+        a, b = b, divide_modulo(a, b, prime)[1]
+
+    if not a:
+        return []
+
+    factor = inverse(a[-1], prime)
+    return [c * factor % prime for c in a]
+
+def extended_gcd_modulo(a, b, prime):
+    """
+    Returns the monic greatest common divisor `g` of
+    two dense polynomials whose coefficients are modulo
+    a prime, and two polynomials `s` and `t` such that
+    `s*a + t*b = g`
+
+    >>> extended_gcd_modulo([1, 1], [6, 1], 7)
+    ([1], [4], [3])
+
+    :type a: list
+    :type b: list
+    :type prime: int
+    :rtype: tuple
+    """
+
+    r0, r1 = reduce_modulo(a, prime), reduce_modulo(b, prime)
+    s0, s1 = [1], []
+    t0, t1 = [], [1]
+
+    while r1:
+        quotient, remainder = divide_modulo(r0, r1, prime)
+        r0, r1 = r1, remainder
+        s0, s1 = s1, reduce_modulo(subtract(s0, multiply_modulo(quotient, s1, prime)), prime)
+        t0, t1 = t1, reduce_modulo(subtract(t0, multiply_modulo(quotient, t1, prime)), prime)
+
+    if not r0:
+        return [], s0, t0
+
+    factor = inverse(r0[-1], prime)
+    return tuple([c * factor % prime for c in p] for p in (r0, s0, t0))
+
+def power_modulo(coefficients, exp, divisor, prime):
+    """
+    Returns the remainder of the division of a dense
+    polynomial raised to a power by another one
+    (whose coefficients are modulo a prime),
+    with the repeated squaring
+
+    >>> power_modulo([0, 1], 7, [1, 0, 1], 7)
+    [0, 6]
+
+    :type coefficients: list
+    :type exp: int
+    :type divisor: list
+    :type prime: int
+    :rtype: list
+    """
+
+    base = divide_modulo(coefficients, divisor, prime)[1]
+    result = divide_modulo([1], divisor, prime)[1]
+
+    while exp:
+        if exp & 1:
+            result = divide_modulo(multiply_modulo(result, base, prime), divisor, prime)[1]
+
+        exp >>= 1
+        if exp:
+            base = divide_modulo(multiply_modulo(base, base, prime), divisor, prime)[1]
+
+    return result
+
+def evaluate_modulo(coefficients, value, prime):
+    """
+    Evaluates a dense polynomial whose coefficients
+    are modulo a prime with the Horner's method
+
+    >>> evaluate_modulo([1, 0, 3], 2, 7)
+    6
+
+    :type coefficients: list
+    :type value: int
+    :type prime: int
+    :rtype: int
+    """
+
+    result = 0
+
+    for coefficient in reversed(coefficients):
+        result = (result * value + coefficient) % prime
+
+    return result
+
+def kronecker_bases(a, b, variables):
+    """
+    Returns, for every variable, the highest exponent it
+    can have in the product of the terms `a` and `b`,
+    plus one: they're the bases used by :func:`kronecker_product`
+
+    >>> from ruffini import Variable
+    >>> x = Variable('x')
+    >>> y = Variable('y')
+    >>> kronecker_bases([x**2, y], [x, y**3], ('x', 'y'))
+    [4, 5]
+
+    :type a: list
+    :type b: list
+    :type variables: tuple
+    :rtype: list
+    """
+
+    return [max(term.variables[variable] for term in a) + max(term.variables[variable] for term in b) + 1
+            for variable in variables]
+
+def kronecker_product(a, b, variables, bases=None):
+    """
+    Multiplies two lists of terms with the Kronecker
+    substitution: every term with exponents `(e1, e2, ...)`
+    becomes a term of degree `e1 * b2 * b3 * ... + e2 * b3 * ... + ...`
+    of a dense polynomial, where `b1, b2, ...` are the
+    bases (see :func:`kronecker_bases`); the dense
+    polynomials are multiplied with :func:`multiply`,
+    then the exponents are unpacked.
+
+    The terms of the product are returned as a dictionary
+    indexed by their variables, sorted from the greatest
+    to the lowest in the lexicographic order
+
+    >>> from ruffini import Variable
+    >>> x = Variable('x')
+    >>> y = Variable('y')
+    >>> list(kronecker_product([x, y], [x, -y], ('x', 'y')).values())
+    [x**2, -y**2]
+
+    `variables` must be sorted and contain
+    every variable of the terms.
+
+    :type a: list
+    :type b: list
+    :type variables: tuple
+    :type bases: list
+    :rtype: dict
+    """
+
+    if not a or not b:
+        return {}
+
+    if bases is None:
+        bases = kronecker_bases(a, b, variables)
+
+    # the first variable has the greatest weight
+    weights = [1] * len(bases)
+    for i in range(len(bases) - 2, -1, -1):
+        weights[i] = weights[i + 1] * bases[i + 1]
+
+    def substitute(terms):
+        degrees = [sum(term.variables[variable] * weight for variable, weight in zip(variables, weights))
+                   for term in terms]
+
+        coefficients = [0] * (max(degrees) + 1)
+        for degree, term in zip(degrees, terms):
+            coefficients[degree] = term.coefficient
+
+        return coefficients
+
+    product = multiply(substitute(a), substitute(b))
+
+    # unpack the exponents, from the highest degree
+    terms = {}
+
+    for degree in range(len(product) - 1, -1, -1):
+        coefficient = product[degree]
+        if not coefficient:
+            continue
+
+        items = []
+        for variable, weight in zip(variables, weights):
+            exponent, degree = divmod(degree, weight)
+            if exponent:
+                items.append((variable, exponent))
+
+        term_variables = VariablesDict._from_trusted(tuple(items))
+        terms[term_variables] = Monomial._from_trusted(coefficient, term_variables)
+
+    return terms
+
+
+### Utility Functions ###
+
+def _add_at(result, values, offset):
+    """
+    Adds `values` to `result` (in place), starting from `offset`
+    """
+
+    end = offset + len(values)
+    result[offset:end] = [x + y for x, y in zip(result[offset:end], values)]
+
+def _pack(coefficients, bits):
+    """
+    Packs non-negative coefficients into an integer,
+    giving `bits` bits to each one
+    """
+
+    packed = 0
+    for coefficient in reversed(coefficients):
+        packed = (packed << bits) | coefficient
+
+    return packed
+
+def _schoolbook(a, b):
+    """
+    Schoolbook product, without removing the null coefficients
+    """
+
+    result = [0] * (len(a) + len(b) - 1)
+
+    for i, x in enumerate(a):
+        if x:
+            _add_at(result, [x * y for y in b], i)
+
+    return result
+
+def _karatsuba(a, b):
+    """
+    Karatsuba's product, without removing the null coefficients
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
+
+    if len(b) < KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+
+    half = (len(a) + 1) // 2
+    result = [0] * (len(a) + len(b) - 1)
+
+    # if b is much shorter, split only a
+    if len(b) <= half:
+        _add_at(result, _karatsuba(a[:half], b), 0)
+        _add_at(result, _karatsuba(a[half:], b), half)
+        return result
+
+    a0, a1 = a[:half], a[half:]
+    b0, b1 = b[:half], b[half:]
+
+    low = _karatsuba(a0, b0)
+    high = _karatsuba(a1, b1)
+    middle = _karatsuba([x + y for x, y in zip(a0, a1)] + a0[len(a1):],
+                        [x + y for x, y in zip(b0, b1)] + b0[len(b1):])
+
+    _add_at(middle, [-c for c in low], 0)
+    _add_at(middle, [-c for c in high], 0)
+
+    _add_at(result, low, 0)
+    _add_at(result, middle, half)
+    _add_at(result, high, 2 * half)
+
+    return result
+
+def _ntt_prime(index):
+    """
+    Returns the index-th prime (from the greatest) lower than
+    2**31 such that 2**NTT_ORDER divides p - 1, together with a
+    root of unity of order 2**NTT_ORDER; if there aren't
+    enough primes, it returns None
+    """
+
+    multiplier = NTT_PRIMES[-1][0] >> NTT_ORDER if NTT_PRIMES else 2**(31 - NTT_ORDER)
+
+    while len(NTT_PRIMES) <= index:
+        multiplier -= 1
+        if not multiplier:
+            return None
+
+        prime = (multiplier << NTT_ORDER) + 1
+        if not is_prime(prime):
+            continue
+
+        # a quadratic non-residue generates the 2-part
+        # of the multiplicative group
+        generator = 2
+        while pow(generator, (prime - 1) // 2, prime) != prime - 1:
+            generator += 1
+
+        NTT_PRIMES.append((prime, pow(generator, multiplier, prime)))
+
+    return NTT_PRIMES[index]
+
+def _transform(values, root, prime):
+    """
+    Number-theoretic transform (in place) of `values`, whose
+    length is the order of `root`; the result is in
+    bit-reversed order (decimation in frequency)
+    """
+
+    size = len(values)
+    length = size
+
+    while length > 1:
+        half = length // 2
+        step = pow(root, size // length, prime)
+        twiddles = [1] * half
+        for k in range(1, half):
+            twiddles[k] = twiddles[k - 1] * step % prime
+
+        if half >= size // length:
+            for start in range(0, size, length):
+                low = values[start:start + half]
+                high = values[start + half:start + length]
+                values[start:start + half] = [(u + v) % prime for u, v in zip(low, high)]
+                values[start + half:start + length] = [(u - v) * w % prime for u, v, w in zip(low, high, twiddles)]
+        else:
+            for k, w in enumerate(twiddles):
+                low = values[k::length]
+                high = values[k + half::length]
+                values[k::length] = [(u + v) % prime for u, v in zip(low, high)]
+                values[k + half::length] = [(u - v) * w % prime for u, v in zip(low, high)]
+
+        length = half
+
+def _inverse_transform(values, root, prime):
+    """
+    Inverse of :func:`_transform`, given the inverse of its
+    root: it takes the values in bit-reversed order and
+    returns them in natural order (decimation in time)
+    """
+
+    size = len(values)
+    length = 2
+
+    while length <= size:
+        half = length // 2
+        step = pow(root, size // length, prime)
+        twiddles = [1] * half
+        for k in range(1, half):
+            twiddles[k] = twiddles[k - 1] * step % prime
+
+        if half >= size // length:
+            for start in range(0, size, length):
+                low = values[start:start + half]
+                high = [v * w % prime for v, w in zip(values[start + half:start + length], twiddles)]
+                values[start:start + half] = [(u + v) % prime for u, v in zip(low, high)]
+                values[start + half:start + length] = [(u - v) % prime for u, v in zip(low, high)]
+        else:
+            for k, w in enumerate(twiddles):
+                low = values[k::length]
+                high = [v * w % prime for v in values[k + half::length]]
+                values[k::length] = [(u + v) % prime for u, v in zip(low, high)]
+                values[k + half::length] = [(u - v) % prime for u, v in zip(low, high)]
+
+        length *= 2
+
+    factor = inverse(size, prime)
+    values[:] = [v * factor % prime for v in values]
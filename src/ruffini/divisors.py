@@ -0,0 +1,531 @@
+"""
+Greatest common divisors of polynomials.
+
+The gcd of two polynomials with integer coefficients is
+computed with a modular algorithm: the polynomials are
+reduced modulo some primes, their gcd is computed in every
+finite field and the results are combined with the chinese
+remainder theorem, until they divide both the polynomials.
+The coefficients of the intermediate results never grow,
+unlike those of the euclidean algorithm.
+
+In a finite field, the variables but the first are removed
+one at a time by evaluating the polynomials in some points,
+then the gcd is rebuilt by interpolation (Brown's algorithm).
+
+The polynomials are given as dictionaries, which map the
+tuples of exponents of the variables to the coefficients:
+`3x**2y + 1`, for example, is `{(2, 1): 3, (0, 0): 1}`.
+The leading term is the one with the greatest tuple of
+exponents (the lexicographic order).
+
+The subresultant polynomial remainder sequence works with
+the coefficients of any integral domain, so it's used when
+the modular algorithm can't be.
+"""
+
+from fractions import Fraction
+from functools import reduce
+from math import gcd as integer_gcd
+
+from .rings import NUMBERS, is_prime, inverse
+from .monomials import divide_coefficients
+from . import dense
+
+
+# The modular gcd is computed modulo the
+# primes lower than 2**MODULAR_BITS
+MODULAR_BITS = 31
+
+
+def modular_gcd(f, g):
+    """
+    Returns the greatest common divisor of two polynomials
+    with integer coefficients, whose leading coefficient
+    is positive
+
+    >>> modular_gcd({(2,): 1, (0,): -1}, {(2,): 1, (1,): 2, (0,): 1})
+    {(1,): 1, (0,): 1}
+    >>> modular_gcd({(2, 1): 6, (1, 1): 6}, {(1, 2): -4, (1, 1): 4})
+    {(1, 1): 2}
+
+    The polynomials can't be null.
+
+    :type f: dict
+    :type g: dict
+    :rtype: dict
+    """
+
+    # split the contents
+    content_f = reduce(integer_gcd, f.values())
+    content_g = reduce(integer_gcd, g.values())
+    content = integer_gcd(content_f, content_g)
+
+    f = {e: c // content_f for e, c in f.items()}
+    g = {e: c // content_g for e, c in g.items()}
+
+    # the leading coefficient of the
+    # primitive gcd divides gamma
+    leading_f = f[max(f)]
+    leading_g = g[max(g)]
+    gamma = integer_gcd(leading_f, leading_g)
+
+    best = None
+    modulus = 1
+    result = None
+
+    for prime in _primes():
+        if not leading_f % prime or not leading_g % prime:
+            continue
+
+        image = brown_gcd(_reduce(f, prime), _reduce(g, prime), prime)
+        if image is None:
+            continue
+
+        # the polynomials are coprime
+        leading = max(image)
+        if not any(leading):
+            return {leading: content}
+
+        # for a few (unlucky) primes the gcd of the images has
+        # a greater leading term: those results are discarded
+        if best is None or leading < best:
+            best, modulus, result = leading, 1, None
+        elif leading > best:
+            continue
+
+        image = {e: c * gamma % prime for e, c in image.items()}
+
+        if result is None:
+            combined = {e: _symmetric(c, prime) for e, c in image.items()}
+        else:
+            combined = _chinese_remainder(result, modulus, image, prime)
+
+        modulus *= prime
+
+        # when a new prime doesn't change the
+        # result, check if it's the gcd
+        if combined == result:
+            candidate = _primitive(combined)
+            if _divides(candidate, f) and _divides(candidate, g):
+                return {e: c * content for e, c in candidate.items()}
+
+        result = combined
+
+def brown_gcd(f, g, prime):
+    """
+    Returns the monic greatest common divisor of two
+    polynomials whose coefficients are integers modulo
+    a prime (between 0 and `prime - 1`)
+
+    >>> brown_gcd({(2,): 1, (0,): 6}, {(2,): 1, (1,): 2, (0,): 1}, 7)
+    {(1,): 1, (0,): 1}
+    >>> brown_gcd({(1, 1): 1, (0, 1): 1}, {(1, 2): 1, (0, 2): 1}, 7)
+    {(1, 1): 1, (0, 1): 1}
+
+    The last variable is evaluated in some points of
+    the field and the gcds of the images are interpolated,
+    so it returns None if the field is too small.
+
+    :type f: dict
+    :type g: dict
+    :type prime: int
+    :rtype: dict, None
+    """
+
+    if len(next(iter(f))) == 1:
+        return _from_dense(dense.gcd_modulo(_to_dense(f), _to_dense(g), prime))
+
+    # f and g are seen as polynomials in the
+    # other variables, whose coefficients are
+    # polynomials in the last one
+    f = _split(f)
+    g = _split(g)
+
+    content_f = reduce(lambda a, b: dense.gcd_modulo(a, b, prime), f.values())
+    content_g = reduce(lambda a, b: dense.gcd_modulo(a, b, prime), g.values())
+    content = dense.gcd_modulo(content_f, content_g, prime)
+
+    f = {e: dense.divide_modulo(c, content_f, prime)[0] for e, c in f.items()}
+    g = {e: dense.divide_modulo(c, content_g, prime)[0] for e, c in g.items()}
+
+    # the images are multiplied by delta, so that
+    # they all have the same leading coefficient
+    leading_f = f[max(f)]
+    leading_g = g[max(g)]
+    delta = dense.gcd_modulo(leading_f, leading_g, prime)
+
+    # the degree of the result in the last variable
+    degree = min(max(map(len, f.values())), max(map(len, g.values()))) + len(delta) - 2
+
+    best = None
+    points = []
+    images = []
+
+    for point in range(prime):
+        scale = dense.evaluate_modulo(delta, point, prime)
+        if not scale or not dense.evaluate_modulo(leading_f, point, prime) or not dense.evaluate_modulo(leading_g, point, prime):
+            continue
+
+        image = brown_gcd(_evaluate(f, point, prime), _evaluate(g, point, prime), prime)
+        if image is None:
+            continue
+
+        # the primitive parts are coprime
+        leading = max(image)
+        if not any(leading):
+            return _monic(_join({leading: content}), prime)
+
+        # discard the unlucky points
+        if best is None or leading < best:
+            best, points, images = leading, [], []
+        elif leading > best:
+            continue
+
+        points.append(point)
+        images.append({e: c * scale % prime for e, c in image.items()})
+
+        if len(points) > degree:
+            result = _interpolate(points, images, prime)
+
+            # remove the content added by delta
+            extra = reduce(lambda a, b: dense.gcd_modulo(a, b, prime), result.values())
+            result = {e: dense.divide_modulo(c, extra, prime)[0] for e, c in result.items()}
+
+            # if all the points were unlucky, the
+            # result doesn't divide the polynomials
+            candidate = _join(result)
+            if _divides(candidate, _join(f), prime) and _divides(candidate, _join(g), prime):
+                result = {e: dense.multiply_modulo(c, content, prime) for e, c in result.items()}
+                return _monic(_join(result), prime)
+
+    return None
+
+def subresultant_gcd(a, b, gcd):
+    """
+    Returns the greatest common divisor of two dense
+    polynomials (see :mod:`ruffini.dense`), whose
+    coefficients are in an integral domain, with the
+    subresultant polynomial remainder sequence
+
+    >>> from math import gcd
+    >>> subresultant_gcd([4, 6, 2], [6, 12, 6], gcd)
+    [2, 2]
+
+    `gcd` computes the gcd of two coefficients: in a field,
+    it can always return 1. The quotients of coefficients are
+    always exact, so the coefficients can also be polynomials
+    with other variables.
+
+    The result is defined up to the multiplication
+    by an invertible element of the domain.
+
+    :type a: list
+    :type b: list
+    :type gcd: function
+    :rtype: list
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
+
+    if not b:
+        return list(a)
+
+    content_a = reduce(gcd, a)
+    content_b = reduce(gcd, b)
+    content = gcd(content_a, content_b)
+
+    a = [_exact_quotient(c, content_a) for c in a]
+    b = [_exact_quotient(c, content_b) for c in b]
+
+    g = h = 1
+
+    while True:
+        delta = len(a) - len(b)
+        remainder = _pseudo_remainder(a, b)
+
+        if not remainder:
+            break
+
+        # b divides only constants
+        if len(remainder) == 1:
+            return [content]
+
+        a, b = b, [_exact_quotient(c, g * h**delta) for c in remainder]
+        g = a[-1]
+        h = _exact_quotient(g**delta, h**(delta - 1)) if delta else h
+
+    content_b = reduce(gcd, b)
+    return [_exact_quotient(c, content_b) * content for c in b]
+
+def integral(f):
+    """
+    Multiplies a polynomial with rational coefficients by
+    a constant, so that its coefficients are coprime integers
+    and its leading coefficient is positive
+
+    >>> integral({(1,): Fraction(-1, 2), (0,): Fraction(1, 3)})
+    {(1,): 3, (0,): -2}
+    >>> integral({(2,): 4, (0,): 6})
+    {(2,): 2, (0,): 3}
+
+    :type f: dict
+    :rtype: dict
+    """
+
+    denominator = 1
+    for coefficient in f.values():
+        if isinstance(coefficient, Fraction):
+            denominator *= coefficient.denominator // integer_gcd(denominator, coefficient.denominator)
+
+    return _primitive({e: int(c * denominator) for e, c in f.items()})
+
+### Utility Functions ###
+
+def _primes():
+    """
+    Yields the primes lower than 2**MODULAR_BITS,
+    starting from the greatest one
+    """
+
+    n = 2**MODULAR_BITS - 1
+    while n > 2:
+        if is_prime(n):
+            yield n
+        n -= 2
+
+def _reduce(f, prime):
+    """
+    Reduces the coefficients of a polynomial modulo a prime
+    """
+
+    reduced = {}
+    for exponents, coefficient in f.items():
+        coefficient %= prime
+        if coefficient:
+            reduced[exponents] = coefficient
+
+    return reduced
+
+def _symmetric(coefficient, modulus):
+    """
+    Returns the representative of a coefficient
+    modulo `modulus` which is nearest to zero
+    """
+
+    coefficient %= modulus
+    return coefficient - modulus if coefficient > modulus // 2 else coefficient
+
+def _chinese_remainder(result, modulus, image, prime):
+    """
+    Combines the coefficients of a polynomial modulo
+    `modulus` with the ones of its image modulo `prime`
+    """
+
+    factor = inverse(modulus, prime)
+    combined = {}
+
+    for exponents in set(result).union(image):
+        coefficient = result.get(exponents, 0)
+        coefficient += modulus * ((image.get(exponents, 0) - coefficient) * factor % prime)
+        coefficient = _symmetric(coefficient, modulus * prime)
+
+        if coefficient:
+            combined[exponents] = coefficient
+
+    return combined
+
+def _primitive(f):
+    """
+    Returns the primitive part of a polynomial with integer
+    coefficients, with a positive leading coefficient,
+    sorting the terms from the greatest one
+    """
+
+    content = reduce(integer_gcd, f.values())
+    if f[max(f)] < 0:
+        content = -content
+
+    return {e: f[e] // content for e in sorted(f, reverse=True)}
+
+def _divides(divisor, dividend, prime=None):
+    """
+    Checks if a polynomial with integer coefficients
+    (or modulo a prime) divides another one
+    """
+
+    remainder = dict(dividend)
+    leading = max(divisor)
+    leading_coefficient = divisor[leading]
+
+    if prime is not None:
+        factor = inverse(leading_coefficient, prime)
+
+    while remainder:
+        exponents = max(remainder)
+        shift = tuple(a - b for a, b in zip(exponents, leading))
+
+        if prime is None:
+            quotient, rest = divmod(remainder[exponents], leading_coefficient)
+        else:
+            quotient, rest = remainder[exponents] * factor % prime, 0
+
+        if rest or min(shift) < 0:
+            return False
+
+        for term, coefficient in divisor.items():
+            term = tuple(a + b for a, b in zip(term, shift))
+            coefficient = remainder.get(term, 0) - quotient * coefficient
+
+            if prime is not None:
+                coefficient %= prime
+
+            if coefficient:
+                remainder[term] = coefficient
+            else:
+                del remainder[term]
+
+    return True
+
+def _to_dense(f):
+    """
+    Converts a polynomial with a variable into a dense list
+    """
+
+    coefficients = [0] * (max(f)[0] + 1)
+    for (exponent, ), coefficient in f.items():
+        coefficients[exponent] = coefficient
+
+    return coefficients
+
+def _from_dense(coefficients):
+    """
+    Converts a dense list into a polynomial with
+    a variable, sorting the terms from the greatest one
+    """
+
+    return {(i, ): coefficients[i] for i in range(len(coefficients) - 1, -1, -1) if coefficients[i]}
+
+def _split(f):
+    """
+    Groups the terms of a polynomial by the exponents
+    of the variables but the last one: the coefficients
+    become dense polynomials in the last variable
+    """
+
+    groups = {}
+    for exponents, coefficient in f.items():
+        coefficients = groups.setdefault(exponents[:-1], [])
+        if len(coefficients) <= exponents[-1]:
+            coefficients.extend([0] * (exponents[-1] + 1 - len(coefficients)))
+        coefficients[exponents[-1]] = coefficient
+
+    return groups
+
+def _join(groups):
+    """
+    Reverses :func:`_split`
+    """
+
+    return {exponents + (i, ): c for exponents, coefficients in groups.items()
+            for i, c in enumerate(coefficients) if c}
+
+def _evaluate(groups, point, prime):
+    """
+    Evaluates the last variable of a polynomial
+    (split by :func:`_split`) in a point
+    """
+
+    image = {}
+    for exponents, coefficients in groups.items():
+        value = dense.evaluate_modulo(coefficients, point, prime)
+        if value:
+            image[exponents] = value
+
+    return image
+
+def _interpolate(points, images, prime):
+    """
+    Finds the coefficients (dense polynomials in the last
+    variable) of a polynomial, given its images in some
+    points, with the Newton's interpolation
+    """
+
+    n = len(points)
+
+    # the inverses of the differences between
+    # the points are the same for every term
+    inverses = [[inverse(points[i] - points[i - j], prime) for i in range(j, n)] for j in range(1, n)]
+
+    groups = {}
+    for exponents in set().union(*images):
+        values = [image.get(exponents, 0) for image in images]
+
+        # divided differences
+        for j in range(1, n):
+            for i in range(n - 1, j - 1, -1):
+                values[i] = (values[i] - values[i - 1]) * inverses[j - 1][i - j] % prime
+
+        # expand the Newton's form
+        coefficients = [values[-1]]
+        for i in range(n - 2, -1, -1):
+            shifted = [0] + coefficients
+            for k, c in enumerate(coefficients):
+                shifted[k] = (shifted[k] - points[i] * c) % prime
+            shifted[0] = (shifted[0] + values[i]) % prime
+            coefficients = shifted
+
+        coefficients = dense.strip(coefficients)
+        if coefficients:
+            groups[exponents] = coefficients
+
+    return groups
+
+def _monic(f, prime):
+    """
+    Divides a polynomial whose coefficients are modulo
+    a prime by its leading coefficient, sorting the
+    terms from the greatest one
+    """
+
+    factor = inverse(f[max(f)], prime)
+    return {e: f[e] * factor % prime for e in sorted(f, reverse=True)}
+
+def _pseudo_remainder(a, b):
+    """
+    Returns the remainder of the division of
+    `lc(b)**(deg(a) - deg(b) + 1) * a` by `b`,
+    which doesn't need any division
+    """
+
+    remainder = list(a)
+    leading = b[-1]
+    steps = len(a) - len(b) + 1
+
+    while remainder and len(remainder) >= len(b):
+        coefficient = remainder[-1]
+        shift = len(remainder) - len(b)
+
+        remainder = [c * leading for c in remainder]
+        for i, c in enumerate(b):
+            remainder[shift + i] -= coefficient * c
+
+        remainder = dense.strip(remainder)
+        steps -= 1
+
+    if steps:
+        remainder = [c * leading**steps for c in remainder]
+
+    return remainder
+
+def _exact_quotient(a, b):
+    """
+    Divides two coefficients, knowing that
+    `b` divides `a`
+    """
+
+    if isinstance(a, NUMBERS) and isinstance(b, NUMBERS):
+        return divide_coefficients(a, b)
+
+    return a // b
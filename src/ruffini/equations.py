@@ -1,7 +1,7 @@
 from math import sqrt, gcd as math_gcd
 from fractions import Fraction
 
-from .monomials import Monomial
+from .monomials import Monomial, divide_coefficients
 from .polynomials import Polynomial
 
 
@@ -66,10 +66,10 @@ class Equation:
         self.degree = self.first.degree
 
         # Check if there is more than a variable
-        if not len(self.first.variables) == 1:
+        if len(self.first.variables) > 1:
             raise NotImplementedError("Too many variables")
 
-        self.variable = self.first.variables[0]
+        self.variable = self.first.variables[0] if self.first.variables else None
 
     def __str__(self):
         """
@@ -103,6 +103,15 @@ class Equation:
 
         >>> Equation(Monomial(x=2), 4).solve()
         (Fraction(2, 1), Fraction(-2, 1))
+        >>> Equation(Monomial(2, x=1), 3).solve()
+        Fraction(3, 2)
+
+        The solution of an equation of degree 1 is in
+        the same ring of the coefficients
+
+        >>> from ruffini import RR
+        >>> Equation(Monomial(0.5, x=1, ring=RR), 1).solve()
+        2.0
 
         It works only with equations of degree 1 or 2;
         if it's higher, it raises a NotImplementedError.
@@ -123,18 +132,16 @@ class Equation:
         :raise: ValueError, NotImplementedError
         """
 
-        if self.degree == 1:
-            a = self.first.term_coefficient({self.variable: 1})
-            if a == 0:
-                raise ValueError("Equation impossible or indeterminate")
+        if self.degree == 0:
+            raise ValueError("Equation impossible or indeterminate")
 
-            return Fraction(self.second, a)
+        elif self.degree == 1:
+            b, a = self.first.coefficients()
+            return divide_coefficients(-b, a)
 
         elif self.degree == 2:
             # Fetch a, b, c
-            a = self.first.term_coefficient({self.variable: 2})
-            b = self.first.term_coefficient({self.variable: 1})
-            c = self.first.term_coefficient()
+            c, b, a = self.first.coefficients()
 
             # Calculate delta
             delta = b**2 - 4*a*c
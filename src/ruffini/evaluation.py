@@ -0,0 +1,127 @@
+"""
+Fast evaluation of polynomials.
+
+A polynomial is rewritten with the (multivariate) Horner's
+scheme: the terms are grouped by the exponent of the first
+variable, then the groups by the exponent of the second one
+and so on, so that `3x**2y + 2xy + x + 5` becomes
+`((3y) * x + (2y + 1)) * x + 5`.
+
+The scheme is then translated into a Python function, so
+evaluating it doesn't create any intermediate object.
+"""
+
+from .monomials import reduce_coefficient
+
+
+def horner_scheme(terms, variables):
+    """
+    Returns the Horner's scheme of a polynomial, given its
+    terms as pairs (exponents, coefficient), where the
+    exponents follow the order of `variables`.
+
+    Every level of the scheme is a list of pairs
+    (exponent, sub-scheme) for a variable, sorted from
+    the highest exponent; the last level contains
+    only the coefficients.
+
+    >>> horner_scheme([((2, 1), 3), ((1, 1), 2), ((1, 0), 1), ((0, 0), 5)], ('x', 'y'))
+    [(2, [(1, 3)]), (1, [(1, 2), (0, 1)]), (0, [(0, 5)])]
+
+    :type terms: list
+    :type variables: tuple
+    :rtype: list, int, float, Fraction, ModularInteger
+    """
+
+    # the coefficient, when there are no variables left
+    if not variables:
+        return terms[0][1] if terms else 0
+
+    groups = {}
+    for exponents, coefficient in terms:
+        groups.setdefault(exponents[0], []).append((exponents[1:], coefficient))
+
+    return [(exponent, horner_scheme(groups[exponent], variables[1:]))
+            for exponent in sorted(groups, reverse=True)]
+
+def compile_scheme(scheme, variables, fallback=None):
+    """
+    Translates a Horner's scheme (see :func:`horner_scheme`)
+    into a Python function, whose arguments are
+    the variables in the given order
+
+    >>> f = compile_scheme(horner_scheme([((2,), 3), ((0,), -1)], ('x',)), ('x',))
+    >>> f(2), f(x=3)
+    (11, 26)
+
+    The function works with any value that can be summed and
+    multiplied (numbers, monomials, polynomials, arrays and so on);
+    whole fractions are returned as integers.
+
+    If `fallback` is given, the arguments become optional:
+    when some of them are missing, the function returns
+    `fallback(values)`, where `values` is a dictionary
+    of the given ones.
+
+    :type scheme: list
+    :type variables: tuple
+    :type fallback: function
+    :rtype: function
+    """
+
+    lines = []
+    constants = {"reduce": reduce_coefficient}
+
+    def constant(coefficient):
+        # integers are written directly in the code
+        if coefficient.__class__ is int:
+            return repr(coefficient)
+
+        name = f"c{len(constants)}"
+        constants[name] = coefficient
+        return name
+
+    def power(variable, exponent):
+        return variable if exponent == 1 else f"{variable} ** {exponent}"
+
+    def generate(scheme, depth):
+        # returns the expression of a (sub-)scheme,
+        # writing the needed lines before
+        if depth == len(variables):
+            return constant(scheme)
+
+        variable = variables[depth]
+        result = f"r{depth}_{len(lines)}"
+
+        exponent, sub_scheme = scheme[0]
+        lines.append(f"{result} = {generate(sub_scheme, depth + 1)}")
+
+        for next_exponent, sub_scheme in scheme[1:]:
+            expression = generate(sub_scheme, depth + 1)
+            lines.append(f"{result} = {result} * {power(variable, exponent - next_exponent)} + {expression}")
+            exponent = next_exponent
+
+        if exponent:
+            lines.append(f"{result} = {result} * {power(variable, exponent)}")
+
+        return result
+
+    result = generate(scheme, 0) if scheme else "0"
+
+    # the source code of the function
+    if fallback is None:
+        source = [f"def evaluate({', '.join(variables)}):"]
+    else:
+        constants["fallback"] = fallback
+        source = [f"def evaluate({', '.join(v + '=None' for v in variables)}):"]
+
+        if variables:
+            values = ", ".join(f"'{v}': {v}" for v in variables)
+            source.append(f"    if {' or '.join(v + ' is None' for v in variables)}:")
+            source.append(f"        return fallback({{k: v for k, v in {{{values}}}.items() if v is not None}})")
+
+    source.extend(f"    {line}" for line in lines)
+    source.append(f"    return reduce({result})")
+
+    exec("\n".join(source), constants)
+    return constants["evaluate"]
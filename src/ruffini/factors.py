@@ -0,0 +1,400 @@
+"""
+Factorization of univariate polynomials with integer coefficients.
+
+A square-free polynomial is first factorized modulo a small
+prime with the Cantor-Zassenhaus algorithm: the distinct-degree
+factorization groups the irreducible factors by their degree,
+then the groups are split by the equal-degree factorization.
+
+The factors are lifted modulo a power of the prime with
+the Hensel's lemma, until the power is greater than twice a
+bound on the coefficients of the factors over the integers;
+then the lifted factors are multiplied together in every
+possible way, looking for the true ones (Zassenhaus' algorithm).
+
+The number of combinations grows exponentially with the number
+of modular factors, so a few primes are tried and the one which
+gives the fewest factors is used; moreover, only combinations
+whose degree is compatible with the factorizations modulo all
+the tried primes are tested.
+
+The polynomials are dense lists of coefficients
+(see :mod:`ruffini.dense`).
+"""
+
+from functools import reduce
+from itertools import combinations
+from random import randrange
+
+from .rings import is_prime, inverse
+from .divisors import _symmetric, _primitive as _primitive_terms
+from . import dense
+
+
+# The number of primes whose factorizations are
+# compared, to choose the best one and to find
+# the possible degrees of the factors
+PRIMES_TRIED = 5
+
+
+def zassenhaus(coefficients):
+    """
+    Factorizes a square-free polynomial with integer
+    coefficients into its irreducible factors over the
+    integers, which have positive leading coefficients
+
+    >>> zassenhaus([-1, 0, 0, 0, 1])
+    [[-1, 1], [1, 1], [1, 0, 1]]
+    >>> zassenhaus([1, 1, 1, 2, 0, 1])
+    [[1, 0, 1], [1, 1, 0, 1]]
+
+    The polynomial must be primitive and its
+    leading coefficient must be positive.
+
+    :type coefficients: list
+    :rtype: list
+    """
+
+    degree = len(coefficients) - 1
+    if degree <= 1:
+        return [coefficients]
+
+    # the degrees of the factors are sums of the
+    # degrees of the modular factors (a bit for each
+    # degree), for every prime
+    degrees = None
+    best = None
+
+    for prime, groups in _distinct_degree_factorizations(coefficients):
+        sums = 1
+        for factor, factor_degree in groups:
+            for _ in range((len(factor) - 1) // factor_degree):
+                sums |= sums << factor_degree
+
+        degrees = sums if degrees is None else degrees & sums
+
+        if best is None or _count(groups) < _count(best[1]):
+            best = prime, groups
+
+    # no factor can have a degree between 1 and degree - 1
+    if degrees == 1 | 1 << degree:
+        return [coefficients]
+
+    prime, groups = best
+    factors = [f for factor, factor_degree in groups for f in _equal_degree(factor, factor_degree, prime)]
+
+    # a bound on the coefficients of the factors
+    # (multiplied by the leading coefficient)
+    bound = 2**degree * sum(abs(c) for c in coefficients) * coefficients[-1]
+
+    exponent, modulus = 1, prime
+    while modulus <= 2 * bound:
+        exponent, modulus = exponent + 1, modulus * prime
+
+    lifted = hensel_lift(coefficients, factors, prime, exponent)
+    return sorted(_recombine(coefficients, lifted, modulus, degrees), key=lambda f: (len(f), f))
+
+def factor_modulo(coefficients, prime):
+    """
+    Factorizes a square-free polynomial whose coefficients
+    are modulo an odd prime into its monic irreducible
+    factors, with the Cantor-Zassenhaus algorithm
+
+    >>> factor_modulo([1, 0, 0, 0, 1], 5)
+    [[2, 0, 1], [3, 0, 1]]
+
+    :type coefficients: list
+    :type prime: int
+    :rtype: list
+    """
+
+    coefficients = dense.reduce_modulo(coefficients, prime)
+    factor = inverse(coefficients[-1], prime)
+    monic = [c * factor % prime for c in coefficients]
+
+    factors = [f for group, degree in _distinct_degree(monic, prime) for f in _equal_degree(group, degree, prime)]
+    return sorted(factors, key=lambda f: (len(f), f))
+
+def hensel_lift(coefficients, factors, prime, exponent):
+    """
+    Lifts a factorization modulo a prime to a
+    factorization modulo `prime**exponent`
+
+    `factors` is a list of monic polynomials, coprime modulo
+    `prime`, whose product is the polynomial divided by its
+    leading coefficient; the lifted factors are monic too.
+
+    >>> hensel_lift([-1, 0, 1], [[1, 1], [4, 1]], 5, 2)
+    [[1, 1], [24, 1]]
+
+    :type coefficients: list
+    :type factors: list
+    :type prime: int
+    :type exponent: int
+    :rtype: list
+    """
+
+    modulus = prime**exponent
+
+    if len(factors) == 1:
+        factor = inverse(coefficients[-1], modulus)
+        return [[c * factor % modulus for c in coefficients]]
+
+    # split the factors in two groups, whose
+    # products are lifted with the quadratic
+    # Hensel's step, then lift every group
+    half = len(factors) // 2
+
+    g = reduce(lambda a, b: dense.multiply_modulo(a, b, prime), factors[:half])
+    g = dense.reduce_modulo([c * coefficients[-1] for c in g], prime)
+    h = reduce(lambda a, b: dense.multiply_modulo(a, b, prime), factors[half:])
+    _, s, t = dense.extended_gcd_modulo(g, h, prime)
+
+    current = prime
+    while current < modulus:
+        g, h, s, t = _hensel_step(coefficients, g, h, s, t, current)
+        current *= current
+
+    g = dense.reduce_modulo(g, modulus)
+    h = dense.reduce_modulo(h, modulus)
+
+    return hensel_lift(g, factors[:half], prime, exponent) + hensel_lift(h, factors[half:], prime, exponent)
+
+### Utility Functions ###
+
+def _primes():
+    """
+    Yields the odd primes, starting from the smallest one
+    """
+
+    n = 3
+    while True:
+        if is_prime(n):
+            yield n
+        n += 2
+
+def _count(groups):
+    """
+    Returns the number of factors in a
+    distinct-degree factorization
+    """
+
+    return sum((len(factor) - 1) // degree for factor, degree in groups)
+
+def _distinct_degree_factorizations(coefficients):
+    """
+    Yields the distinct-degree factorizations of a polynomial
+    modulo the first PRIMES_TRIED primes which don't divide its
+    leading coefficient and modulo which it's square-free
+    """
+
+    tried = 0
+
+    for prime in _primes():
+        if not coefficients[-1] % prime:
+            continue
+
+        factor = inverse(coefficients[-1], prime)
+        monic = [c * factor % prime for c in coefficients]
+        derivative = dense.reduce_modulo([i * c for i, c in enumerate(monic)][1:], prime)
+
+        if len(dense.gcd_modulo(monic, derivative, prime)) != 1:
+            continue
+
+        yield prime, _distinct_degree(monic, prime)
+
+        tried += 1
+        if tried == PRIMES_TRIED:
+            return
+
+def _distinct_degree(f, prime):
+    """
+    Splits a monic square-free polynomial modulo a prime
+    into pairs (product of all the irreducible factors
+    of a degree, degree)
+    """
+
+    degree = len(f) - 1
+    groups = []
+
+    # the Frobenius map (h -> h**prime) is linear, so it's
+    # computed once as the powers x**(prime*i) modulo f
+    frobenius = _frobenius(f, prime)
+    power = [0, 1]
+
+    d = 1
+    while 2 * d <= degree:
+        power = _apply(frobenius, power, prime)
+        group = dense.gcd_modulo(f, dense.reduce_modulo(dense.subtract(power, [0, 1]), prime), prime)
+
+        if len(group) > 1:
+            groups.append((group, d))
+            f = dense.divide_modulo(f, group, prime)[0]
+            degree = len(f) - 1
+            frobenius = _frobenius(f, prime)
+            power = dense.divide_modulo(power, f, prime)[1]
+
+        d += 1
+
+    if degree > 0:
+        groups.append((f, degree))
+
+    return groups
+
+def _frobenius(f, prime):
+    """
+    Returns the powers `x**(prime*i)` modulo a monic
+    polynomial `f`, for i from 0 to `deg(f) - 1`
+    """
+
+    step = dense.power_modulo([0, 1], prime, f, prime)
+    powers = [dense.divide_modulo([1], f, prime)[1]]
+
+    for _ in range(len(f) - 2):
+        powers.append(dense.divide_modulo(dense.multiply_modulo(powers[-1], step, prime), f, prime)[1])
+
+    return powers
+
+def _apply(frobenius, h, prime):
+    """
+    Returns `h**prime` modulo f, given
+    the result of :func:`_frobenius`
+    """
+
+    result = []
+    for coefficient, power in zip(h, frobenius):
+        if coefficient:
+            result = dense.add(result, [coefficient * c for c in power])
+
+    return dense.reduce_modulo(result, prime)
+
+def _equal_degree(f, degree, prime):
+    """
+    Splits a monic polynomial modulo a prime, whose
+    irreducible factors have all the same degree,
+    with the Cantor-Zassenhaus' random splitting
+    """
+
+    size = len(f) - 1
+    if size == degree:
+        return [f]
+
+    exp = (prime**degree - 1) // 2
+
+    while True:
+        a = dense.strip([randrange(prime) for _ in range(size)])
+        if len(a) < 2:
+            continue
+
+        b = dense.reduce_modulo(dense.subtract(dense.power_modulo(a, exp, f, prime), [1]), prime)
+        g = dense.gcd_modulo(f, b, prime)
+
+        if 1 < len(g) < len(f):
+            cofactor = dense.divide_modulo(f, g, prime)[0]
+            return _equal_degree(g, degree, prime) + _equal_degree(cofactor, degree, prime)
+
+def _hensel_step(f, g, h, s, t, modulus):
+    """
+    Given `f = gh` and `sg + th = 1` modulo `modulus`,
+    where h is monic, returns g, h, s and t such that the
+    same equations hold modulo `modulus**2`
+    """
+
+    square = modulus * modulus
+
+    def multiply(a, b):
+        return dense.multiply_modulo(a, b, square)
+
+    def subtract(a, b):
+        return dense.reduce_modulo(dense.subtract(a, b), square)
+
+    def add(a, b):
+        return dense.reduce_modulo(dense.add(a, b), square)
+
+    e = subtract(f, multiply(g, h))
+    q, r = dense.divide_modulo(multiply(s, e), h, square)
+    g = add(g, add(multiply(t, e), multiply(q, g)))
+    h = add(h, r)
+
+    b = subtract(add(multiply(s, g), multiply(t, h)), [1])
+    c, d = dense.divide_modulo(multiply(s, b), h, square)
+    s = subtract(s, d)
+    t = subtract(t, add(multiply(t, b), multiply(c, g)))
+
+    return g, h, s, t
+
+def _recombine(f, factors, modulus, degrees):
+    """
+    Finds the factors over the integers, multiplying
+    together the lifted factors; `degrees` has a bit
+    for every possible degree of a factor
+    """
+
+    result = []
+    size = 1
+
+    while 2 * size <= len(factors):
+        for subset in combinations(range(len(factors)), size):
+            if not degrees >> sum(len(factors[i]) - 1 for i in subset) & 1:
+                continue
+
+            # the constant term of the candidate must
+            # divide the one of f (times the leading coefficient)
+            constant = f[-1]
+            for i in subset:
+                constant = constant * factors[i][0] % modulus
+            constant = _symmetric(constant, modulus)
+
+            if f[0] and (not constant or f[-1] * f[0] % constant):
+                continue
+
+            candidate = [f[-1]]
+            for i in subset:
+                candidate = dense.multiply_modulo(candidate, factors[i], modulus)
+            candidate = _primitive([_symmetric(c, modulus) for c in candidate])
+
+            quotient = _exact_quotient(f, candidate)
+            if quotient is None:
+                continue
+
+            result.append(candidate)
+            factors = [factor for i, factor in enumerate(factors) if i not in subset]
+            f = quotient
+            break
+
+        else:
+            size += 1
+
+    result.append(_primitive(f))
+    return result
+
+def _primitive(f):
+    """
+    Divides a polynomial with integer coefficients by their
+    gcd, so that the leading coefficient is positive
+    (see :func:`ruffini.divisors._primitive`)
+    """
+
+    primitive = _primitive_terms(dict(enumerate(f)))
+    return [primitive[i] for i in range(len(f))]
+
+def _exact_quotient(a, b):
+    """
+    Divides two polynomials with integer coefficients,
+    returning None if `b` doesn't divide `a`
+    """
+
+    remainder = list(a)
+    quotient = [0] * (len(a) - len(b) + 1)
+
+    for i in range(len(quotient) - 1, -1, -1):
+        coefficient, rest = divmod(remainder[i + len(b) - 1], b[-1])
+        if rest:
+            return None
+
+        quotient[i] = coefficient
+        if coefficient:
+            for j, c in enumerate(b):
+                remainder[i + j] -= coefficient * c
+
+    return quotient if not any(remainder) else None
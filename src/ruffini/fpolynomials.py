@@ -1,9 +1,15 @@
+from collections import deque, namedtuple
 from fractions import Fraction
 from functools import reduce
 
-from .monomials import Monomial, Variable
+from .monomials import Monomial, Variable, divide_coefficients
 from .polynomials import Polynomial
-from .equations import Equation
+from .rings import ZZ, QQ
+from . import dense, divisors, factors as modular_factors
+
+
+# A method used by factorize (see register_pass)
+FactorizationPass = namedtuple('FactorizationPass', ['method', 'test', 'final', 'repeat'])
 
 
 class FPolynomial(tuple):
@@ -344,7 +350,7 @@ def ruffinis_rule(polynomial):
     Try to factorize the polynomial with the Ruffini's rule.
 
     >>> ruffinis_rule(Polynomial(Monomial(3, x=3), Monomial(2, x=2), Monomial(-3, x=1), Monomial(-2)))
-    (x - 1, 3x**2 + 2 + 5x)
+    (x - 1, 3x**2 + 5x + 2)
 
     If it didn't work, it raises a ValueError.
 
@@ -367,44 +373,251 @@ def ruffinis_rule(polynomial):
     # Get the variable
     variable = polynomial.variables[0]
 
-    for zero in polynomial.zeros:
-        # Calculate the coefficients
-        coefficients = [polynomial.term_coefficient({variable: polynomial.degree})]
-        try:
-            for exponent in range(polynomial.degree)[::-1]:
-                coefficients.append(coefficients[-1] * zero + polynomial.term_coefficient({variable: exponent}))
+    zeros = polynomial.zeros
+    coefficients = polynomial._to_dense()
+
+    for zero in zeros:
+        # Divide the polynomial by (x - zero)
+        quotient, remainder = dense.synthetic_division(coefficients, zero)
+
+        # Check that the remider is 0 (otherwise try with another zero)
+        if not remainder:
+            return Monomial(1, {variable: 1}) - zero, Polynomial._from_dense(quotient, variable)
+
+    raise ValueError("Can't factor the polynomial with Ruffini's rule")
+
+def square_free(polynomial):
+    """
+    Decomposes the polynomial in square-free factors
+    with the Yun's algorithm: every repeated factor is
+    found at once, with its multiplicity.
+
+    It returns a list of pairs (factor, multiplicity);
+    the factors are coprime and none of them has
+    repeated roots.
+
+    >>> x = Variable('x')
+    >>> square_free((x - 1)**3 * (x + 2)**2 * (x + 1))
+    [(x + 1, 1), (x + 2, 2), (x - 1, 3)]
+
+    The factors have integer coefficients, so there
+    can be a constant factor too
+
+    >>> square_free((2*x - 1)**2 * Fraction(1, 4))
+    [(Fraction(1, 4), 1), (2x - 1, 2)]
+
+    It works only with polynomials with a variable
+    and integer or rational coefficients
 
-            # Check that the remider is 0 (otherwise try with another zero)
-            if coefficients[-1]:
-                raise RuntimeError
+    >>> square_free(x**2 * Variable('y') - 1)
+    Traceback (most recent call last):
+    ...
+    ValueError: Can't decompose a polynomial with more than a variable
+
+    :type polynomial: Polynomial
+    :rtype: list
+    :raise: TypeError, ValueError
+    """
+
+    # raise a TypeError if polynomial isn't a polynomial instance
+    if not isinstance(polynomial, Polynomial):
+        raise TypeError(f"Can't use square_free with an object of type '{polynomial.__class__.__name__}'")
+
+    if len(polynomial.variables) != 1:
+        raise ValueError("Can't decompose a polynomial with more than a variable")
+    elif polynomial.ring not in (ZZ, QQ):
+        raise ValueError("Can't decompose a polynomial whose coefficients aren't rational")
+
+    factors = []
 
-            result = 0
+    # the gcd with the derivative contains
+    # every repeated factor
+    derivative = polynomial.derivative()
+    common = polynomial.gcd(derivative)
+    b = polynomial // common
+    d = derivative // common - b.derivative()
+    multiplicity = 1
 
-            # Build the monomials
-            for d in range(len(coefficients) - 1):
-                result += Monomial(coefficients[d], {variable: polynomial.degree - d - 1})
+    # every step removes the factors with
+    # the current multiplicity from b
+    while b.degree > 0:
+        factor = b.gcd(d)
+        b = b // factor
+        d = d // factor - b.derivative()
 
-            return Monomial(1, {variable: 1}) - zero, Polynomial(result)
-        except RuntimeError:
+        if factor.degree > 0:
+            factors.append((factor, multiplicity))
+        multiplicity += 1
+
+    # the leading coefficient that remains
+    leading = polynomial._to_dense()[-1]
+    for factor, multiplicity in factors:
+        leading = divide_coefficients(leading, factor._to_dense()[-1] ** multiplicity)
+
+    if leading != 1:
+        factors.insert(0, (leading, 1))
+
+    return factors
+
+def zassenhaus(polynomial):
+    """
+    Factorizes a polynomial with a variable and rational
+    coefficients into its irreducible factors, with the
+    Zassenhaus' algorithm (see :mod:`ruffini.factors`);
+    the repeated factors are found by :func:`square_free`
+
+    >>> x = Variable('x')
+    >>> zassenhaus((x**2 + 1) * (x**3 + x + 1))
+    (x**2 + 1, x**3 + x + 1)
+    >>> zassenhaus((x**2 - 2)**2 * (x + 1))
+    (x + 1, x**2 - 2, x**2 - 2)
+
+    The factors have integer coefficients,
+    so there can be a constant factor too
+
+    >>> zassenhaus(2*x**2 - Fraction(1, 2))
+    (Fraction(1, 2), 2x - 1, 2x + 1)
+
+    It works only with polynomials with a variable
+    and integer or rational coefficients (see
+    :func:`square_free`).
+
+    :type polynomial: Polynomial
+    :rtype: tuple
+    :raise: TypeError, ValueError
+    """
+
+    # raise a TypeError if polynomial isn't a polynomial instance
+    if not isinstance(polynomial, Polynomial):
+        raise TypeError(f"Can't use zassenhaus with an object of type '{polynomial.__class__.__name__}'")
+
+    constant = 1
+    result = []
+
+    for factor, multiplicity in square_free(polynomial):
+        if not isinstance(factor, Polynomial):
+            constant *= factor
             continue
 
-    raise ValueError("Can't factor the polynomial with Ruffini's rule")
+        # use a primitive polynomial with integer coefficients
+        content, primitive = _content(factor)
+        constant *= content ** multiplicity
 
-def factorize(polynomial):
+        for irreducible in modular_factors.zassenhaus(primitive._to_dense()):
+            result.extend([Polynomial._from_dense(irreducible, factor.variables[0])] * multiplicity)
+
+    if constant != 1:
+        result.insert(0, constant)
+
+    return tuple(result)
+
+### Factorization Passes ###
+
+# The methods used by factorize, in the order in which
+# they're tried on every factor (see register_pass)
+PASSES = []
+
+# The greatest absolute value of the constant term and of the
+# leading coefficient for which the Ruffini's rule is tried:
+# their divisors are the candidate zeros
+RUFFINI_LIMIT = 1000
+
+
+def register_pass(method, test, final=False, repeat=True):
+    """
+    Registers a method used by :func:`factorize`: it
+    takes a polynomial and returns a tuple of factors,
+    raising a ValueError if it can't factorize it.
+
+    `test` is a function which tells, without doing any
+    expensive computation, if the method can be applied
+    to a polynomial. If `final` is True the factors found
+    by the method are irreducible, so they aren't examined
+    again; if `repeat` is False, they're examined only by
+    the methods registered after this one.
+
+    >>> [p.method.__name__ for p in PASSES]
+    ['gcf', 'binomial_square', 'ruffinis_rule', 'zassenhaus']
+
+    :type method: function
+    :type test: function
+    :type final: bool
+    :type repeat: bool
+    """
+
+    PASSES.append(FactorizationPass(method, test, final, repeat))
+
+def _has_integer_coefficients(polynomial):
+    """
+    Checks if a polynomial has terms and every
+    coefficient is an integer, as :func:`gcf` requires
+    """
+
+    return bool(polynomial) and all(isinstance(term.coefficient, int) for term in polynomial)
+
+def _is_trinomial(polynomial):
+    """
+    Checks if a polynomial has three terms
+    and rational coefficients
     """
-    Factorize the given polynomial using some algorythms
-    (sub functions), such as
 
-    :func:`gcf`, group [todo], squares difference [todo],
-    cubes sum [todo], cubes difference [todo],
-    binomial square [todo], :func:`factorize_binomia_square`,
-    trinomial square [todo].
+    return len(polynomial) == 3 and polynomial.ring in (ZZ, QQ)
 
-    It works in recursive mode.
+def _is_univariate(polynomial):
+    """
+    Checks if a polynomial of degree two or more
+    has a variable and rational coefficients
+    """
+
+    return len(polynomial.variables) == 1 and polynomial.degree >= 2 and polynomial.ring in (ZZ, QQ)
+
+def _has_few_zeros(polynomial):
+    """
+    Checks if the rational zeros of a polynomial with a
+    variable and integer coefficients are few enough to
+    be tried with the Ruffini's rule
+    """
+
+    if len(polynomial.variables) != 1 or polynomial.degree < 2 or polynomial.ring is not ZZ:
+        return False
+
+    constant = polynomial.term_coefficient()
+    leading = polynomial.term_coefficient({polynomial.variables[0]: polynomial.degree})
+    return 0 < abs(constant) <= RUFFINI_LIMIT and abs(leading) <= RUFFINI_LIMIT
+
+register_pass(gcf, _has_integer_coefficients, repeat=False)
+register_pass(binomial_square, _is_trinomial)
+register_pass(ruffinis_rule, _has_few_zeros)
+register_pass(zassenhaus, _is_univariate, final=True)
+
+def factorize(polynomial):
+    """
+    Factorize the given polynomial using the methods
+    in :data:`PASSES`: :func:`gcf`, :func:`binomial_square`,
+    :func:`ruffinis_rule` (which finds the linear factors
+    of small polynomials cheaply) and :func:`zassenhaus`.
 
     >>> factorize(Polynomial(Monomial(10, x=1), 15))
     5(2x + 3)
 
+    Only the factors found by a method are examined
+    again, and the irreducible ones are never examined:
+    the polynomials with a variable and rational
+    coefficients are completely factorized by
+    :func:`zassenhaus`
+
+    >>> x = Variable('x')
+    >>> factorize(x**5 + x**3 - x**2 - 1)
+    (x - 1)(x**2 + 1)(x**2 + x + 1)
+
+    The factors with rational coefficients are
+    primitive polynomials with integer coefficients,
+    and all the constants are collected in a single
+    factor, at the beginning
+
+    >>> tuple(factorize(3*x**2 / 2 - 6))
+    (3/2, x - 2, x + 2)
+
     If polynomial isn't a polynomial, it will raise a TypeError
 
     >>> factorize('John')
@@ -421,50 +634,80 @@ def factorize(polynomial):
     if not isinstance(polynomial, Polynomial):
         raise TypeError(f"Can't factorize object of type '{polynomial.__class__.__name__}'")
 
-    # initialize factors
+    # the worklist contains the factors to examine, with
+    # their multiplicity and the index of the first pass
+    # to try; the factors that can't be split are final
+    worklist = deque([(polynomial, 1, 0)])
     factors = []
-    new_factors = list(gcf(polynomial))
 
-    # while there are things to factorize, factorize them!
-    while not factors == new_factors:
-        factors = new_factors
-        new_factors = []
+    while worklist:
+        factor, multiplicity, start = worklist.popleft()
 
-        # for each factor
-        for factor in factors:
-            # leave it like it was if it isn't a polynomial, if it's a polynomial
-            # of first degree or if it has more than a variable
-            if not isinstance(factor, Polynomial) or not len(factor.variables) == 1 or factor.degree < 2:
-                new_factors.append(factor)
+        for index in range(start, len(PASSES)):
+            method, test, final, repeat = PASSES[index]
+            if not test(factor):
+                continue
+
+            try:
+                result = method(factor)
+            except ValueError:
+                continue
+
+            # the method didn't split the factor
+            if not final and len(result) == 1:
                 continue
 
-            # try with a binomial square
-            if len(factor) == 3 and factor.degree == 2:
-                try:
-                    new_factors.extend(binomial_square(factor))
-                    continue
-                except ValueError:
-                    pass
-
-            # if it is a trinomial try with an equation
-            if len(factor) == 3 and factor.degree == 2:
-                try:
-                    x1, x2 = Equation(factor, 0).solve()
-                    variable = Monomial(1, {factor.variables[0]: 1})
-                    new_factors.extend([factor.term_coefficient(variable**2), variable - x1, variable - x2])
-                    continue
-                except AssertionError:
-                    pass
-
-            # try with ruffini's rule
-            if factor.degree >= 2:
-                try:
-                    new_factors.extend(ruffinis_rule(factor))
-                    continue
-                except ValueError:
-                    pass
-
-            new_factors.append(factor)
-
-    # Return the result
-    return FPolynomial(*factors)
+            # the same factor can be found more than
+            # once: it's examined only once
+            found = {}
+            for f in result:
+                found[f] = found.get(f, 0) + multiplicity
+
+            for f, m in found.items():
+                if final or not isinstance(f, Polynomial) or f.degree < 2:
+                    factors.append((f, m))
+                else:
+                    worklist.append((f, m, index if repeat else index + 1))
+
+            break
+
+        else:
+            factors.append((factor, multiplicity))
+
+    # collect the constants (and the monomials) in a single
+    # factor, leaving only primitive polynomials
+    leading = Monomial(1)
+    polynomials = []
+
+    for factor, multiplicity in factors:
+        if isinstance(factor, Polynomial) and len(factor) > 1:
+            if factor.ring in (ZZ, QQ):
+                content, factor = _content(factor)
+                leading *= content ** multiplicity
+
+            polynomials.extend([factor] * multiplicity)
+        else:
+            leading *= Polynomial(factor)[0] ** multiplicity if factor else 0
+
+    # Return the result, with the factors in
+    # an order which doesn't depend on the passes
+    polynomials.sort(key=lambda f: (f.degree, f.variables, sorted(f._to_exponents(f.variables).items())))
+    return FPolynomial(Polynomial(leading), *polynomials)
+
+### Utility Functions ###
+
+def _content(polynomial):
+    """
+    Splits a polynomial with rational coefficients in its
+    content and its primitive part, with integer coefficients
+    and a positive leading coefficient (see :func:`ruffini.divisors.integral`)
+    """
+
+    variables = polynomial.variables
+    terms = polynomial._to_exponents(variables)
+    primitive = divisors.integral(terms)
+
+    leading = max(primitive)
+    content = divide_coefficients(terms[leading], primitive[leading])
+
+    return content, Polynomial._from_exponents(primitive, variables)
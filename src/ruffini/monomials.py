@@ -3,6 +3,7 @@ from functools import reduce
 from math import gcd as math_gcd
 
 from .variables import VariablesDict
+from .rings import NUMBERS, ring_of
 
 
 class Monomial:
@@ -20,7 +21,9 @@ class Monomial:
     value you assigned.
     """
 
-    def __init__(self, coefficient=1, variables=VariablesDict(), **kwargs):
+    __slots__ = ("coefficient", "variables", "degree")
+
+    def __init__(self, coefficient=1, variables=VariablesDict(), *, ring=None, **kwargs):
         """
         Creates a new Monomial.
         The default `coefficient` value is 1 (so it can be omitted);
@@ -31,11 +34,29 @@ class Monomial:
         >>> Monomial()
         1
 
-        Every `coefficient` will be transformed in an instance of :class:`Fraction`
+        Whole coefficients are stored as instances of :class:`int`,
+        while the other ones are transformed in instances of :class:`Fraction`
 
         >>> type(Monomial(7, a=2).coefficient)
+        <class 'int'>
+        >>> type(Monomial(7.0, a=2).coefficient)
+        <class 'int'>
+        >>> type(Monomial(3.5, a=2).coefficient)
         <class 'fractions.Fraction'>
 
+        Coefficients stay integers as long as the results
+        of the operations are whole numbers, so that
+        they don't pay the cost of the fractions' normalization.
+
+        You can also choose the ring of the coefficient
+        (see :class:`Ring`), which will be used to convert it
+
+        >>> from ruffini import GF, RR
+        >>> Monomial(8, x=1, ring=GF(5))
+        -2x
+        >>> Monomial(2.5, x=1, ring=RR).coefficient
+        2.5
+
         Monomials can also be initialized by passing a dictionary
         (or anything similar) where are stored the variables:
 
@@ -43,7 +64,7 @@ class Monomial:
         2x**2y
 
         Variables will be stored in a `VariableDict`.
-        For more infos, see :func:`VariablesDict.__init__()`.)
+        For more infos, see :func:`VariablesDict.__new__()`.)
 
         Once initialized the monomial, it
         calculates the monomial's total degree
@@ -52,8 +73,9 @@ class Monomial:
         >>> Monomial(-2, a=2, b=1, c=3).degree
         6
 
-        :type coefficient: int, float, Fraction
-        :type coefficient: dict, VariablesDict
+        :type coefficient: int, float, Fraction, ModularInteger
+        :type variables: dict, VariablesDict
+        :type ring: Ring
         :raise: ValueError, TypeError
         """
 
@@ -65,9 +87,13 @@ class Monomial:
             variables = kwargs
 
         # Check the coefficient
-        if isinstance(coefficient, (int, float)):
-            self.coefficient = Fraction(coefficient)
-        elif isinstance(coefficient, Fraction):
+        if ring is not None:
+            self.coefficient = ring(coefficient)
+        elif isinstance(coefficient, int):
+            self.coefficient = coefficient
+        elif isinstance(coefficient, (float, Fraction)):
+            self.coefficient = reduce_coefficient(Fraction(coefficient))
+        elif isinstance(coefficient, NUMBERS):
             self.coefficient = coefficient
         else:
             raise TypeError("Coefficient must be int or float")
@@ -76,10 +102,48 @@ class Monomial:
         self.variables = VariablesDict(variables)
 
         # Calculate the degree
-        self.degree = sum(self.variables.exponents())
+        self.degree = self.variables.degree
+
+    @classmethod
+    def _from_trusted(cls, coefficient, variables):
+        """
+        Creates a new Monomial without checking its arguments.
+
+        It's meant to be used only internally, when `coefficient`
+        is already a valid coefficient and `variables` is
+        already a VariablesDict.
+
+        :type coefficient: int, float, Fraction, ModularInteger
+        :type variables: VariablesDict
+        :rtype: Monomial
+        """
+
+        monomial = super().__new__(cls)
+        monomial.coefficient = reduce_coefficient(coefficient)
+        monomial.variables = variables
+        monomial.degree = variables.degree
+
+        return monomial
 
     ### Utility Methods ###
 
+    @property
+    def ring(self):
+        """
+        Returns the smallest ring containing the coefficient
+
+        >>> Monomial(2, x=1).ring
+        ZZ
+        >>> Monomial(2.5, x=1).ring
+        QQ
+
+        For more informations, see :class:`Ring`.
+
+        :rtype: Ring
+        """
+
+        return ring_of(self.coefficient)
+
     def similar_to(self, other):
         """
         Checks if two monomials are similar (if
@@ -107,7 +171,7 @@ class Monomial:
         :rtype: bool
         """
 
-        if self.variables.is_empty and isinstance(other, (int, float, Fraction)):
+        if self.variables.is_empty and isinstance(other, NUMBERS):
             return True
         elif not isinstance(other, Monomial):
             return False
@@ -236,14 +300,14 @@ class Monomial:
         """
 
         # Check type of the second operand
-        if isinstance(other, (int, float, Fraction)):
+        if isinstance(other, NUMBERS):
             other = Monomial(other)
         elif not isinstance(other, Monomial):
             raise TypeError(f"Can't calculate gcd between Monomial and {other.__class__.__name__}")
 
         # Check if operands are legal
         for monomial in (self, other):
-            if not monomial.coefficient.denominator == 1:
+            if not isinstance(monomial.coefficient, int):
                 raise ValueError("Monomial coefficient must be a whole number")
             elif monomial.coefficient == 0:
                 raise ValueError("Coefficient can't be zero")
@@ -286,17 +350,17 @@ class Monomial:
 
         >>> m = Monomial(5, x=1, y=1)
         >>> m.eval(x=2, y=3)
-        Fraction(30, 1)
+        30
 
         **NB:** *if there are no variables left,
         it returns only the coefficient, as instance
-        of :class:`Fraction`.*
+        of :class:`int` or :class:`Fraction`.*
 
         You can also assign variables' values
         with a dictionary (or any subclass)
 
         >>> m.eval({'x': 2, 'y': 3})
-        Fraction(30, 1)
+        30
 
         If you omit some variables' values,
         those variables will remain as they
@@ -375,14 +439,14 @@ class Monomial:
 
             # Simil monomial
             elif self.similar_to(other):
-                return Monomial(self.coefficient + other.coefficient, self.variables)
+                return Monomial._from_trusted(self.coefficient + other.coefficient, self.variables)
 
             # Generic monomial
             else:
                 return Polynomial(self, other)
 
         # monomial + number
-        elif isinstance(other, (int, float, Fraction)):
+        elif isinstance(other, NUMBERS):
             if self.variables.is_empty:
                 return Monomial(self.coefficient + other)
 
@@ -442,7 +506,7 @@ class Monomial:
         from . import Polynomial
 
         # numbers
-        if isinstance(other, (int, float, Fraction)):
+        if isinstance(other, NUMBERS):
             other = Monomial(other)
 
         # monomials
@@ -450,7 +514,7 @@ class Monomial:
             coefficient = self.coefficient * other.coefficient
             variables = self.variables + other.variables
 
-            return Monomial(coefficient, variables)
+            return Monomial._from_trusted(coefficient, variables)
 
         # polynomials
         elif isinstance(other, Polynomial):
@@ -482,13 +546,13 @@ class Monomial:
         :raise: ValueError, TypeError
         """
 
-        if isinstance(other, (int, float, Fraction)):
+        if isinstance(other, NUMBERS):
             other = Monomial(other)
 
         if isinstance(other, Monomial):
-            coefficient = Fraction(self.coefficient, other.coefficient)
+            coefficient = divide_coefficients(self.coefficient, other.coefficient)
             variables = self.variables - other.variables
-            return Monomial(coefficient, variables)
+            return Monomial._from_trusted(coefficient, variables)
 
         else:
             raise TypeError(f"unsupported operand type(s) for /: 'Monomial' and '{other.__class__.__name__}'")
@@ -538,7 +602,7 @@ class Monomial:
         elif exp < 0:
             raise ValueError("Exponent can't be negative")
 
-        return Monomial(self.coefficient ** exp, self.variables * exp)
+        return Monomial._from_trusted(self.coefficient ** exp, self.variables * exp)
 
     ### Reversed Operations Method ###
 
@@ -613,13 +677,13 @@ class Monomial:
         :raise: ValueError, TypeError
         """
 
-        if not isinstance(other, (int, float, Fraction)):
+        if not isinstance(other, NUMBERS):
             raise TypeError(f"unsupported operand type(s) for /: '{other.__class__.__name__}' and 'Monomial'")
 
         if self.variables:
             raise ValueError("Exponent must be positive")
 
-        return Monomial(Fraction(other, self.coefficient))
+        return Monomial(divide_coefficients(Monomial(other).coefficient, self.coefficient))
 
     ### Magic Methods ###
 
@@ -716,18 +780,28 @@ class Monomial:
         If the second operand isn't a monomial or
         a number, it will return `False`.
 
-        It works by comparing the hashes
-        calculated with :func:`Monomial.__hash__`.
+        >>> Monomial(4) == "4"
+        False
+
+        It compares the variables (which are unique,
+        see :class:`VariablesDict`) and the coefficients.
 
         :type other: Monomial, int, float, Fraction
         :rtype: bool
-        :raise: TypeError
         """
 
-        try:
-            return hash(self) == hash(other)
-        except TypeError:
-            return False
+        if isinstance(other, Monomial):
+            return self.variables is other.variables and self.coefficient == other.coefficient
+
+        elif isinstance(other, NUMBERS):
+            return self.variables.is_empty and self.coefficient == other
+
+        from . import Polynomial
+
+        if isinstance(other, Polynomial):
+            return other == self
+
+        return False
 
     def __neg__(self):
         """
@@ -739,7 +813,7 @@ class Monomial:
         :rtype: Monomial
         """
 
-        return Monomial(-self.coefficient, self.variables)
+        return Monomial._from_trusted(-self.coefficient, self.variables)
 
     def __abs__(self):
         """
@@ -751,7 +825,7 @@ class Monomial:
         :rtype: Monomial
         """
 
-        return Monomial(abs(self.coefficient), self.variables)
+        return Monomial._from_trusted(abs(self.coefficient), self.variables)
 
     def __hash__(self):
         """
@@ -778,6 +852,57 @@ class Monomial:
         return hash((self.coefficient, *self.variables.items()))
 
 
+# Coefficients utilities
+def reduce_coefficient(coefficient):
+    """
+    Returns a whole :class:`Fraction` as an :class:`int`;
+    any other coefficient is returned as it is
+
+    >>> reduce_coefficient(Fraction(6, 3))
+    2
+    >>> reduce_coefficient(Fraction(1, 3))
+    Fraction(1, 3)
+
+    :type coefficient: int, float, Fraction, ModularInteger
+    :rtype: int, float, Fraction, ModularInteger
+    """
+
+    if coefficient.__class__ is Fraction and coefficient.denominator == 1:
+        return coefficient.numerator
+
+    return coefficient
+
+def divide_coefficients(a, b):
+    """
+    Divides two coefficients, keeping the result
+    as an :class:`int` if it's a whole number
+
+    >>> divide_coefficients(6, 3)
+    2
+    >>> divide_coefficients(6, 4)
+    Fraction(3, 2)
+
+    Floats and elements of finite fields are
+    divided with their own division
+
+    >>> divide_coefficients(1.5, 3)
+    0.5
+
+    :type a: int, float, Fraction, ModularInteger
+    :type b: int, float, Fraction, ModularInteger
+    :rtype: int, float, Fraction, ModularInteger
+    :raise: ZeroDivisionError
+    """
+
+    if a.__class__ is int and b.__class__ is int:
+        if not a % b:
+            return a // b
+
+    elif not isinstance(a, (int, Fraction)) or not isinstance(b, (int, Fraction)):
+        return a / b
+
+    return reduce_coefficient(Fraction(a, b))
+
 # Variables shorthands
 def Variable(letter):
     """
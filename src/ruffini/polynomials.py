@@ -1,14 +1,46 @@
-from collections import Counter
 from fractions import Fraction
-
-from .variables import VariablesDict
-from .monomials import Monomial, Variable
+from math import gcd as math_gcd
+
+from .variables import VariablesDict, lex, grlex
+from .monomials import Monomial, Variable, reduce_coefficient, divide_coefficients
+from .rings import NUMBERS, ZZ, QQ, ModularInteger, FiniteField, ring_of
+from . import dense, sparse, divisors
+from .evaluation import horner_scheme, compile_scheme
+
+# Univariate polynomials are handled as dense lists of
+# coefficients (see :mod:`ruffini.dense`) when they have at
+# least a term every DENSE_RATIO degrees; products use them
+# only when the factors have at least DENSE_THRESHOLD terms
+DENSE_RATIO = 2
+DENSE_THRESHOLD = 8
+
+# Products of polynomials with up to KRONECKER_VARIABLES
+# variables and at least DENSE_THRESHOLD terms are turned into
+# univariate ones with the Kronecker substitution, if the
+# dense polynomial isn't longer than the number of pairs of terms
+KRONECKER_VARIABLES = 3
+
+# The other products with at least HEAP_THRESHOLD pairs
+# of terms are computed merging the terms with a heap
+# (see :mod:`ruffini.sparse`), so that the intermediate
+# products aren't stored all toghether: the heap is slower
+# when many products are similar, so it's used only when
+# they would take megabytes (from about 75 to 500 bytes
+# each, see `product_peak_memory` in benchmarks.py)
+HEAP_THRESHOLD = 2**14
+
+# Powers of multivariate polynomials are expanded with the
+# multinomial theorem if the result has at most
+# MULTINOMIAL_THRESHOLD terms before summing the similar ones
+MULTINOMIAL_THRESHOLD = 100000
 
 
 def get_divisors(n):
     n = abs(n)
     divs = {m for m in range(1, int(n/2) + 1) if not n % m}
     divs |=  {int(n / m) for m in divs}
+    if n:
+        divs.add(n)
     return divs
 
 class Polynomial(tuple):
@@ -27,9 +59,17 @@ class Polynomial(tuple):
     so all the methods of tuple are automatically
     inherited from Polynomial; many of these methods
     are not in this docs.
+
+    The terms can also be looked up in a dictionary,
+    indexed by their variables: this way, similar terms
+    can be found and summed without scanning the
+    whole polynomial. The dictionary is built only when
+    it's needed (or by the sums, which are often summed
+    again), so the polynomials which are just stored
+    keep a single copy of their terms.
     """
 
-    def __new__(cls, terms=(), *args):
+    def __new__(cls, terms=(), *args, ring=None):
         """
         Create the polynomial by giving it a list
         of terms (a term can be a Monomial or a
@@ -39,7 +79,29 @@ class Polynomial(tuple):
         >>> Polynomial(Monomial(2, x=2, y=2), Monomial(3, x=2, y=2))
         5x**2y**2
 
+        You can also choose the ring of the coefficients
+        (see :class:`Ring`): every coefficient will be
+        converted into an element of that ring
+
+        >>> from ruffini import GF
+        >>> Polynomial(Monomial(4, x=1), 6, ring=GF(5))
+        -x + 1
+
+        If a coefficient is in a finite field, all the
+        others are converted into that field
+
+        >>> Polynomial(Monomial(3, x=2), Monomial(GF(5)(1), x=1))
+        -2x**2 + x
+
+        Terms whose coefficient is zero are not stored
+
+        >>> Polynomial(Monomial(2, x=1), 3, Monomial(-2, x=1))
+        3
+        >>> Polynomial(Monomial(2, x=1), Monomial(-2, x=1))
+        0
+
         :type *terms: Monomials, int, float
+        :type ring: Ring
         :raise: TypeError
         """
 
@@ -47,28 +109,239 @@ class Polynomial(tuple):
         if not isinstance(terms, (tuple, list, set)):
             terms = (terms, ) + args
 
-        counter = Counter()
+        # Sum the similar terms, remembering which
+        # ones haven't changed (so they can be reused)
+        coefficients = {}
+        monomials = {}
 
-        # Sum the similar terms
         for term in terms:
-            if isinstance(term, (int, float, Fraction)):
+            if isinstance(term, NUMBERS):
                 term = Monomial(term)
-            elif isinstance(term, Monomial):
-                pass
-            else:
+            elif not isinstance(term, Monomial):
                 raise TypeError(f"{term} is not a valid term")
 
-            counter[term.variables] += term.coefficient
+            variables = term.variables
+            if variables in coefficients:
+                coefficients[variables] += term.coefficient
+                monomials[variables] = None
+            else:
+                coefficients[variables] = term.coefficient
+                monomials[variables] = term
+
+        # The elements of a finite field can't be mixed
+        # with other numbers, so they set the ring
+        if ring is None and any(isinstance(c, ModularInteger) for c in coefficients.values()):
+            ring = ring_of(*coefficients.values())
+
+        # Convert the coefficients if needed
+        if ring is not None:
+            for variables, coefficient in coefficients.items():
+                converted = ring(coefficient)
+                if converted is not coefficient:
+                    coefficients[variables] = converted
+                    monomials[variables] = None
+
+        # Rewrite them, removing the null ones
+        mapped_terms = {}
+        for variables, coefficient in coefficients.items():
+            if coefficient:
+                mapped_terms[variables] = monomials.get(variables) or Monomial._from_trusted(coefficient, variables)
+
+        return super().__new__(cls, mapped_terms.values())
+
+    @classmethod
+    def _from_trusted(cls, terms):
+        """
+        Creates a new Polynomial without checking its terms
+        and without summing the similar ones.
+
+        It's meant to be used only internally, when `terms`
+        is already a dict of not-null Monomials, indexed
+        by their variables.
+
+        :type terms: dict
+        :rtype: Polynomial
+        """
+
+        return super().__new__(cls, terms.values())
+
+    @property
+    def _terms(self):
+        """
+        Returns the terms of the polynomial as a dictionary
+        indexed by their variables; it's built only the
+        first time a term is looked up.
+
+        :rtype: dict
+        """
+
+        try:
+            return self._mapping
+        except AttributeError:
+            self._mapping = {term.variables: term for term in self}
+            return self._mapping
+
+    def _merge(self, terms, sign=1):
+        """
+        Returns the sum of this polynomial and the given terms
+        (or their difference, if `sign` is -1).
+
+        Only the terms of `terms` are looked up, so adding
+        a few terms to a big polynomial is cheap.
+
+        :type terms: Polynomial
+        :type sign: int
+        :rtype: Polynomial
+        """
+
+        self, terms = self._to_common_ring(terms)
+        result = dict(self._terms)
+
+        for term in terms:
+            variables = term.variables
+            similar = result.get(variables)
+
+            if similar is None:
+                result[variables] = term if sign == 1 else -term
+                continue
+
+            coefficient = similar.coefficient + sign * term.coefficient
+            if coefficient:
+                result[variables] = Monomial._from_trusted(coefficient, variables)
+            else:
+                del result[variables]
+
+        # the sum is likely to be summed again,
+        # so it keeps its dictionary
+        polynomial = Polynomial._from_trusted(result)
+        polynomial._mapping = result
+
+        return polynomial
+
+    def _to_common_ring(self, other):
+        """
+        Returns this polynomial and `other`, converting
+        one of them if only the other one has coefficients
+        in a finite field (they can't be mixed with other
+        numbers); the rings are checked looking at the
+        first term, since all the coefficients of a
+        polynomial are in the same finite field.
+
+        :type other: Polynomial
+        :rtype: tuple
+        :raise: ValueError
+        """
+
+        if not self or not other:
+            return self, other
+
+        a, b = self[0].coefficient, other[0].coefficient
+        modular = isinstance(a, ModularInteger)
+
+        if modular != isinstance(b, ModularInteger):
+            if modular:
+                return self, other.change_ring(ring_of(a))
+            return self.change_ring(ring_of(b)), other
+
+        elif modular and a.modulus != b.modulus:
+            raise ValueError("can't operate on elements of different fields")
+
+        return self, other
+
+    def _is_dense(self):
+        """
+        Checks if the polynomial has only a variable and
+        enough terms to be handled as a dense list of
+        coefficients (see :func:`Polynomial._to_dense`).
+
+        :rtype: bool
+        """
+
+        return len(self.variables) == 1 and self.degree < DENSE_RATIO * len(self)
+
+    def _to_dense(self):
+        """
+        Returns the coefficients of an univariate polynomial
+        as a list, where the i-th element is the coefficient
+        of the term of degree i (see :mod:`ruffini.dense`).
+
+        :rtype: list
+        """
+
+        coefficients = [0] * (self.degree + 1)
+        for term in self:
+            coefficients[term.degree] = term.coefficient
+
+        return coefficients
+
+    @classmethod
+    def _from_dense(cls, coefficients, variable):
+        """
+        Creates an univariate polynomial from a dense list
+        of coefficients (see :func:`Polynomial._to_dense`);
+        the terms are sorted from the highest degree.
+
+        :type coefficients: list
+        :type variable: str
+        :rtype: Polynomial
+        """
+
+        terms = {}
+
+        for exponent in range(len(coefficients) - 1, -1, -1):
+            coefficient = coefficients[exponent]
+            if coefficient:
+                variables = VariablesDict._from_trusted(((variable, exponent), )) if exponent else VariablesDict()
+                terms[variables] = Monomial._from_trusted(coefficient, variables)
+
+        polynomial = Polynomial._from_trusted(terms)
+
+        # the degree is the one of the first term
+        polynomial._degree = next(iter(terms)).degree if terms else 0
+        polynomial._variables = (variable, ) if polynomial._degree else ()
+
+        return polynomial
+
+    def _to_exponents(self, variables):
+        """
+        Returns the terms of the polynomial as a dictionary
+        which maps the tuples of the exponents of `variables`
+        (sorted alphabetically) to the coefficients
+        (see :mod:`ruffini.divisors`).
+
+        :type variables: tuple
+        :rtype: dict
+        """
+
+        return {tuple(term.variables[v] for v in variables): term.coefficient for term in self}
+
+    @classmethod
+    def _from_exponents(cls, terms, variables):
+        """
+        Creates a polynomial from a dictionary
+        of exponents and coefficients (see
+        :func:`Polynomial._to_exponents`).
+
+        :type terms: dict
+        :type variables: tuple
+        :rtype: Polynomial
+        """
 
-        # Rewrite them
-        terms = [Monomial(c, v) for v, c in counter.items()]
+        mapped_terms = {}
 
-        return super().__new__(cls, terms)
+        for exponents, coefficient in terms.items():
+            items = tuple((v, e) for v, e in zip(variables, exponents) if e)
+            monomial_variables = VariablesDict._from_trusted(items)
+            mapped_terms[monomial_variables] = Monomial._from_trusted(coefficient, monomial_variables)
 
-    def __init__(self, terms=(), *args):
+        return Polynomial._from_trusted(mapped_terms)
+
+    @property
+    def degree(self):
         """
-        Initialize the polynomial, then calculate
-        its degree (the highest degree between terms' ones)
+        Returns the degree of the polynomial (the highest
+        degree between terms' ones); it's computed only
+        the first time it's needed
 
         >>> p = Polynomial(Monomial(a=1), Monomial(3))
         >>> p
@@ -76,15 +349,140 @@ class Polynomial(tuple):
         >>> p.degree
         1
 
-        :type *terms: Monomials, int, float
+        :rtype: int
+        """
+
+        try:
+            return self._degree
+        except AttributeError:
+            self._degree = max(term.degree for term in self) if self else 0
+            return self._degree
+
+    @property
+    def variables(self):
+        """
+        Returns the variables of the polynomial, in
+        alphabetical order; they're computed only
+        the first time they're needed
+
+        >>> Polynomial(Monomial(y=1), Monomial(x=2), Monomial(3, x=1, z=1)).variables
+        ('x', 'y', 'z')
+
+        :rtype: tuple
+        """
+
+        try:
+            return self._variables
+        except AttributeError:
+            self._variables = tuple(sorted({variable for term in self for variable in term.variables}))
+            return self._variables
+
+    def _inherit(self, polynomial):
+        """
+        Copies the degree and the variables of another
+        polynomial, if they have already been computed:
+        it's used when they're known to be the same.
+
+        :type polynomial: Polynomial
+        :rtype: Polynomial
         """
 
-        # Add polynomial degree
-        self.degree = max(m.degree for m in self) if self else 0
-        self.variables = tuple({variable for term in self for variable in term.variables})
+        for name in ("_degree", "_variables"):
+            if name in polynomial.__dict__:
+                self.__dict__[name] = polynomial.__dict__[name]
+
+        return self
 
     ### Utility Methods ###
 
+    @staticmethod
+    def sum(terms):
+        """
+        Sums many polynomials, monomials or numbers;
+        it's much faster than the builtin `sum()`, since
+        the terms are summed in place (see :class:`PolynomialBuilder`)
+
+        >>> x = Variable('x')
+        >>> Polynomial.sum([x**2, 2*x + 1, x - 1])
+        x**2 + 3x
+
+        :type terms: iterable
+        :rtype: Polynomial
+        :raise: TypeError
+        """
+
+        return PolynomialBuilder(terms).build()
+
+    def ordered(self, order=grlex):
+        """
+        Returns the polynomial with the terms sorted,
+        from the greatest to the lowest, in a monomial order
+        (see :func:`lex`, :func:`grlex` and :func:`grevlex`).
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> p = Polynomial(3, x*y, y**3, x)
+        >>> p
+        3 + xy + y**3 + x
+        >>> p.ordered()
+        y**3 + xy + x + 3
+
+        :type order: function
+        :rtype: Polynomial
+        """
+
+        terms = sorted(self, key=lambda t: order(t.variables), reverse=True)
+        return Polynomial._from_trusted({t.variables: t for t in terms})._inherit(self)
+
+    @property
+    def ring(self):
+        """
+        Returns the smallest ring containing
+        all the coefficients of the polynomial
+
+        >>> x = Variable('x')
+        >>> (3*x + 2).ring
+        ZZ
+        >>> (3*x + 0.5).ring
+        QQ
+
+        For more informations, see :class:`Ring`.
+
+        :rtype: Ring
+        """
+
+        return ring_of(*(term.coefficient for term in self))
+
+    def change_ring(self, ring):
+        """
+        Returns the same polynomial, with the
+        coefficients converted into another ring
+
+        >>> from ruffini import GF, RR
+        >>> x = Variable('x')
+        >>> p = (3*x + 2) * (3*x + 4)
+        >>> p
+        9x**2 + 18x + 8
+        >>> p.change_ring(GF(7))
+        2x**2 - 3x + 1
+        >>> p.change_ring(GF(7)).ring
+        GF(7)
+
+        The operations with polynomials whose
+        coefficients are in a finite field are done in that field
+
+        >>> p.change_ring(GF(7)) * 4
+        x**2 + 2x - 3
+
+        For more informations, see :class:`Ring`.
+
+        :type ring: Ring
+        :rtype: Polynomial
+        :raise: TypeError, ValueError
+        """
+
+        return Polynomial(self, ring=ring)
+
     def term_coefficient(self, variables=None, **kwargs):
         """
         Return the coefficient of the term with
@@ -98,7 +496,7 @@ class Polynomial(tuple):
         10xy - 6xy**3
         >>>
         >>> p.term_coefficient(x=1, y=1)
-        Fraction(10, 1)
+        10
 
         If none is found, the result will be 0
 
@@ -108,7 +506,7 @@ class Polynomial(tuple):
         You can also give directly the variables as an argument
 
         >>> p.term_coefficient(x*y)
-        Fraction(10, 1)
+        10
 
         :type variables: dict, VariablesDict
         :rtype: int, float
@@ -125,12 +523,222 @@ class Polynomial(tuple):
         if not isinstance(variables, VariablesDict):
             variables = VariablesDict(variables)
 
+        # look for the term, or return 0 if there isn't
+        term = self._terms.get(variables)
+        return term.coefficient if term is not None else 0
+
+    def coefficients(self, variable=None):
+        """
+        Returns the coefficients of the polynomial as a list,
+        where the i-th element is the coefficient of
+        `variable**i` (the null polynomial has no coefficients)
+
+        >>> x = Variable('x')
+        >>> (3*x**3 - x + 2).coefficients()
+        [2, -1, 0, 3]
+
+        If the polynomial has other variables,
+        the coefficients are polynomials
+
+        >>> y = Variable('y')
+        >>> (x**2*y + 3*x**2 - y + 1).coefficients('x')
+        [-y + 1, 0, y + 3]
+
+        `variable` can be omitted only if the
+        polynomial has at most a variable.
+
+        :type variable: str
+        :rtype: list
+        :raise: ValueError
+        """
+
+        if variable is None:
+            if len(self.variables) > 1:
+                raise ValueError("The variable must be specified for polynomials with more than a variable")
+            variable = self.variables[0] if self.variables else None
+        else:
+            variable = variable.lower()
+
+        if not self:
+            return []
+
+        # univariate polynomials
+        if not self.variables or self.variables == (variable, ):
+            return self._to_dense()
+
+        # group the terms by the exponent of the variable
+        groups = [[] for _ in range(max(term.variables[variable] for term in self) + 1)]
+
+        for term in self:
+            exponent = term.variables[variable]
+            if exponent:
+                term = Monomial._from_trusted(term.coefficient, term.variables - VariablesDict({variable: exponent}))
+            groups[exponent].append(term)
+
+        return [Polynomial(group) if group else 0 for group in groups]
+
+    def derivative(self, variable=None):
+        """
+        Returns the derivative of the polynomial
+        with respect to a variable
+
+        >>> x = Variable('x')
+        >>> (3*x**3 - x + 2).derivative()
+        9x**2 - 1
+
+        `variable` can be omitted only if the
+        polynomial has at most a variable.
+
+        >>> y = Variable('y')
+        >>> (x**2*y + 3*x*y**2 - y).derivative('y')
+        x**2 + 6xy - 1
+
+        :type variable: str
+        :rtype: Polynomial
+        :raise: ValueError
+        """
+
+        if variable is None:
+            if len(self.variables) > 1:
+                raise ValueError("The variable must be specified for polynomials with more than a variable")
+            elif not self.variables:
+                return Polynomial()
+            variable = self.variables[0]
+        else:
+            variable = variable.lower()
+
+        decrement = VariablesDict._from_trusted(((variable, 1), ))
+        terms = {}
+
         for term in self:
-            if term.variables == variables:
-                return term.coefficient
+            exponent = term.variables[variable]
+            coefficient = term.coefficient * exponent
+
+            if coefficient:
+                variables = term.variables - decrement
+                terms[variables] = Monomial._from_trusted(coefficient, variables)
+
+        return Polynomial._from_trusted(terms)
+
+    def divide(self, divisors, order=grlex):
+        """
+        Divides the polynomial by a list of polynomials
+        (or monomials, or numbers), with the generalized
+        division algorithm in the given monomial order (see
+        :func:`lex`, :func:`grlex` and :func:`grevlex`).
+
+        It returns a list with a quotient for each divisor
+        and the remainder, whose terms aren't divisible by the
+        greatest term of any divisor
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> p = x**2*y + x*y**2 + y**2
+        >>> p.divide([x*y - 1, y**2 - 1])
+        ([x + y, 1], x + y + 1)
+
+        The result depends on the order of the divisors
 
-        # if nothing is found
-        return 0
+        >>> p.divide([y**2 - 1, x*y - 1])
+        ([x + 1, x], 2x + 1)
+
+        For more informations, see :func:`ruffini.sparse.divide`.
+
+        :type divisors: list
+        :type order: function
+        :rtype: tuple
+        :raise: TypeError, ZeroDivisionError
+        """
+
+        polynomials = []
+        for divisor in divisors:
+            if isinstance(divisor, (Monomial, *NUMBERS)):
+                divisor = Polynomial(divisor)
+            elif not isinstance(divisor, Polynomial):
+                raise TypeError(f"Can't divide a polynomial by an object of type '{divisor.__class__.__name__}'")
+
+            if not divisor:
+                raise ZeroDivisionError("polynomial division by zero")
+
+            polynomials.append(divisor)
+
+        quotients, remainder = sparse.divide(list(self), polynomials, order)
+        return [Polynomial._from_trusted(q) for q in quotients], Polynomial._from_trusted(remainder)
+
+    def gcd(self, other):
+        """
+        Returns the greatest common divisor of
+        two polynomials (or a polynomial and a
+        monomial or a number)
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> (x**2 + 2*x + 1).gcd(x**2 - 1)
+        x + 1
+        >>> (6*x**2*y + 6*x*y).gcd(4*x*y**2 - 4*x*y)
+        2xy
+
+        The gcd is defined up to a constant factor: with integer
+        and rational coefficients, the result has integer coefficients
+        and its leading coefficient (in the :func:`lex` order) is
+        positive, otherwise the leading coefficient is 1
+
+        >>> (x/2 + Fraction(1, 2)).gcd(x**2 - 1)
+        x + 1
+        >>> from ruffini import GF
+        >>> (2*x**2 + 4*x + 2).change_ring(GF(7)).gcd(x**2 - 1)
+        x + 1
+
+        With integer and rational coefficients it uses the
+        modular algorithm, which doesn't suffer from the growth
+        of the coefficients (see :func:`ruffini.divisors.modular_gcd`);
+        in finite fields the Brown's algorithm (see
+        :func:`ruffini.divisors.brown_gcd`), otherwise the
+        subresultant remainder sequence (see
+        :func:`ruffini.divisors.subresultant_gcd`).
+
+        :type other: Polynomial, Monomial, int, float, Fraction, ModularInteger
+        :rtype: Polynomial
+        :raise: TypeError
+        """
+
+        if isinstance(other, (Monomial, *NUMBERS)):
+            other = Polynomial(other)
+        elif not isinstance(other, Polynomial):
+            raise TypeError(f"Can't calculate the gcd between a polynomial and an object of type '{other.__class__.__name__}'")
+
+        if not self or not other:
+            return (self or other)._normalize()
+
+        variables = tuple(sorted(set(self.variables).union(other.variables)))
+        ring = ring_of(*(term.coefficient for term in self), *(term.coefficient for term in other))
+
+        # integer and rational coefficients: the
+        # fractions are removed, then the modular
+        # algorithm can be used
+        if ring is ZZ or ring is QQ:
+            f = self._to_exponents(variables)
+            g = other._to_exponents(variables)
+
+            if ring is QQ:
+                f = divisors.integral(f)
+                g = divisors.integral(g)
+
+            if not variables:
+                return Polynomial(math_gcd(f[()], g[()]))
+
+            return Polynomial._from_exponents(divisors.modular_gcd(f, g), variables)
+
+        # finite fields: use the integers modulo p
+        if isinstance(ring, FiniteField) and variables:
+            f = {e: ring(c).value for e, c in self._to_exponents(variables).items()}
+            g = {e: ring(c).value for e, c in other._to_exponents(variables).items()}
+
+            result = divisors.brown_gcd(f, g, ring.modulus)
+            if result is not None:
+                return Polynomial._from_exponents({e: ring(c) for e, c in result.items()}, variables)
+
+        return self._subresultant_gcd(other, variables)._normalize()
 
     def factorize(self):
         """
@@ -145,6 +753,67 @@ class Polynomial(tuple):
 
         return factorize(self)
 
+    def _subresultant_gcd(self, other, variables):
+        """
+        Returns the gcd of two polynomials, with the
+        subresultant remainder sequence in the first variable
+        (see :func:`ruffini.divisors.subresultant_gcd`):
+        the coefficients are polynomials in the other
+        variables, whose gcd is computed recursively
+
+        :type other: Polynomial
+        :type variables: tuple
+        :rtype: Polynomial
+        """
+
+        if len(variables) <= 1:
+            variable = variables[0] if variables else None
+            gcd = math_gcd if self.ring is ZZ and other.ring is ZZ else lambda a, b: 1
+            result = divisors.subresultant_gcd(self._to_dense(), other._to_dense(), gcd)
+
+            return Polynomial._from_dense(result, variable)
+
+        variable = variables[0]
+        a = [Polynomial(c) for c in self.coefficients(variable)]
+        b = [Polynomial(c) for c in other.coefficients(variable)]
+        result = divisors.subresultant_gcd(a, b, Polynomial.gcd)
+
+        terms = []
+        for exponent, coefficient in enumerate(result):
+            for term in coefficient:
+                if exponent:
+                    term = Monomial._from_trusted(term.coefficient, term.variables + VariablesDict._from_trusted(((variable, exponent), )))
+                terms.append(term)
+
+        return Polynomial.sum(terms)
+
+    def _normalize(self):
+        """
+        Returns the polynomial divided by a constant,
+        so that the leading coefficient (in the :func:`lex`
+        order) is 1; if the coefficients are integers or
+        fractions, the result is the primitive polynomial
+        with integer coefficients and positive leading
+        coefficient (integer polynomials keep their content)
+
+        :rtype: Polynomial
+        """
+
+        if not self:
+            return self
+
+        ring = self.ring
+        leading = max(self, key=lambda t: lex(t.variables)).coefficient
+
+        if ring is ZZ:
+            return -self if leading < 0 else self
+
+        elif ring is QQ:
+            variables = self.variables
+            return Polynomial._from_exponents(divisors.integral(self._to_exponents(variables)), variables)
+
+        return self * divide_coefficients(1, leading)
+
     @property
     def zeros(self):
         """
@@ -172,29 +841,35 @@ class Polynomial(tuple):
         :raises: ValueError
         """
 
-        # Fetch variables and the constant term
-        constant_term = self.term_coefficient()
-
         # Raise a ValueError if there are more than one variable
         # or if there isn't a constant term
         if len(self.variables) != 1:
             raise ValueError("Can't calculate zeros for polynomials with more than a variable")
-        elif not constant_term:
-            raise ValueError("Can't calculate zeros for polynomials without a constant term")
 
-        variable = Variable(self.variables[0])
-        coefficient = self.term_coefficient(variable**self.degree)
+        coefficients = self._to_dense()
+        constant_term = coefficients[0]
+
+        if not constant_term:
+            raise ValueError("Can't calculate zeros for polynomials without a constant term")
 
         # Create a list of candidates
         constant_term_divs = {d for n in get_divisors(constant_term) for d in (+n, -n)}
-        coefficient_divs = get_divisors(coefficient)
+        coefficient_divs = get_divisors(coefficients[-1])
         candidates = {Fraction(a, b) for a in constant_term_divs for b in coefficient_divs}
 
-        # Try every candidate
+        # Try every candidate, evaluating the dense
+        # list of coefficients when it's worth it
         zeros = set()
+        variable = self.variables[0]
+        is_dense = self._is_dense()
 
         for candidate in candidates:
-            if self.eval({self.variables[0]: candidate}) == 0:
+            if is_dense:
+                value = dense.evaluate(coefficients, candidate)
+            else:
+                value = self.value({variable: candidate})
+
+            if not value:
                 zeros.add(candidate)
 
         return zeros
@@ -217,9 +892,213 @@ class Polynomial(tuple):
         if not values:
             values = kwargs
 
+        # if every variable has a numeric value, compute it directly
+        values = {v.lower(): values[v] for v in values}
+
+        if all(isinstance(values.get(v), NUMBERS) for v in self.variables):
+            # floats are converted, to keep the result exact
+            values = {v: Fraction(n) if isinstance(n, float) else n for v, n in values.items()}
+            return Polynomial(self.value(values))
+
         # eval each term of the polynomial, then return it
         return Polynomial([t.eval(values) for t in self])
 
+    def value(self, values=None, **kwargs):
+        """
+        Evaluates the polynomial when every variable has a
+        value, returning directly a number
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> p = 3*x**2 + 2*y - 1
+        >>> p.value(x=2, y=Fraction(1, 2))
+        12
+
+        Unlike :func:`Polynomial.eval`, it doesn't create any
+        monomial: the result is computed with the values'
+        own arithmetic (with the Horner's method, if the
+        polynomial has only a variable)
+
+        >>> p.value(x=0.5, y=1)
+        1.75
+
+        It raises a ValueError if a variable hasn't a value
+
+        >>> p.value(x=1)
+        Traceback (most recent call last):
+        ...
+        ValueError: Missing values for the variable 'y'
+
+        :type values: dict
+        :rtype: int, float, Fraction, ModularInteger
+        :raise: ValueError
+        """
+
+        # multiple initializations
+        if not values:
+            values = kwargs
+
+        values = {variable.lower(): values[variable] for variable in values}
+
+        for variable in self.variables:
+            if variable not in values:
+                raise ValueError(f"Missing values for the variable '{variable}'")
+
+        # use the Horner's method when possible
+        if self._is_dense():
+            return reduce_coefficient(dense.evaluate(self._to_dense(), values[self.variables[0]]))
+
+        # sum the terms, computing each power only once
+        powers = {}
+        result = 0
+
+        for term in self:
+            product = term.coefficient
+
+            for variable, exponent in term.variables.items():
+                power = powers.get((variable, exponent))
+                if power is None:
+                    power = powers[variable, exponent] = values[variable] ** exponent
+
+                product = product * power
+
+            result += product
+
+        return reduce_coefficient(result)
+
+    def compile(self):
+        """
+        Returns a function which evaluates the polynomial
+        with the Horner's scheme (see :mod:`ruffini.evaluation`):
+        it's much faster than :func:`Polynomial.eval` when the
+        same polynomial is evaluated many times.
+
+        The arguments of the function are the variables
+        of the polynomial, in alphabetical order
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> f = (3*x**2*y + 2*x*y + x + 5).compile()
+        >>> f(2, 3)
+        55
+        >>> f(x=2, y=3)
+        55
+
+        When every variable has a value, the result is
+        a number, computed with the values' own arithmetic
+
+        >>> f(0.5, 2)
+        9.0
+
+        otherwise, the result is the same of :func:`Polynomial.eval`
+
+        >>> f(x=2)
+        16y + 7
+
+        :rtype: function
+        """
+
+        variables = self.variables
+        terms = [(tuple(term.variables[v] for v in variables), term.coefficient) for term in self]
+
+        return compile_scheme(horner_scheme(terms, variables), variables, fallback=self.eval)
+
+    def eval_array(self, values=None, **kwargs):
+        """
+        Evaluates the polynomial in many points at once,
+        giving a NumPy array of values for each variable;
+        the arrays are broadcast toghether, like in the
+        NumPy's operations
+
+        >>> import numpy as np  # doctest: +SKIP
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> (3*x**2 + y).eval_array(x=np.array([1, 2, 3]), y=1)  # doctest: +SKIP
+        array([ 4, 13, 28])
+
+        The polynomial is evaluated with the Horner's scheme
+        (see :func:`Polynomial.compile`) on the whole arrays,
+        whose type decides the type of the result:
+
+        - integer arrays give integer results, as long as
+          the coefficients are integers; if the values could
+          overflow the 64-bit integers, they're Python's ints
+        - float arrays (or integer ones, with rational
+          coefficients) give float results
+        - object arrays give exact results, so they can
+          contain :class:`Fraction` and ModularIntegers
+
+        >>> from fractions import Fraction
+        >>> (x / 2 + 1).eval_array(x=np.array([1, 2], dtype=object))  # doctest: +SKIP
+        array([Fraction(3, 2), Fraction(2, 1)], dtype=object)
+
+        Every variable of the polynomial needs a value.
+
+        NumPy is an optional dependency: if it isn't
+        installed, an ImportError is raised.
+
+        :type values: dict
+        :rtype: numpy.ndarray
+        :raise: ImportError, ValueError
+        """
+
+        import numpy
+
+        # multiple initializations
+        if not values:
+            values = kwargs
+
+        arrays = {variable.lower(): numpy.asarray(values[variable]) for variable in values}
+
+        for variable in self.variables:
+            if variable not in arrays:
+                raise ValueError(f"Missing values for the variable '{variable}'")
+
+        shape = numpy.broadcast(*arrays.values()).shape if arrays else ()
+
+        # choose the type of the result
+        coefficients = [term.coefficient for term in self]
+        dtype = numpy.result_type(*arrays.values()) if arrays else numpy.dtype(object)
+
+        if dtype.kind in "biu" and all(c.__class__ is int for c in coefficients):
+            dtype = numpy.dtype(numpy.int64 if self._bound(arrays) < 2**63 else object)
+        elif dtype.kind in "biuf" and all(isinstance(c, (int, float, Fraction)) for c in coefficients):
+            dtype = numpy.dtype(numpy.float64) if dtype.kind != "f" else dtype
+            coefficients = [float(c) for c in coefficients]
+        else:
+            dtype = numpy.dtype(object)
+
+        # evaluate the Horner's scheme on the arrays
+        variables = self.variables
+        terms = [(tuple(term.variables[v] for v in variables), c) for term, c in zip(self, coefficients)]
+        function = compile_scheme(horner_scheme(terms, variables), variables)
+
+        result = function(*(arrays[variable].astype(dtype) for variable in variables))
+
+        return numpy.broadcast_to(numpy.asarray(result, dtype=dtype), shape).copy()
+
+    def _bound(self, arrays):
+        """
+        Returns a bound on the absolute value of the
+        polynomial, when its variables are evaluated
+        in the given integer arrays: it also bounds
+        every step of the Horner's scheme.
+
+        :type arrays: dict
+        :rtype: int
+        """
+
+        maxima = {v: max(-int(a.min()), int(a.max())) if a.size else 0 for v, a in arrays.items()}
+        bound = 0
+
+        for term in self:
+            value = abs(term.coefficient)
+            for variable, exponent in term.variables.items():
+                value *= maxima[variable] ** exponent
+            bound += value
+
+        return bound
+
     ### Operations Methods ###
 
     def __add__(self, other):
@@ -245,14 +1124,14 @@ class Polynomial(tuple):
         :raise: TypeError
         """
 
-        if isinstance(other, (int, float, Fraction)):
+        if isinstance(other, NUMBERS):
             other = Monomial(other)
 
-        if isinstance(other, Polynomial):
-            return Polynomial(*self, *other)
+        if isinstance(other, Monomial):
+            other = Polynomial._from_trusted({other.variables: other} if other.coefficient else {})
 
-        elif isinstance(other, Monomial):
-            return Polynomial(*self, other)
+        if isinstance(other, Polynomial):
+            return self._merge(other)
 
         else:
             raise TypeError(f"unsupported operand type(s) for +: 'Polynomial' and '{other.__class__.__name__}'")
@@ -281,14 +1160,14 @@ class Polynomial(tuple):
         :raise: TypeError
         """
 
-        if isinstance(other, (int, float, Fraction)):
+        if isinstance(other, NUMBERS):
             other = Monomial(other)
 
-        if isinstance(other, Polynomial):
-            return Polynomial(*self, *(-other))
+        if isinstance(other, Monomial):
+            other = Polynomial._from_trusted({other.variables: other} if other.coefficient else {})
 
-        elif isinstance(other, Monomial):
-            return Polynomial(*self, -other)
+        if isinstance(other, Polynomial):
+            return self._merge(other, -1)
 
         else:
             raise TypeError(f"unsupported operand type(s) for -: 'Polynomial' and '{other.__class__.__name__}'")
@@ -317,15 +1196,216 @@ class Polynomial(tuple):
         :raise: TypeError
         """
 
-        if isinstance(other, (Monomial, int, float, Fraction)):
+        if isinstance(other, (Monomial, *NUMBERS)):
             return Polynomial([t*other for t in self])
 
         elif isinstance(other, Polynomial):
+            self, other = self._to_common_ring(other)
+
+            # big univariate polynomials are multiplied as dense lists
+            if (len(self) + len(other) >= DENSE_THRESHOLD and self.variables == other.variables
+                    and self._is_dense() and other._is_dense()):
+                product = dense.multiply(self._to_dense(), other._to_dense())
+                return Polynomial._from_dense(product, self.variables[0])
+
+            # dense-ish products in a few variables are made univariate
+            if self and other and len(self) + len(other) >= DENSE_THRESHOLD:
+                variables = tuple(sorted(set(self.variables).union(other.variables)))
+
+                if len(variables) <= KRONECKER_VARIABLES:
+                    bases = dense.kronecker_bases(self, other, variables)
+                    size = 1
+                    for base in bases:
+                        size *= base
+
+                    if size <= len(self) * len(other):
+                        return Polynomial._from_trusted(dense.kronecker_product(self, other, variables, bases))
+
+            # big sparse products are merged with a heap
+            if len(self) * len(other) >= HEAP_THRESHOLD:
+                return Polynomial._from_trusted(sparse.heap_product(self, other))
+
             return Polynomial([a*b for a in self for b in other])
 
         else:
             raise TypeError(f"unsupported operand type(s) for *: 'Polynomial' and '{other.__class__.__name__}'")
 
+    def __divmod__(self, other):
+        """
+        Divides the polynomial by another polynomial, a
+        monomial or a number, returning the quotient
+        and the remainder
+
+        >>> x = Variable('x')
+        >>> divmod(x**3 - 2*x + 5, x - 2)
+        (x**2 + 2x + 2, 9)
+        >>> divmod(3*x**2 + 1, 2*x)
+        (3/2x, 1)
+
+        If the polynomials have only a variable, the
+        long division is used (see :func:`ruffini.dense.divide`),
+        otherwise the generalized division in the `grlex` order
+        (see :func:`Polynomial.divide`)
+
+        >>> y = Variable('y')
+        >>> divmod(x**2*y + y**3, x*y + 1)
+        (x, y**3 - x)
+
+        It raises a ZeroDivisionError if `other` is null
+
+        >>> divmod(x + 1, 0)
+        Traceback (most recent call last):
+        ...
+        ZeroDivisionError: polynomial division by zero
+
+        :type other: Polynomial, Monomial, int, float, Fraction
+        :rtype: tuple
+        :raise: TypeError, ZeroDivisionError
+        """
+
+        if isinstance(other, (Monomial, *NUMBERS)):
+            other = Polynomial(other)
+        elif not isinstance(other, Polynomial):
+            raise TypeError(f"unsupported operand type(s) for divmod(): 'Polynomial' and '{other.__class__.__name__}'")
+
+        if not other:
+            raise ZeroDivisionError("polynomial division by zero")
+
+        # univariate polynomials
+        variables = set(self.variables).union(other.variables)
+
+        if len(variables) <= 1:
+            variable = variables.pop() if variables else None
+            quotient, remainder = dense.divide(self._to_dense(), other._to_dense())
+            return Polynomial._from_dense(quotient, variable), Polynomial._from_dense(remainder, variable)
+
+        (quotient, ), remainder = self.divide([other])
+        return quotient, remainder
+
+    def __floordiv__(self, other):
+        """
+        Returns the quotient of the division of the polynomial
+        by another polynomial, a monomial or a number
+
+        >>> x = Variable('x')
+        >>> (x**2 - 1) // (x + 1)
+        x - 1
+
+        For more informations, see :func:`Polynomial.__divmod__`.
+
+        :type other: Polynomial, Monomial, int, float, Fraction
+        :rtype: Polynomial
+        :raise: TypeError, ZeroDivisionError
+        """
+
+        try:
+            return divmod(self, other)[0]
+        except TypeError:
+            raise TypeError(f"unsupported operand type(s) for //: 'Polynomial' and '{other.__class__.__name__}'")
+
+    def __mod__(self, other):
+        """
+        Returns the remainder of the division of the polynomial
+        by another polynomial, a monomial or a number
+
+        >>> x = Variable('x')
+        >>> (x**2 + 1) % (x + 1)
+        2
+
+        For more informations, see :func:`Polynomial.__divmod__`.
+
+        :type other: Polynomial, Monomial, int, float, Fraction
+        :rtype: Polynomial
+        :raise: TypeError, ZeroDivisionError
+        """
+
+        try:
+            return divmod(self, other)[1]
+        except TypeError:
+            raise TypeError(f"unsupported operand type(s) for %: 'Polynomial' and '{other.__class__.__name__}'")
+
+    def __pow__(self, exp):
+        """
+        Raises a polynomial to a given power
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> (x + y) ** 3
+        x**3 + 3x**2y + 3xy**2 + y**3
+
+        If the polynomial has only a variable,
+        the J.C.P. Miller's recurrence is used
+        (see :func:`ruffini.dense.power`)
+
+        >>> (2*x - 1) ** 4
+        16x**4 - 32x**3 + 24x**2 - 8x + 1
+
+        If it has just a few terms, the result is computed with
+        the multinomial theorem (see :func:`ruffini.sparse.multinomial_power`),
+        otherwise with repeated squaring.
+
+        If the exponent is 0, the result will be 1
+
+        >>> (x + y) ** 0
+        1
+
+        It raises a `ValueError` if the exponent is negative
+        and a `TypeError` if it isn't an integer
+
+        >>> (x + y) ** (-1)
+        Traceback (most recent call last):
+        ...
+        ValueError: Exponent can't be negative
+        >>> (x + y) ** 0.5
+        Traceback (most recent call last):
+        ...
+        TypeError: unsupported operand type(s) for ** or pow(): 'Polynomial' and 'float'
+
+        :type exp: int
+        :rtype: Polynomial
+        :raise: ValueError, TypeError
+        """
+
+        # check the exponent
+        if not isinstance(exp, int):
+            raise TypeError(f"unsupported operand type(s) for ** or pow(): 'Polynomial' and '{exp.__class__.__name__}'")
+        elif exp < 0:
+            raise ValueError("Exponent can't be negative")
+
+        if not exp:
+            return Polynomial(1)
+        elif exp == 1 or not self:
+            return self
+        elif len(self) == 1:
+            return Polynomial(self[0] ** exp)
+
+        # univariate polynomials (the recurrence divides the
+        # coefficients, so it can't be used in finite fields)
+        if len(self.variables) == 1 and not isinstance(self.ring, FiniteField):
+            return Polynomial._from_dense(dense.power(self._to_dense(), exp), self.variables[0])
+
+        # count the terms of the multinomial expansion
+        expansion = 1
+        for k in range(1, len(self)):
+            expansion = expansion * (exp + k) // k
+
+        if expansion <= MULTINOMIAL_THRESHOLD:
+            return Polynomial._from_trusted(sparse.multinomial_power(list(self), exp))
+
+        # repeated squaring
+        result = None
+        base = self
+
+        while exp:
+            if exp & 1:
+                result = base if result is None else result * base
+
+            exp >>= 1
+            if exp:
+                base = base * base
+
+        return result
+
     ### Reverse Operations Methods ###
 
     def __radd__(self, other):
@@ -411,6 +1491,10 @@ class Polynomial(tuple):
         :rtype: str
         """
 
+        # the null polynomial
+        if not self:
+            return '0'
+
         result = str(self[0])
         for term in self[1:]:
             if term.coefficient == abs(term.coefficient):  # positive
@@ -463,19 +1547,62 @@ class Polynomial(tuple):
         >>> Polynomial(Monomial(7)) == 7
         True
 
+        The null polynomial is equal to 0
+
+        >>> Polynomial() == 0
+        True
+
         In any other case, the result will be False.
 
         >>> Polynomial() == {1, 2, 3}
         False
 
+        The terms are compared one by one, looking them
+        up by their variables, so the order doesn't matter.
+
         :type other: Polynomial, Monomial, int, float
         :rtype: bool
         """
 
-        try:
-            return hash(self) == hash(other)
-        except TypeError:
-            return False
+        if self is other:
+            return True
+
+        elif isinstance(other, Polynomial):
+            if len(self) != len(other):
+                return False
+
+            terms = other._terms
+            for term in self:
+                similar = terms.get(term.variables)
+                if similar is None or similar.coefficient != term.coefficient:
+                    return False
+
+            return True
+
+        elif isinstance(other, (Monomial, *NUMBERS)):
+            if not self:
+                return other == 0
+
+            return len(self) == 1 and self[0] == other
+
+        return False
+
+    def __ne__(self, other):
+        """
+        Check if two polynomials are different
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> x + y != y + x
+        False
+
+        For more informations, see :func:`Polynomial.__eq__`.
+
+        :type other: Polynomial, Monomial, int, float
+        :rtype: bool
+        """
+
+        return not self == other
 
     def __neg__(self):
         """
@@ -487,14 +1614,16 @@ class Polynomial(tuple):
 
         :rtype: Polynomial
         """
-        return Polynomial([-m for m in self])
+        return Polynomial._from_trusted({t.variables: -t for t in self})._inherit(self)
 
     def __hash__(self):
         """
         Return the hash for the Polynomial
 
-        The hash for 8xy + 2, for example, is equal
-        to the hash of ((8, ('x', 1), ('y', 1)), 2).
+        The hash for 8xy + 2, for example, is equal to
+        the hash of `frozenset({8xy, 2})`, so it doesn't
+        depend on the order of the terms; it's computed
+        only once, then it's stored.
 
         If the polynomial has only a term, its hash
         will be equal to the hash of that term
@@ -511,7 +1640,177 @@ class Polynomial(tuple):
         :rtype: int
         """
 
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
         if len(self) == 1:
-            return hash(self[0])
+            self._hash = hash(self[0])
+        elif not self:
+            self._hash = hash(0)
+        else:
+            self._hash = hash(frozenset(self))
+
+        return self._hash
+
+
+class PolynomialBuilder:
+    """
+    A PolynomialBuilder is a mutable sum of terms,
+    which becomes a :class:`Polynomial` when it's complete.
+
+    Since polynomials are immutable, adding a term to a
+    polynomial creates a new one, copying all its terms:
+    summing many terms one by one is slow. A builder,
+    instead, sums the terms in place
+
+    >>> x = Variable('x')
+    >>> builder = PolynomialBuilder()
+    >>> for n in range(4):
+    ...     builder.add_term(Monomial(n + 1, x=n))
+    >>> builder += 3*x - 1
+    >>> builder.build()
+    5x + 3x**2 + 4x**3
+
+    The builder can still be used after :func:`PolynomialBuilder.build`.
+    """
+
+    __slots__ = ("_coefficients", )
+
+    def __init__(self, terms=()):
+        """
+        Initialize the builder, optionally
+        with some terms or polynomials
+
+        >>> PolynomialBuilder([Monomial(2, x=1), 3]).build()
+        2x + 3
+
+        :type terms: list
+        :raise: TypeError
+        """
+
+        self._coefficients = {}
+
+        for term in terms:
+            self.add_polynomial(term)
+
+    def add_term(self, term):
+        """
+        Adds a monomial (or a number) to the sum
+
+        >>> builder = PolynomialBuilder()
+        >>> builder.add_term(Monomial(2, y=1))
+        >>> builder.add_term(7)
+        >>> builder.build()
+        2y + 7
+
+        :type term: Monomial, int, float, Fraction, ModularInteger
+        :raise: TypeError
+        """
+
+        if isinstance(term, NUMBERS):
+            term = Monomial(term)
+        elif not isinstance(term, Monomial):
+            raise TypeError(f"{term} is not a valid term")
+
+        coefficients = self._coefficients
+        coefficients[term.variables] = coefficients.get(term.variables, 0) + term.coefficient
+
+    def add_polynomial(self, polynomial):
+        """
+        Adds all the terms of a polynomial to the sum
+
+        >>> x = Variable('x')
+        >>> builder = PolynomialBuilder()
+        >>> builder.add_polynomial(x**2 + 1)
+        >>> builder.add_polynomial(x - 1)
+        >>> builder.build()
+        x**2 + x
+
+        Monomials and numbers are accepted, too.
+
+        :type polynomial: Polynomial, Monomial, int, float, Fraction, ModularInteger
+        :raise: TypeError
+        """
+
+        if not isinstance(polynomial, Polynomial):
+            return self.add_term(polynomial)
+
+        coefficients = self._coefficients
+        for term in polynomial:
+            coefficients[term.variables] = coefficients.get(term.variables, 0) + term.coefficient
+
+    def add_product(self, a, b):
+        """
+        Adds the product of two polynomials (or
+        monomials, or numbers) to the sum, without
+        creating any intermediate polynomial
+
+        >>> x = Variable('x')
+        >>> y = Variable('y')
+        >>> builder = PolynomialBuilder([x**2])
+        >>> builder.add_product(x + y, x - y)
+        >>> builder.build()
+        2x**2 - y**2
+
+        :type a: Polynomial, Monomial, int, float, Fraction, ModularInteger
+        :type b: Polynomial, Monomial, int, float, Fraction, ModularInteger
+        :raise: TypeError
+        """
+
+        a = a if isinstance(a, Polynomial) else Polynomial(a)
+        b = b if isinstance(b, Polynomial) else Polynomial(b)
+
+        coefficients = self._coefficients
+        for s in a:
+            for t in b:
+                variables = s.variables + t.variables
+                coefficients[variables] = coefficients.get(variables, 0) + s.coefficient * t.coefficient
+
+    def __iadd__(self, other):
+        """
+        Adds a polynomial, a monomial or a
+        number to the sum, in place
+
+        For more informations, see :func:`PolynomialBuilder.add_polynomial`.
+
+        :type other: Polynomial, Monomial, int, float, Fraction, ModularInteger
+        :rtype: PolynomialBuilder
+        :raise: TypeError
+        """
+
+        self.add_polynomial(other)
+        return self
+
+    def build(self):
+        """
+        Returns the sum as a :class:`Polynomial`
+
+        >>> PolynomialBuilder([Monomial(3, x=1), Monomial(-3, x=1)]).build()
+        0
+
+        If a coefficient is in a finite field, all the
+        others are converted into that field
+
+        >>> from ruffini import GF
+        >>> PolynomialBuilder([Monomial(4, x=1), Monomial(GF(5)(1)), 3]).build()
+        -x - 1
+
+        :rtype: Polynomial
+        """
+
+        coefficients = self._coefficients
+
+        # The elements of a finite field can't be mixed
+        # with other numbers, so they set the ring
+        if any(isinstance(c, ModularInteger) for c in coefficients.values()):
+            ring = ring_of(*coefficients.values())
+            coefficients = {v: ring(c) for v, c in coefficients.items()}
+
+        terms = {}
+        for variables, coefficient in coefficients.items():
+            if coefficient:
+                terms[variables] = Monomial._from_trusted(coefficient, variables)
 
-        return hash(tuple(sorted(self, key=str)))
+        return Polynomial._from_trusted(terms)
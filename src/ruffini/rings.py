@@ -0,0 +1,707 @@
+from abc import ABC, abstractmethod
+from fractions import Fraction
+from numbers import Rational
+
+
+def is_prime(n):
+    """
+    Checks if a number is prime, using a deterministic
+    version of the Miller-Rabin test (which is exact
+    for every number lower than 3.3 * 10**24)
+
+    >>> is_prime(7), is_prime(2**61 - 1)
+    (True, True)
+    >>> is_prime(1), is_prime(91)
+    (False, False)
+
+    :type n: int
+    :rtype: bool
+    """
+
+    if n < 2:
+        return False
+
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+    # Check the small divisors
+    for base in bases:
+        if not n % base:
+            return n == base
+
+    # Write n - 1 as d * 2**s
+    d, s = n - 1, 0
+    while not d % 2:
+        d, s = d // 2, s + 1
+
+    # Look for a witness of compositeness
+    for base in bases:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+def inverse(value, modulus):
+    """
+    Returns the inverse of `value` modulo `modulus`,
+    using the extended euclidean algorithm
+
+    >>> inverse(3, 7)
+    5
+
+    It raises a ZeroDivisionError if the
+    inverse doesn't exist
+
+    >>> inverse(14, 7)
+    Traceback (most recent call last):
+    ...
+    ZeroDivisionError: 14 has no inverse modulo 7
+
+    :type value: int
+    :type modulus: int
+    :rtype: int
+    :raise: ZeroDivisionError
+    """
+
+    a, b = value % modulus, modulus
+    x, y = 1, 0
+
+    while b:
+        q = a // b
+        a, b = b, a - q * b
+        x, y = y, x - q * y
+
+    if a != 1:
+        raise ZeroDivisionError(f"{value} has no inverse modulo {modulus}")
+
+    return x % modulus
+
+
+class ModularInteger:
+    """
+    A ModularInteger is an element of a finite field GF(p):
+    an integer where all the operations are done modulo `p`.
+
+    ModularIntegers are usually created by the ring they belong to
+
+    >>> GF(7)(10)
+    3
+
+    They're displayed with their symmetric representation,
+    between -p/2 and p/2
+
+    >>> GF(7)(5)
+    -2
+
+    They can be added, subtracted, multiplied and divided
+    together and with integers and fractions
+
+    >>> GF(7)(3) * 5
+    1
+    >>> GF(7)(1) / 3
+    -2
+    """
+
+    __slots__ = ("value", "modulus")
+
+    def __init__(self, value, modulus):
+        """
+        Creates a new ModularInteger, given its value
+        and the modulus (which must be a prime number).
+
+        >>> ModularInteger(Fraction(1, 2), 7)
+        -3
+
+        :type value: int, Fraction
+        :type modulus: int
+        :raise: TypeError, ZeroDivisionError
+        """
+
+        if isinstance(value, int):
+            self.value = value % modulus
+        elif isinstance(value, Rational):
+            self.value = value.numerator * inverse(value.denominator, modulus) % modulus
+        else:
+            raise TypeError(f"can't convert {value.__class__.__name__} to a ModularInteger")
+
+        self.modulus = modulus
+
+    ### Utility Methods ###
+
+    def _coerce(self, other):
+        """
+        Returns the value of `other` in the same field
+        of this ModularInteger, or None if it's not possible.
+
+        :type other: ModularInteger, int, Fraction
+        :rtype: int, None
+        :raise: ValueError
+        """
+
+        if isinstance(other, ModularInteger):
+            if other.modulus != self.modulus:
+                raise ValueError("can't operate on elements of different fields")
+            return other.value
+
+        elif isinstance(other, Rational):
+            return ModularInteger(other, self.modulus).value
+
+        return None
+
+    def symmetric(self):
+        """
+        Returns the symmetric representation of the
+        ModularInteger, as an integer between -p/2 and p/2
+
+        >>> GF(7)(6).symmetric()
+        -1
+
+        :rtype: int
+        """
+
+        if self.value > self.modulus // 2:
+            return self.value - self.modulus
+
+        return self.value
+
+    ### Operations Methods ###
+
+    def __add__(self, other):
+        """
+        Sums two elements of the field
+
+        >>> GF(5)(3) + GF(5)(4)
+        2
+
+        :type other: ModularInteger, int, Fraction
+        :rtype: ModularInteger
+        """
+
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+
+        return ModularInteger(self.value + other, self.modulus)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts two elements of the field
+
+        >>> GF(5)(3) - 4
+        -1
+
+        :type other: ModularInteger, int, Fraction
+        :rtype: ModularInteger
+        """
+
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+
+        return ModularInteger(self.value - other, self.modulus)
+
+    def __rsub__(self, other):
+        """
+        Reverse for :func:`ModularInteger.__sub__`
+
+        >>> 4 - GF(5)(3)
+        1
+
+        :type other: int, Fraction
+        :rtype: ModularInteger
+        """
+
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+
+        return ModularInteger(other - self.value, self.modulus)
+
+    def __mul__(self, other):
+        """
+        Multiplies two elements of the field
+
+        >>> GF(5)(3) * GF(5)(4)
+        2
+
+        :type other: ModularInteger, int, Fraction
+        :rtype: ModularInteger
+        """
+
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+
+        return ModularInteger(self.value * other, self.modulus)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Divides two elements of the field
+
+        >>> GF(5)(3) / GF(5)(4)
+        2
+
+        It raises a ZeroDivisionError if `other` is zero
+
+        >>> GF(5)(3) / 5
+        Traceback (most recent call last):
+        ...
+        ZeroDivisionError: 0 has no inverse modulo 5
+
+        :type other: ModularInteger, int, Fraction
+        :rtype: ModularInteger
+        :raise: ZeroDivisionError
+        """
+
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+
+        return ModularInteger(self.value * inverse(other, self.modulus), self.modulus)
+
+    def __rtruediv__(self, other):
+        """
+        Reverse for :func:`ModularInteger.__truediv__`
+
+        >>> 1 / GF(5)(3)
+        2
+
+        :type other: int, Fraction
+        :rtype: ModularInteger
+        :raise: ZeroDivisionError
+        """
+
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+
+        return ModularInteger(other * inverse(self.value, self.modulus), self.modulus)
+
+    def __pow__(self, exp):
+        """
+        Raises the element to a given (integer) power
+
+        >>> GF(7)(3) ** 3
+        -1
+        >>> GF(7)(3) ** -1
+        -2
+
+        :type exp: int
+        :rtype: ModularInteger
+        :raise: ZeroDivisionError
+        """
+
+        if not isinstance(exp, int):
+            return NotImplemented
+
+        if exp < 0:
+            return ModularInteger(pow(inverse(self.value, self.modulus), -exp, self.modulus), self.modulus)
+
+        return ModularInteger(pow(self.value, exp, self.modulus), self.modulus)
+
+    def __neg__(self):
+        """
+        Returns the opposite of the element
+
+        >>> -GF(7)(3)
+        -3
+
+        :rtype: ModularInteger
+        """
+
+        return ModularInteger(-self.value, self.modulus)
+
+    def __abs__(self):
+        """
+        Returns the element whose symmetric
+        representation is the absolute value
+        of this one's
+
+        >>> abs(GF(7)(6))
+        1
+
+        :rtype: ModularInteger
+        """
+
+        return ModularInteger(abs(self.symmetric()), self.modulus)
+
+    ### Magic Methods ###
+
+    def __str__(self):
+        """
+        Returns the symmetric representation
+        of the element as a string
+
+        >>> str(GF(7)(6))
+        '-1'
+
+        :rtype: str
+        """
+
+        return str(self.symmetric())
+
+    def __repr__(self):
+        """
+        Returns the element as a string.
+
+        For more informations, see :func:`ModularInteger.__str__()`.
+
+        :rtype: str
+        """
+
+        return self.__str__()
+
+    def __eq__(self, other):
+        """
+        Checks if two elements of the same field are congruent
+
+        >>> GF(7)(6) == GF(7)(13)
+        True
+        >>> GF(7)(6) == GF(5)(1)
+        False
+
+        An element is equal to a number only if it's
+        its symmetric representation (so that equal
+        objects have the same hash)
+
+        >>> GF(7)(6) == -1
+        True
+        >>> GF(7)(6) == 6
+        False
+
+        :type other: ModularInteger, int, Fraction
+        :rtype: bool
+        """
+
+        if isinstance(other, ModularInteger):
+            return self.modulus == other.modulus and self.value == other.value
+        elif isinstance(other, Rational):
+            return self.symmetric() == other
+
+        return NotImplemented
+
+    def __hash__(self):
+        """
+        Returns the hash of the symmetric representation
+        of the element, which is the only number
+        equal to it
+
+        >>> hash(GF(7)(6)) == hash(-1)
+        True
+
+        :rtype: int
+        """
+
+        return hash(self.symmetric())
+
+    def __bool__(self):
+        """
+        Returns False if the element is zero
+
+        >>> bool(GF(7)(14))
+        False
+
+        :rtype: bool
+        """
+
+        return bool(self.value)
+
+
+class Ring(ABC):
+    """
+    A Ring is the set of numbers where the coefficients
+    of monomials and polynomials live.
+
+    The available rings are:
+
+    - `ZZ`, the integers
+    - `QQ`, the rational numbers (the default one)
+    - `RR`, the real numbers, approximated with floats
+    - `GF(p)`, the finite field of integers modulo a prime `p`
+
+    Calling a ring converts a number into one of its elements
+
+    >>> QQ(0.5)
+    Fraction(1, 2)
+    >>> RR(Fraction(1, 2))
+    0.5
+    """
+
+    # Whether the elements are represented exactly
+    exact = True
+
+    @abstractmethod
+    def __call__(self, value):
+        """
+        Converts `value` into an element of the ring;
+        every ring must implement it.
+
+        :type value: int, float, Fraction, ModularInteger
+        :raise: TypeError, ValueError
+        """
+
+    def __contains__(self, value):
+        """
+        Checks if `value` can be converted
+        into an element of the ring
+
+        >>> Fraction(1, 2) in ZZ
+        False
+        >>> Fraction(4, 2) in ZZ
+        True
+
+        :type value: int, float, Fraction, ModularInteger
+        :rtype: bool
+        """
+
+        try:
+            self(value)
+            return True
+        except (TypeError, ValueError, ZeroDivisionError):
+            return False
+
+    def __repr__(self):
+        """
+        Returns the name of the ring
+
+        >>> QQ
+        QQ
+
+        :rtype: str
+        """
+
+        return self.__str__()
+
+
+class IntegerRing(Ring):
+    """
+    The ring of the integers, ZZ
+    """
+
+    def __call__(self, value):
+        """
+        Converts a whole number into an int
+
+        >>> ZZ(3.0)
+        3
+
+        It raises a ValueError if the number isn't whole
+
+        >>> ZZ(3.5)
+        Traceback (most recent call last):
+        ...
+        ValueError: 3.5 is not in ZZ
+
+        :type value: int, float, Fraction
+        :rtype: int
+        :raise: TypeError, ValueError
+        """
+
+        if isinstance(value, int):
+            return value
+        elif not isinstance(value, (float, Rational)):
+            raise TypeError(f"can't convert {value.__class__.__name__} to an element of ZZ")
+
+        converted = Fraction(value)
+        if converted.denominator != 1:
+            raise ValueError(f"{value} is not in ZZ")
+
+        return converted.numerator
+
+    def __str__(self):
+        return "ZZ"
+
+
+class RationalField(Ring):
+    """
+    The field of the rational numbers, QQ
+    """
+
+    def __call__(self, value):
+        """
+        Converts a number into an int (if it's
+        whole) or into a Fraction
+
+        >>> QQ(3.0), QQ(0.25)
+        (3, Fraction(1, 4))
+
+        :type value: int, float, Fraction
+        :rtype: int, Fraction
+        :raise: TypeError
+        """
+
+        if isinstance(value, int):
+            return value
+        elif not isinstance(value, (float, Rational)):
+            raise TypeError(f"can't convert {value.__class__.__name__} to an element of QQ")
+
+        value = Fraction(value)
+        return value.numerator if value.denominator == 1 else value
+
+    def __str__(self):
+        return "QQ"
+
+
+class RealField(Ring):
+    """
+    The field of the real numbers, RR.
+    Its elements are approximated with floats,
+    so the results are inexact.
+    """
+
+    exact = False
+
+    def __call__(self, value):
+        """
+        Converts a number into a float
+
+        >>> RR(Fraction(1, 4))
+        0.25
+
+        :type value: int, float, Fraction
+        :rtype: float
+        :raise: TypeError
+        """
+
+        if not isinstance(value, (float, Rational)):
+            raise TypeError(f"can't convert {value.__class__.__name__} to an element of RR")
+
+        return float(value)
+
+    def __str__(self):
+        return "RR"
+
+
+class FiniteField(Ring):
+    """
+    The finite field of the integers modulo a prime number, GF(p)
+    """
+
+    def __init__(self, modulus):
+        """
+        Creates the field of the integers modulo `modulus`,
+        which must be a prime number
+
+        >>> GF(4)
+        Traceback (most recent call last):
+        ...
+        ValueError: the modulus of a finite field must be prime
+
+        :type modulus: int
+        :raise: TypeError, ValueError
+        """
+
+        if not isinstance(modulus, int):
+            raise TypeError("the modulus of a finite field must be int")
+        elif not is_prime(modulus):
+            raise ValueError("the modulus of a finite field must be prime")
+
+        self.modulus = modulus
+
+    def __call__(self, value):
+        """
+        Converts a number into an element of the field
+
+        >>> GF(5)(Fraction(1, 2))
+        -2
+
+        :type value: int, float, Fraction, ModularInteger
+        :rtype: ModularInteger
+        :raise: TypeError, ValueError, ZeroDivisionError
+        """
+
+        if isinstance(value, ModularInteger):
+            if value.modulus != self.modulus:
+                raise ValueError("can't operate on elements of different fields")
+            return value
+
+        elif isinstance(value, float):
+            value = Fraction(value)
+
+        return ModularInteger(value, self.modulus)
+
+    def __eq__(self, other):
+        """
+        Checks if two finite fields are the same
+
+        >>> GF(7) == GF(7)
+        True
+
+        :type other: FiniteField
+        :rtype: bool
+        """
+
+        return isinstance(other, FiniteField) and self.modulus == other.modulus
+
+    def __hash__(self):
+        return hash(("GF", self.modulus))
+
+    def __str__(self):
+        return f"GF({self.modulus})"
+
+
+ZZ = IntegerRing()
+QQ = RationalField()
+RR = RealField()
+
+def GF(modulus):
+    """
+    Returns the finite field of the integers
+    modulo `modulus`, which must be prime
+
+    >>> GF(7)
+    GF(7)
+    >>> GF(7)(9)
+    2
+
+    :type modulus: int
+    :rtype: FiniteField
+    :raise: TypeError, ValueError
+    """
+
+    return FiniteField(modulus)
+
+def ring_of(*coefficients):
+    """
+    Returns the smallest ring which contains
+    all the given coefficients
+
+    >>> ring_of(2, 3)
+    ZZ
+    >>> ring_of(2, Fraction(1, 3))
+    QQ
+    >>> ring_of(Fraction(1, 3), 0.5)
+    RR
+    >>> ring_of(GF(5)(3), 2)
+    GF(5)
+
+    :type *coefficients: int, float, Fraction, ModularInteger
+    :rtype: Ring
+    """
+
+    ring = ZZ
+
+    for coefficient in coefficients:
+        if isinstance(coefficient, ModularInteger):
+            return GF(coefficient.modulus)
+        elif isinstance(coefficient, float):
+            ring = RR
+        elif ring is ZZ and not isinstance(coefficient, int):
+            ring = QQ
+
+    return ring
+
+
+# Every type that can be a coefficient
+NUMBERS = (int, float, Fraction, ModularInteger)
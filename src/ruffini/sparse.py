@@ -0,0 +1,224 @@
+"""
+Multiplication and division of sparse polynomials.
+
+The product of two polynomials with `n` and `m` terms
+is computed by merging `n` sorted sequences with a heap
+(Johnson's algorithm): the terms are generated in a
+monomial order, so the similar ones are summed as soon as
+they appear and only the terms of the result are stored.
+
+The division works in the same way, taking every
+time the greatest term of the dividend from a heap.
+
+These functions are used by :class:`Polynomial` when
+its terms can't be handled as a dense list.
+"""
+
+from heapq import heappush, heappop
+
+from .variables import VariablesDict, grlex
+from .monomials import Monomial, divide_coefficients
+
+
+class _Descending:
+    """
+    Wraps a key, so that the greatest one is
+    the first taken from a heap
+    """
+
+    __slots__ = ("key", "variables")
+
+    def __init__(self, key, variables):
+        self.key = key
+        self.variables = variables
+
+    def __lt__(self, other):
+        return self.key > other.key
+
+
+def heap_product(a, b, order=grlex):
+    """
+    Multiplies two lists of terms, returning the terms
+    of the product as a dictionary indexed by their
+    variables, from the greatest to the lowest
+    in the given monomial order
+
+    >>> from ruffini import Variable
+    >>> x = Variable('x')
+    >>> y = Variable('y')
+    >>> list(heap_product([x, y], [x, -y]).values())
+    [x**2, -y**2]
+
+    :type a: list
+    :type b: list
+    :type order: function
+    :rtype: dict
+    """
+
+    if not a or not b:
+        return {}
+
+    # sort the terms from the lowest
+    a = sorted(a, key=lambda term: order(term.variables))
+    b = sorted(b, key=lambda term: order(term.variables))
+
+    # the heap contains at most a term of the product
+    # for every term of a: when a_i * b_j is taken,
+    # a_i * b_(j+1) is added (and a_(i+1) * b_0 if j is 0)
+    variables = a[0].variables + b[0].variables
+    heap = [(order(variables), 0, 0, variables)]
+    terms = []
+
+    last = None
+    coefficient = 0
+
+    while heap:
+        _, i, j, variables = heappop(heap)
+
+        if variables is not last:
+            if coefficient:
+                terms.append(Monomial._from_trusted(coefficient, last))
+            last = variables
+            coefficient = 0
+
+        coefficient += a[i].coefficient * b[j].coefficient
+
+        if not j and i + 1 < len(a):
+            following = a[i + 1].variables + b[0].variables
+            heappush(heap, (order(following), i + 1, 0, following))
+
+        if j + 1 < len(b):
+            following = a[i].variables + b[j + 1].variables
+            heappush(heap, (order(following), i, j + 1, following))
+
+    if coefficient:
+        terms.append(Monomial._from_trusted(coefficient, last))
+
+    return {term.variables: term for term in reversed(terms)}
+
+def multinomial_power(terms, exp):
+    """
+    Raises a sum of terms to a power with the multinomial
+    theorem: every term of the result is computed directly
+    as `n! / (k1! * k2! * ...) * t1**k1 * t2**k2 * ...`, without
+    any intermediate product of polynomials
+
+    >>> from ruffini import Variable
+    >>> x = Variable('x')
+    >>> y = Variable('y')
+    >>> list(multinomial_power([x, y], 3).values())
+    [x**3, 3x**2y, 3xy**2, y**3]
+
+    The terms of the result are returned as a dictionary
+    indexed by their variables; it's efficient when there
+    are just a few terms, since the result has at most
+    `(n + m - 1)! / (n! * (m - 1)!)` terms.
+
+    :type terms: list
+    :type exp: int
+    :rtype: dict
+    """
+
+    if not terms:
+        return {} if exp else {VariablesDict(): Monomial(1)}
+
+    # the powers of every term, from 0 to exp
+    coefficients = [[term.coefficient ** k for k in range(exp + 1)] for term in terms]
+    variables = [[term.variables * k for k in range(exp + 1)] for term in terms]
+
+    result = {}
+    last = len(terms) - 1
+
+    def expand(index, remaining, coefficient, product):
+        # the last term takes all the remaining exponent
+        if index == last:
+            product = product + variables[index][remaining]
+            coefficient = coefficient * coefficients[index][remaining]
+            result[product] = result.get(product, 0) + coefficient
+            return
+
+        # binomial(remaining, k), with k from remaining to 0
+        binomial = 1
+
+        for k in range(remaining, -1, -1):
+            expand(index + 1, remaining - k,
+                   coefficient * binomial * coefficients[index][k],
+                   product + variables[index][k])
+            binomial = binomial * k // (remaining - k + 1)
+
+    expand(0, exp, 1, VariablesDict())
+
+    return {v: Monomial._from_trusted(c, v) for v, c in result.items() if c}
+
+def divide(terms, divisors, order=grlex):
+    """
+    Divides a list of terms by some polynomials, with
+    the generalized division algorithm: while the greatest
+    term (in the given monomial order) of the dividend
+    is divisible by the greatest term of a divisor, the
+    first of these divisors is multiplied and subtracted
+    from the dividend; otherwise, the term is moved to
+    the remainder.
+
+    It returns the quotients and the remainder, as
+    dictionaries of terms indexed by their variables
+
+    >>> from ruffini import Variable
+    >>> x = Variable('x')
+    >>> y = Variable('y')
+    >>> quotients, remainder = divide(list(x**2*y + x*y**2 + y**2), [x*y - 1, y**2 - 1])
+    >>> [list(q.values()) for q in quotients], list(remainder.values())
+    ([[x, y], [1]], [x, y, 1])
+
+    `divisors` must be a list of not-null :class:`Polynomial`.
+
+    :type terms: list
+    :type divisors: list
+    :type order: function
+    :rtype: tuple
+    """
+
+    # the greatest terms of the divisors
+    leading = [max(divisor, key=lambda term: order(term.variables)) for divisor in divisors]
+
+    dividend = {}
+    heap = []
+
+    def add(variables, coefficient):
+        if variables in dividend:
+            dividend[variables] += coefficient
+        else:
+            dividend[variables] = coefficient
+            heappush(heap, _Descending(order(variables), variables))
+
+    for term in terms:
+        add(term.variables, term.coefficient)
+
+    quotients = [{} for _ in divisors]
+    remainder = {}
+
+    while heap:
+        variables = heappop(heap).variables
+        coefficient = dividend.pop(variables)
+        if not coefficient:
+            continue
+
+        for divisor, first, quotient in zip(divisors, leading, quotients):
+            if not first.variables.divides(variables):
+                continue
+
+            # subtract the divisor multiplied by the new term of the quotient
+            factor = Monomial._from_trusted(divide_coefficients(coefficient, first.coefficient),
+                                            variables - first.variables)
+            quotient[factor.variables] = factor
+
+            for term in divisor:
+                if term is not first:
+                    add(term.variables + factor.variables, -term.coefficient * factor.coefficient)
+
+            break
+
+        else:
+            remainder[variables] = Monomial._from_trusted(coefficient, variables)
+
+    return quotients, remainder
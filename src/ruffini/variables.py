@@ -1,3 +1,76 @@
+from sys import intern
+from weakref import WeakValueDictionary
+
+
+# Every VariablesDict with latin letters and not-too-big exponents
+# is also packed in a single integer, where each letter has its
+# own bit-field (from 'a', the most significant, to 'z').
+# The highest bit of each field is a guard: it's always
+# zero, so it can be used to detect overflows and negative exponents.
+# The fields are 16 bits wide to keep the packed integers small: the
+# VariablesDicts with bigger exponents are stored only as items.
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+FIELD_WIDTH = 16
+FIELD_MASK = (1 << FIELD_WIDTH) - 1
+MAX_PACKED_EXPONENT = (1 << (FIELD_WIDTH - 1)) - 1
+GUARDS = sum(1 << (FIELD_WIDTH * i + FIELD_WIDTH - 1) for i in range(len(LETTERS)))
+SHIFTS = {l: FIELD_WIDTH * (len(LETTERS) - i - 1) for i, l in enumerate(LETTERS)}
+
+# The pairs (variable, exponent) of the packed VariablesDicts,
+# shared by all the instances which contain them
+PAIRS = {}
+
+
+def pack(items):
+    """
+    Packs the pairs variable-exponent in a single integer.
+    If they can't be packed, returns None.
+
+    >>> pack((('a', 2), ('z', 1))) == (2 << 400) + 1
+    True
+    >>> pack((('à', 1), )) is None
+    True
+
+    :type items: tuple
+    :rtype: int, None
+    """
+
+    packed = 0
+
+    for variable, exponent in items:
+        if variable not in SHIFTS or exponent > MAX_PACKED_EXPONENT:
+            return None
+
+        packed |= exponent << SHIFTS[variable]
+
+    return packed
+
+def unpack(packed):
+    """
+    Returns the pairs variable-exponent stored in a packed integer
+
+    >>> unpack((2 << 400) + 1)
+    (('a', 2), ('z', 1))
+
+    :type packed: int
+    :rtype: tuple
+    """
+
+    items = []
+
+    for variable in reversed(LETTERS):
+        if not packed:
+            break
+
+        exponent = packed & FIELD_MASK
+        if exponent:
+            items.append((variable, exponent))
+
+        packed >>= FIELD_WIDTH
+
+    return tuple(reversed(items))
+
+
 class VariablesDict:
     """
     A VariablesDict is a sort of dictionary with special
@@ -13,11 +86,18 @@ class VariablesDict:
     - Variables aren't case sensitive
     - Variables must be letters from the latin alphabet and one-character long
     - Exponents must be positive integer
+    - VariablesDicts are interned: equivalent instances are the same object
     """
 
-    def __init__(self, variables=None, **kwargs):
+    __slots__ = ("__items", "__mapping", "__packed", "__hash", "is_empty", "degree", "__weakref__")
+
+    # Canonical instances, indexed by their packed
+    # representation (or by their items if they can't be packed)
+    _instances = WeakValueDictionary()
+
+    def __new__(cls, variables=None, **kwargs):
         """
-        Initialize the VariablesDict by giving it
+        Create the VariablesDict by giving it
         the pairs variable: exponent storing them
         in a dict (variables) or as keyword arguments:
 
@@ -92,9 +172,24 @@ class VariablesDict:
         >>> VariablesDict(x=0).is_empty
         True
 
+        and calculates its degree (the sum of the exponents)
+
+        >>> VariablesDict(a=2, b=8, c=3).degree
+        13
+
+        Equivalent VariablesDicts are always the same object,
+        so they're stored only once
+
+        >>> VariablesDict(x=2, y=1) is VariablesDict({'Y': 1, 'X': 2.0})
+        True
+
         :raise: TypeError, ValueError
         """
 
+        # VariablesDicts are immutable, so they can be reused
+        if isinstance(variables, VariablesDict):
+            return variables
+
         # look for variables
         if not variables:
             variables = kwargs
@@ -120,13 +215,96 @@ class VariablesDict:
 
             # Add it to the items
             if not exponent == 0:
-                items[variable.lower()] = int(exponent)
+                items[intern(variable.lower())] = int(exponent)
+
+        return cls._from_trusted(tuple(sorted(items.items())))
+
+    @classmethod
+    def _from_trusted(cls, items):
+        """
+        Returns the canonical VariablesDict with the given
+        items, creating it if it doesn't exist yet.
 
-        # Set items
-        self.__items = tuple(sorted((v, e) for v, e in items.items()))
+        It doesn't check its arguments, so it's meant to
+        be used only internally: `items` must be a sorted
+        tuple of valid pairs (variable, exponent),
+        without null exponents.
+
+        :type items: tuple
+        :rtype: VariablesDict
+        """
+
+        packed = pack(items)
+        key = items if packed is None else packed
+
+        # Look for an existing instance
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        return cls._store(key, items, packed)
+
+    @classmethod
+    def _from_packed(cls, packed):
+        """
+        Returns the canonical VariablesDict with the
+        given packed representation.
+
+        :type packed: int
+        :rtype: VariablesDict
+        """
+
+        # Look for an existing instance
+        instance = cls._instances.get(packed)
+        if instance is not None:
+            return instance
+
+        return cls._store(packed, unpack(packed), packed)
+
+    @classmethod
+    def _store(cls, key, items, packed):
+        """
+        Creates a new VariablesDict and stores it
+        in the canonical instances.
+
+        :type key: int, tuple
+        :type items: tuple
+        :type packed: int, None
+        :rtype: VariablesDict
+        """
+
+        instance = super().__new__(cls)
+
+        # Share the pairs between the packed instances
+        if packed is not None:
+            items = tuple(PAIRS.setdefault(pair, pair) for pair in items)
+
+        # Set items and calculate the hash only once
+        instance.__items = items
+        instance.__mapping = None if packed is not None else dict(items)
+        instance.__packed = packed
+        instance.__hash = hash(items)
+
+        # Check if it's empty and calculate the degree
+        instance.is_empty = not items
+        instance.degree = sum(exponent for variable, exponent in items)
+
+        return cls._instances.setdefault(key, instance)
+
+    def __reduce__(self):
+        """
+        Makes copy and pickle return the canonical instance
+        instead of a new one
+
+        >>> import copy
+        >>> v = VariablesDict(a=3)
+        >>> copy.deepcopy(v) is v
+        True
+
+        :rtype: tuple
+        """
 
-        # Check if it's empty
-        self.is_empty = not bool(len(self))
+        return (VariablesDict, (dict(self.__items), ))
 
     ###  Items
     def __getitem__(self, variable):
@@ -168,6 +346,15 @@ class VariablesDict:
         :rtype: int
         """
 
+        # Look directly for the variable
+        try:
+            if self.__packed is not None:
+                return self.__packed >> SHIFTS[variable] & FIELD_MASK
+
+            return self.__mapping[variable]
+        except (KeyError, TypeError):
+            pass
+
         # Check if kye is valid
         if not isinstance(variable, str):
             raise TypeError("variable's name must be a string")
@@ -176,12 +363,9 @@ class VariablesDict:
         elif len(variable) > 1:
             raise ValueError("variable's name length must be one")
 
-        variable = variable.lower()
-
-        # Look if there is that variable in the dict
-        for item in self.__items:
-            if item[0] == variable:
-                return item[1]
+        # Try again with the lowercase variable
+        if not variable.islower():
+            return self[variable.lower()]
 
         # Otherwise return 0
         return 0
@@ -212,24 +396,42 @@ class VariablesDict:
 
         return self.__items
 
-    def __iter__(self):
+    def divides(self, other):
         """
-        Returns the iterator of the VariablesDict
+        Checks if this VariablesDict divides `other`,
+        which means that every exponent of this
+        VariablesDict is lower or equal to `other`'s one
+
+        >>> VariablesDict(x=1).divides(VariablesDict(x=2, y=1))
+        True
+        >>> VariablesDict(x=1, z=1).divides(VariablesDict(x=2, y=1))
+        False
 
-        >>> iter(VariablesDict(a=2, b=3))
-        {'a': 2, 'b': 3}
+        It raises a TypeError if `other` is not a VariablesDict
 
-        For more informations see :func:`VariablesDict.__next__()`.
+        >>> VariablesDict(x=1).divides(3)
+        Traceback (most recent call last):
+        ...
+        TypeError: other must be a VariablesDict, not int
 
-        :rtype: VariablesDict
+        :type other: VariablesDict
+        :rtype: bool
+        :raise: TypeError
         """
 
-        self.itern = 0
-        return self
+        if not isinstance(other, VariablesDict):
+            raise TypeError(f"other must be a VariablesDict, not {other.__class__.__name__}")
 
-    def __next__(self):
+        # If they're packed, subtract them with the guards
+        # set and check that none of them has been borrowed
+        if self.__packed is not None and other.__packed is not None:
+            return (other.__packed | GUARDS) - self.__packed & GUARDS == GUARDS
+
+        return all(other[variable] >= exponent for variable, exponent in self.__items)
+
+    def __iter__(self):
         """
-        Gets the next variable in the VariablesDict
+        Returns an iterator over the variables of the VariablesDict
 
         >>> i = iter(VariablesDict(a=2, b=3))
         >>> next(i)
@@ -241,16 +443,32 @@ class VariablesDict:
         ...
         StopIteration
 
-        :rtype: str
-        :raise: StopIteration
+        Every call returns a new, independent iterator,
+        so the same VariablesDict can be iterated
+        by more loops (or threads) at the same time.
+
+        :rtype: iterator
+        """
+
+        return (variable for variable, exponent in self.__items)
+
+    def __contains__(self, variable):
+        """
+        Checks if a variable is in the VariablesDict
+
+        >>> 'a' in VariablesDict(a=2, b=3)
+        True
+        >>> 'c' in VariablesDict(a=2, b=3)
+        False
+
+        :type variable: str
+        :rtype: bool
         """
 
         try:
-            variable = self.__items[self.itern][0]
-            self.itern += 1
-            return variable
-        except IndexError:
-            raise StopIteration
+            return bool(self[variable])
+        except (TypeError, ValueError):
+            return False
 
     def __len__(self):
         """
@@ -275,7 +493,7 @@ class VariablesDict:
         :rtype: str
         """
 
-        return str({item[0]: item[1] for item in self.__items})
+        return str(dict(self.__items))
 
     def __repr__(self):
         """
@@ -316,13 +534,19 @@ class VariablesDict:
         if not isinstance(other, VariablesDict):
             raise TypeError(f"unsupported operand type(s) for +: 'VariablesDict' and '{other.__class__.__name__}'")
 
-        result = {}
+        # If they're packed, just sum them (if there are no overflows)
+        if self.__packed is not None and other.__packed is not None:
+            packed = self.__packed + other.__packed
+            if not packed & GUARDS:
+                return VariablesDict._from_packed(packed)
+
+        result = dict(self.__items)
 
         # sum the variables' exponents
-        for variable in set(self) | set(other):
-            result[variable] = self[variable] + other[variable]
+        for variable, exponent in other.__items:
+            result[variable] = result.get(variable, 0) + exponent
 
-        return VariablesDict(result)
+        return VariablesDict._from_trusted(tuple(sorted(result.items())))
 
     def __sub__(self, other):
         """
@@ -355,13 +579,27 @@ class VariablesDict:
         if not isinstance(other, VariablesDict):
             raise TypeError(f"unsupported operand type(s) for -: 'VariablesDict' and '{other.__class__.__name__}'")
 
-        result = {}
+        # If they're packed, subtract them with the guards set:
+        # if a guard has been borrowed, an exponent is negative
+        if self.__packed is not None and other.__packed is not None:
+            packed = (self.__packed | GUARDS) - other.__packed
+            if packed & GUARDS != GUARDS:
+                raise ValueError("variable's exponent must be positive")
+
+            return VariablesDict._from_packed(packed ^ GUARDS)
+
+        result = dict(self.__items)
 
         # compute difference
-        for variable in set(self) | set(other):
-            result[variable] = self[variable] - other[variable]
+        for variable, exponent in other.__items:
+            result[variable] = result.get(variable, 0) - exponent
 
-        return VariablesDict(result)
+            if result[variable] < 0:
+                raise ValueError("variable's exponent must be positive")
+            elif not result[variable]:
+                del result[variable]
+
+        return VariablesDict._from_trusted(tuple(sorted(result.items())))
 
     def __mul__ (self, other):
         """
@@ -397,13 +635,11 @@ class VariablesDict:
         elif other < 0:
             raise ValueError("can't multiply a VariablesDict by a negative number")
 
-        variables = {}
-
         # multiply exponents
-        for variable in self:
-            variables[variable] = self[variable] * other
+        if not other:
+            return VariablesDict._from_trusted(())
 
-        return VariablesDict(variables)
+        return VariablesDict._from_trusted(tuple((v, e * other) for v, e in self.__items))
 
     def __truediv__ (self, other):
         """
@@ -442,7 +678,7 @@ class VariablesDict:
         if not self % other:
             raise ValueError(f"can't divide this VariablesDict by {other}")
 
-        return VariablesDict(dict(map(lambda k: (k, self[k] / other), self)))
+        return VariablesDict._from_trusted(tuple((v, e // other) for v, e in self.__items))
 
     def __mod__ (self, other):
         """
@@ -492,24 +728,26 @@ class VariablesDict:
         >>> VariablesDict(a=2, b=4) == 3
         False
 
+        Since VariablesDicts are interned, two of them
+        are equivalent only if they're the same object.
+
         :type other: VariablesDict
         :rtype: bool
         """
 
-        if not isinstance(other, VariablesDict):
-            return False
-
-        return set(self.items()) == set(other.items())
+        return self is other
 
     def __hash__(self):
         """
         Returns the hash of the VariablesDict by hashing
         the result of :func:`VariablesDict.items()`.
 
+        It's calculated only once, when the VariablesDict is created.
+
         :rtype: int
         """
 
-        return hash(self.__items)
+        return self.__hash
 
     def __bool__(self):
         """
@@ -524,3 +762,56 @@ class VariablesDict:
         """
 
         return not self.is_empty
+
+
+# Monomial orders
+def lex(variables):
+    """
+    Returns the key of a VariablesDict in the lexicographic
+    order, where variables are compared alphabetically
+    (`a` > `b` > ... > `z`) and the first different
+    exponent decides which one is the greater
+
+    >>> sorted([VariablesDict(y=3), VariablesDict(x=1), VariablesDict(x=1, y=1)], key=lex)
+    [{'y': 3}, {'x': 1}, {'x': 1, 'y': 1}]
+
+    It can be used as `key` to sort the terms of a polynomial.
+
+    :type variables: VariablesDict
+    :rtype: tuple
+    """
+
+    return tuple((-ord(variable), exponent) for variable, exponent in variables.items())
+
+def grlex(variables):
+    """
+    Returns the key of a VariablesDict in the graded
+    lexicographic order: the degree is compared first,
+    then the :func:`lex` order is used
+
+    >>> sorted([VariablesDict(y=3), VariablesDict(x=1), VariablesDict(x=1, y=1)], key=grlex)
+    [{'x': 1}, {'x': 1, 'y': 1}, {'y': 3}]
+
+    :type variables: VariablesDict
+    :rtype: tuple
+    """
+
+    return (variables.degree, lex(variables))
+
+def grevlex(variables):
+    """
+    Returns the key of a VariablesDict in the graded reverse
+    lexicographic order: the degree is compared first, then
+    the greater is the one with the lowest exponent in
+    the last different variable
+
+    >>> sorted([VariablesDict(x=1, z=1), VariablesDict(y=2)], key=grevlex)
+    [{'x': 1, 'z': 1}, {'y': 2}]
+    >>> sorted([VariablesDict(x=1, z=1), VariablesDict(y=2)], key=grlex)
+    [{'y': 2}, {'x': 1, 'z': 1}]
+
+    :type variables: VariablesDict
+    :rtype: tuple
+    """
+
+    return (variables.degree, tuple((-ord(variable), -exponent) for variable, exponent in reversed(variables.items())))
@@ -2,3 +2,7 @@ from .variables import Test as Test_VariablesDict
 from .monomials import Test as Test_Monomial
 from .polynomials import Test as Test_Polynomial
 from .fpolynomials import Test as Test_FPolynomials
+from .rings import Test as Test_Rings
+from .dense import Test as Test_Dense
+from .factors import Test as Test_Factors
+from .equations import Test as Test_Equations
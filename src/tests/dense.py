@@ -0,0 +1,93 @@
+from unittest import TestCase
+from fractions import Fraction as F
+
+from ruffini import dense
+from ruffini import Variable, GF
+from ruffini import Monomial as M
+from ruffini import Polynomial as P
+
+
+class Test(TestCase):
+    def setUp(self):
+        x = Variable('x')
+
+        # a polynomial big enough to use the dense representation
+        self.p = P([M(i + 1, x=i) for i in range(10)])
+        self.sparse = x**100 + 1
+
+    def test_arithmetic(self):
+        self.assertEqual(dense.add([1, 2], [3]), [4, 2])
+        self.assertEqual(dense.subtract([1, 2], [1, 2]), [])
+        self.assertEqual(dense.multiply([1, 2], []), [])
+        self.assertEqual(dense.multiply([0, 1], [0, 0, 1]), [0, 0, 0, 1])
+
+    def test_products(self):
+        a = [(7 * i) % 11 - 5 for i in range(300)]
+        b = [(3 * i) % 13 - 6 for i in range(200)]
+        product = dense.schoolbook_product(a, b)
+
+        # every method gives the same result
+        self.assertEqual(dense.karatsuba_product(a, b), product)
+        self.assertEqual(dense.ntt_product(a, b), product)
+        self.assertEqual(dense.multiply(a, b), product)
+
+        # also with big coefficients, that need more primes
+        big = [c * 10**40 for c in a]
+        self.assertEqual(dense.ntt_product(big, b), [c * 10**40 for c in product])
+
+        # and karatsuba works with rationals, too
+        fractions = [F(c, 3) for c in b]
+        self.assertEqual(dense.karatsuba_product(a, fractions), [F(c, 3) for c in product])
+
+    def test_evaluate(self):
+        self.assertEqual(dense.evaluate([], 5), 0)
+        self.assertEqual(dense.evaluate([1, 2, 3], F(1, 2)), F(11, 4))
+
+    def test_synthetic_division(self):
+        # (x**2 - 1) / (x + 1)
+        self.assertEqual(dense.synthetic_division([-1, 0, 1], -1), ([-1, 1], 0))
+        self.assertEqual(dense.synthetic_division([5], 2), ([], 5))
+
+    def test_modulo(self):
+        a = [(7 * i) % 11 for i in range(100)]
+        b = [(3 * i + 1) % 13 for i in range(70)]
+
+        # the packed product is the same as the plain one
+        self.assertEqual(dense.multiply_modulo(a, b, 101), dense.reduce_modulo(dense.multiply(a, b), 101))
+        self.assertEqual(dense.multiply_modulo(a, b, 2**70), dense.multiply(a, b))
+
+        # a = q*b + r
+        quotient, remainder = dense.divide_modulo(a, b, 101)
+        self.assertEqual(dense.reduce_modulo(dense.add(dense.multiply(quotient, b), remainder), 101), dense.reduce_modulo(a, 101))
+        self.assertLess(len(remainder), len(b))
+
+        # s*a + t*b = gcd(a, b)
+        common = [3, 0, 1]
+        a, b = dense.multiply_modulo(a, common, 101), dense.multiply_modulo(b, common, 101)
+        gcd, s, t = dense.extended_gcd_modulo(a, b, 101)
+        self.assertEqual(gcd, dense.gcd_modulo(a, b, 101))
+        self.assertEqual(dense.divide_modulo(gcd, common, 101)[1], [])
+        self.assertEqual(dense.reduce_modulo(dense.add(dense.multiply(s, a), dense.multiply(t, b)), 101), gcd)
+
+        # (x + 2)**10 modulo x**3 + 5
+        power = dense.divide_modulo(dense.power([2, 1], 10), [5, 0, 0, 1], 101)[1]
+        self.assertEqual(dense.power_modulo([2, 1], 10, [5, 0, 0, 1], 101), power)
+        self.assertEqual(dense.evaluate_modulo([1, 2, 3], 5, 7), 86 % 7)
+
+    def test_polynomial(self):
+        # the conversion doesn't lose any term
+        self.assertTrue(self.p._is_dense())
+        self.assertFalse(self.sparse._is_dense())
+        self.assertEqual(P._from_dense(self.p._to_dense(), 'x'), self.p)
+
+        # the dense product is the same as the sparse one
+        self.assertEqual(self.p * self.p, P([a * b for a in self.p for b in self.p]))
+
+        # and it works within any ring
+        q = self.p.change_ring(GF(7))
+        self.assertEqual((q * q).ring, GF(7))
+        self.assertEqual(q * q, (self.p * self.p).change_ring(GF(7)))
+
+        # evaluation uses the Horner's method
+        self.assertEqual(self.p.eval(x=2), sum((i + 1) * 2**i for i in range(10)))
+        self.assertEqual(self.p.eval(x=F(1, 2)), P([m.eval(x=F(1, 2)) for m in self.p]))
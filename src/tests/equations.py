@@ -0,0 +1,25 @@
+from unittest import TestCase
+from fractions import Fraction as F
+
+from ruffini import Equation, RR, GF
+from ruffini import Monomial as M
+
+
+class Test(TestCase):
+    def test_solve(self):
+        # equations of degree 1 with rational coefficients
+        self.assertEqual(Equation(M(2, x=1), 3).solve(), F(3, 2))
+        self.assertEqual(Equation(M(F(1, 3), x=1), 2).solve(), 6)
+
+        # the solution is in the ring of the coefficients
+        solution = Equation(M(0.5, x=1, ring=RR), 1).solve()
+        self.assertIsInstance(solution, float)
+        self.assertEqual(solution, 2.0)
+
+        solution = Equation(M(2, x=1, ring=GF(7)), 3).solve()
+        self.assertEqual(solution, GF(7)(5))
+
+        # equations of degree 2
+        self.assertEqual(Equation(M(x=2), 4).solve(), (2, -2))
+        self.assertRaises(ValueError, Equation(M(x=2), -4).solve)
+        self.assertRaises(NotImplementedError, Equation(M(x=3), 27).solve)
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from ruffini import dense, factors
+
+
+class Test(TestCase):
+    def test_factor_modulo(self):
+        # x**4 - 1 has four roots modulo 5 and two modulo 7
+        self.assertEqual(factors.factor_modulo([-1, 0, 0, 0, 1], 5), [[1, 1], [2, 1], [3, 1], [4, 1]])
+        self.assertEqual(factors.factor_modulo([-1, 0, 0, 0, 1], 7), [[1, 1], [6, 1], [1, 0, 1]])
+
+        # the factors are monic and irreducible
+        f = [3, 1, 4, 1, 5, 9, 2, 6]
+        result = factors.factor_modulo(f, 11)
+        product = [1]
+        for factor in result:
+            self.assertEqual(factor[-1], 1)
+            self.assertEqual(factors.factor_modulo(factor, 11), [factor])
+            product = dense.multiply_modulo(product, factor, 11)
+        self.assertEqual(product, [c * 2 % 11 for c in f])
+
+    def test_hensel_lift(self):
+        f = [-2, 0, 0, 0, 1]
+        modular = factors.factor_modulo(f, 7)
+        lifted = factors.hensel_lift(f, modular, 7, 5)
+
+        product = [1]
+        for original, factor in zip(modular, lifted):
+            self.assertEqual(dense.reduce_modulo(factor, 7), original)
+            product = dense.multiply_modulo(product, factor, 7**5)
+        self.assertEqual(product, dense.reduce_modulo(f, 7**5))
+
+    def test_zassenhaus(self):
+        # cyclotomic polynomials
+        result = factors.zassenhaus([-1] + [0] * 59 + [1])
+        self.assertEqual(sorted(len(f) - 1 for f in result), [1, 1, 2, 2, 2, 4, 4, 4, 8, 8, 8, 16])
+
+        # irreducible polynomials with many modular factors
+        self.assertEqual(factors.zassenhaus([1, 0, -10, 0, 1]), [[1, 0, -10, 0, 1]])
+
+        # a leading coefficient different from 1
+        a, b, c = [3, 0, 2], [-1, 1, 0, 5], [7, -4, 1, 0, 0, 2]
+        f = dense.multiply(dense.multiply(a, b), c)
+        self.assertEqual(factors.zassenhaus(f), [a, b, c])
+
+        # degree 100
+        a = [(i * 7) % 11 - 5 for i in range(40)] + [1]
+        b = [(i * 5) % 13 - 6 for i in range(60)] + [3]
+        self.assertEqual(factors.zassenhaus(dense.multiply(a, b)), sorted([a, b], key=len))
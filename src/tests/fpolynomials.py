@@ -1,9 +1,12 @@
 from unittest import TestCase
+from fractions import Fraction as F
 
 from ruffini import Monomial as M
 from ruffini import Polynomial as P
 from ruffini import FPolynomial as FP
-from ruffini import gcf, binomial_square, factorize
+from ruffini import Variable, GF
+from ruffini import gcf, binomial_square, ruffinis_rule, square_free, zassenhaus, factorize
+from ruffini.fpolynomials import PASSES
 
 
 class Test(TestCase):
@@ -73,10 +76,10 @@ class Test(TestCase):
         factorization = FP(5, P(M(2, x=2), M(3, y=1)), P(M(2, x=2), M(3, y=1)))
         self.assertEqual(polynomial.factorize(), factorization)
 
-        self.assertEqual(factorize(M(x=2) + 1 - M(2, x=1)), FP(M(x=1) - 1, M(x=1) - 1))
-        self.assertEqual(factorize(M(8, x=2) + M(2, x=1) - 3), FP(8, M(x=1) - 1/2, M(x=1) + 3/4))
-        self.assertEqual(factorize(M(10, x=1) + 5), FP(5, M(2, x=1) + 1))
-        self.assertEqual(factorize(M(3, x=3) + M(2, x=2) - M(3, x=1) -2), FP(M(x=1) - 1, M(x=1) + 1, M(3, x=1) + 2))
+        self.assertEqual(tuple(factorize(M(x=2) + 1 - M(2, x=1))), (M(x=1) - 1, M(x=1) - 1))
+        self.assertEqual(tuple(factorize(M(8, x=2) + M(2, x=1) - 3)), (M(2, x=1) - 1, M(4, x=1) + 3))
+        self.assertEqual(tuple(factorize(M(10, x=1) + 5)), (5, M(2, x=1) + 1))
+        self.assertEqual(tuple(factorize(M(3, x=3) + M(2, x=2) - M(3, x=1) -2)), (M(x=1) - 1, M(x=1) + 1, M(3, x=1) + 2))
 
     def test_gcf(self):
         # works only with polynomials
@@ -120,3 +123,74 @@ class Test(TestCase):
         polynomial = P(*polynomial[::-1])
         factorized = self.p[2][1] -self.p[2][0], self.p[2][1] -self.p[2][0]
         self.assertEqual(binomial_square(polynomial), factorized)
+
+    def test_square_free(self):
+        x = Variable('x')
+
+        # repeated factors are found with their multiplicity
+        self.assertEqual(square_free(P(x - 1)**20), [(x - 1, 20)])
+        self.assertEqual(square_free(P(x - 1)**2 * (x + 1)), [(x + 1, 1), (x - 1, 2)])
+        self.assertEqual(square_free(3 * P(2*x + 1)**3 * (x**2 + 1)**2), [(3, 1), (x**2 + 1, 2), (2*x + 1, 3)])
+        self.assertEqual(square_free(x**2 + x + 1), [(x**2 + x + 1, 1)])
+
+        # it works only with univariate rational polynomials
+        self.assertRaises(TypeError, square_free, "x")
+        self.assertRaises(ValueError, square_free, x * Variable('y') + 1)
+        self.assertRaises(ValueError, square_free, (x**2 + 1).change_ring(GF(7)))
+
+        # factorize uses it
+        self.assertEqual(factorize(P(x - 1)**20), FP(*[x - 1] * 20))
+        self.assertEqual(factorize(P(2*x - 1)**3 * (x**2 + 1)**2 * 5), FP(5, 2*x - 1, 2*x - 1, 2*x - 1, x**2 + 1, x**2 + 1))
+        self.assertEqual(factorize(x**2 + x + 1), FP(x**2 + x + 1))
+
+    def test_zassenhaus(self):
+        x = Variable('x')
+
+        # irreducible factors of any degree
+        self.assertEqual(zassenhaus((x**2 + 1) * (x**3 + x + 1)), (x**2 + 1, x**3 + x + 1))
+        self.assertEqual(zassenhaus(x**4 - 10*x**2 + 1), (x**4 - 10*x**2 + 1, ))
+
+        # repeated factors and constants
+        self.assertEqual(zassenhaus(-(x**2 - 2)**2 * (3*x + 1)), (-1, 3*x + 1, x**2 - 2, x**2 - 2))
+        self.assertEqual(zassenhaus(x**2 / 4 - 1), (F(1, 4), x - 2, x + 2))
+
+        self.assertRaises(TypeError, zassenhaus, "x")
+        self.assertRaises(ValueError, zassenhaus, x * Variable('y') + 1)
+
+        # factorize uses it
+        self.assertEqual(factorize(x**6 - 1), FP(x - 1, x + 1, x**2 + x + 1, x**2 - x + 1))
+        self.assertEqual(factorize(x**2 + 2*x - 1), FP(x**2 + 2*x - 1))
+        self.assertEqual(len(factorize((x**2 + 1) * (x**3 + x + 1) * 2)), 3)
+
+    def test_passes(self):
+        x = Variable('x')
+        y = Variable('y')
+
+        # the Ruffini's rule is tried before the Zassenhaus' algorithm
+        self.assertEqual([p.method for p in PASSES], [gcf, binomial_square, ruffinis_rule, zassenhaus])
+
+        # but only when the candidate zeros are few
+        self.assertEqual(tuple(factorize((x - 10**6) * (x**2 + 1))), (x - 10**6, x**2 + 1))
+
+        # the repeated factors are examined once
+        self.assertEqual(tuple(factorize((x - 1)**20)), (x - 1, ) * 20)
+        self.assertEqual(tuple(factorize((x**2 + x + 1)**4)), (x**2 + x + 1, ) * 4)
+
+        # the passes that can't be applied are skipped
+        self.assertEqual(tuple(factorize(x / 2 + 1)), (F(1, 2), x + 2))
+        self.assertEqual(tuple(factorize(x**2 * y + x * y)), (x * y, x + 1))
+        self.assertEqual(tuple(factorize(2*x*y - 4*y**2)), (2 * y, x - 2*y))
+
+        q = P(M(GF(7)(3), x=2), GF(7)(1))
+        self.assertEqual(tuple(factorize(q)), (q, ))
+
+        # the linear factors are primitive too
+        self.assertEqual(tuple(factorize(4*x**2 - 9)), (2*x - 3, 2*x + 3))
+        self.assertEqual(tuple(factorize(6*x**2 + 5*x + 1)), (2*x + 1, 3*x + 1))
+        self.assertEqual(tuple(factorize(x**2 / 4 + x + 1)), (F(1, 4), x + 2, x + 2))
+
+        # and the constants are collected in a single factor
+        self.assertEqual(tuple(factorize(12*x**3 - 3*x)), (3 * x, 2*x - 1, 2*x + 1))
+        self.assertEqual(tuple(factorize(8*x**3 - 27)), (2*x - 3, 4*x**2 + 6*x + 9))
+        self.assertEqual(tuple(factorize(-2*x**2 + 2)), (-2, x - 1, x + 1))
+        self.assertEqual(tuple(factorize(6*x**4 - 6)), (6, x - 1, x + 1, x**2 + 1))
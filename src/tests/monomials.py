@@ -28,6 +28,11 @@ class Test(TestCase):
         # default coefficient is 1
         self.assertEqual(M().coefficient, 1)
 
+        # whole coefficients are stored as integers
+        self.assertIsInstance(M(3.0).coefficient, int)
+        self.assertIsInstance(M(F(6, 2)).coefficient, int)
+        self.assertIsInstance(M(1.5).coefficient, F)
+
         # default variables is empty
         self.assertTrue(M().variables.is_empty)
 
@@ -37,6 +42,9 @@ class Test(TestCase):
         # test variable()
         self.assertEqual(Variable('x'), M(1, x=1))
 
+        # monomials have a compact layout
+        self.assertFalse(hasattr(M(2, x=1), '__dict__'))
+
     def test_similarity(self):
         # two monomials are simimlar if they have the
         # same variables
@@ -119,6 +127,11 @@ class Test(TestCase):
         self.assertEqual(self.m[5] * self.m[1], M(54, x=1, y=6))
         self.assertEqual(self.m[1] / self.m[5], M(F(2, 3), x=1))
 
+        # integer coefficients stay integers while they're whole
+        self.assertIsInstance((self.m[2] / self.m[0]).coefficient, int)
+        self.assertIsInstance((self.m[0] / self.m[2]).coefficient, F)
+        self.assertIsInstance((M(F(1, 2), x=1) * 4).coefficient, int)
+
         # works with numbers
         self.assertEqual(self.m[0] * self.m[3], self.m[0] * 3)
         self.assertEqual(self.m[0] / 2, M(x=1, y=4))
@@ -196,8 +209,9 @@ class Test(TestCase):
         # it will stay there
         self.assertEqual(self.m[0].eval(x=5), M(10, y=4))
 
-        # if there are no variables left returns a fraction
-        self.assertIsInstance(self.m[5].eval(y=2), F)
+        # if there are no variables left returns a number
+        self.assertIsInstance(self.m[5].eval(y=2), int)
+        self.assertIsInstance(self.m[4].eval(a=2), F)
 
         # otherwise it return a monomial
         self.assertIsInstance(self.m[2].eval(x=3), M)
@@ -1,9 +1,15 @@
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 from fractions import Fraction as F
 
-from ruffini import Variable
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ruffini import Variable, GF, lex, grevlex
 from ruffini import Monomial as M
 from ruffini import Polynomial as P
+from ruffini import PolynomialBuilder
 
 
 class Test(TestCase):
@@ -41,6 +47,12 @@ class Test(TestCase):
         # if term_coefficient find nothing, the result is 0
         self.assertEqual(self.p[0].term_coefficient(k=2, b=1), 0)
 
+        # null terms are not stored
+        self.assertEqual(len(P(M(2, x=1), M(-2, x=1), 5)), 1)
+        self.assertEqual(len(P(0)), 0)
+        self.assertEqual(str(P(M(2, x=1), M(-2, x=1))), '0')
+        self.assertEqual(P(M(3, x=1), M(-3, x=1)), 0)
+
         # term_coefficient argument can be a monomial with coefficient 1
         self.assertEqual(P(M(2, x=1), 3).term_coefficient(Variable('x')), 2)
 
@@ -71,6 +83,92 @@ class Test(TestCase):
         self.assertEqual(self.p[0] + self.p[1], P(M(16, a=4), M(-6, y=1)))
         self.assertEqual(self.p[0] - self.p[1], P(M(20, y=1), M(-4, a=4)))
 
+        # terms that cancel out are removed
+        self.assertEqual(len(self.p[0] - self.m[2]), 1)
+        self.assertEqual(self.p[0] - self.p[0], 0)
+
+        # the order of the terms is kept
+        self.assertEqual(str(self.p[0] + self.m[3] + self.m[2]), "6a**4 + 14y + 9x")
+
+    def test_degree_variables(self):
+        p = P(M(2, y=1), M(3, x=2, z=1), 5)
+
+        # they're computed only when needed
+        self.assertNotIn("_degree", p.__dict__)
+        self.assertNotIn("_variables", p.__dict__)
+
+        self.assertEqual(p.degree, 3)
+        self.assertEqual(p.variables, ('x', 'y', 'z'))
+        self.assertEqual(P().degree, 0)
+        self.assertEqual(P().variables, ())
+
+        # and kept when the terms don't change
+        self.assertEqual((-p).__dict__["_variables"], ('x', 'y', 'z'))
+        self.assertEqual(p.ordered().__dict__["_degree"], 3)
+
+    def test_coefficients(self):
+        x = Variable('x')
+        y = Variable('y')
+
+        # univariate polynomials give numbers
+        self.assertEqual((x**4 - F(1, 2)*x).coefficients(), [0, F(-1, 2), 0, 0, 1])
+        self.assertEqual(P(3).coefficients(), [3])
+        self.assertEqual(P().coefficients(), [])
+
+        # the others polynomials in the other variables
+        self.assertEqual((x*y**2 + 2*y - x).coefficients('y'), [-x, 2, x])
+        self.assertEqual((x*y**2 + 2*y - x).coefficients('X'), [2*y, y**2 - 1])
+        self.assertEqual((x*y + y).coefficients('z'), [x*y + y])
+        self.assertRaises(ValueError, (x*y + 1).coefficients)
+
+    def test_builder(self):
+        x = Variable('x')
+        y = Variable('y')
+
+        builder = PolynomialBuilder()
+        builder.add_term(3*x)
+        builder.add_term(F(1, 2))
+        builder.add_polynomial(x*y - 3*x)
+        builder.add_product(x + 1, y - 1)
+        builder += 2
+
+        expected = 3*x + F(1, 2) + x*y - 3*x + (x + 1) * (y - 1) + 2
+        self.assertEqual(builder.build(), expected)
+
+        # the builder can be used again, and
+        # the built polynomial doesn't change
+        p = builder.build()
+        builder.add_term(x)
+        self.assertEqual(p, expected)
+        self.assertEqual(builder.build(), expected + x)
+
+        # only valid terms are accepted
+        self.assertRaises(TypeError, builder.add_term, "x")
+        self.assertRaises(TypeError, builder.add_polynomial, [x])
+
+        # Polynomial.sum() is the same of sum()
+        terms = [M(i % 7 - 3, x=i % 5, y=i % 3) for i in range(100)]
+        self.assertEqual(P.sum(terms), sum(terms))
+        self.assertEqual(P.sum([]), 0)
+
+        # numbers summed with a polynomial in a finite field are moved into it
+        p = P(x**2 + x, ring=GF(5))
+        total = P.sum([3, p])
+        self.assertEqual(total.ring, GF(5))
+        self.assertEqual(total, P(x**2 + x + 3, ring=GF(5)))
+        self.assertEqual(total + 5, P(x**2 + x + 3, ring=GF(5)))
+        self.assertEqual(P.sum([3, p, 2]), p)
+
+    def test_ordered(self):
+        p = P(self.m[2], 5, M(2, x=1, y=1), M(3, y=3))
+
+        # terms are sorted from the greatest
+        self.assertEqual(str(p.ordered()), "3y**3 + 2xy + 7y + 5")
+        self.assertEqual(str(p.ordered(lex)), "2xy + 3y**3 + 7y + 5")
+
+        # the polynomial doesn't change
+        self.assertEqual(p.ordered(grevlex), p)
+
     def test_mul(self):
         # works only with monomials, polynomials and numbers
         self.assertRaises(TypeError, lambda: self.p[0] * "something")
@@ -84,6 +182,214 @@ class Test(TestCase):
         # works with polynomial
         self.assertEqual(self.p[0] * self.p[1], P(M(-8, a=4, y=1), M(60, a=8), M(-91, y=2)))
 
+        # big sparse products are merged with a heap,
+        # and their terms are sorted from the greatest
+        a = P([M(i + 1, x=i % 13, y=i // 13) for i in range(130)])
+        b = P([M(i - 9, y=i % 4, z=i // 4, t=i % 3) for i in range(130)])
+        product = a * b
+
+        self.assertEqual(product, P([s * t for s in a for t in b]))
+        self.assertEqual(str(product), str(product.ordered()))
+
+        # dense products in a few variables use the Kronecker
+        # substitution, with the terms in the lexicographic order
+        a = P([M(i + 1, x=i % 5, y=i // 5) for i in range(20)])
+        b = P([M(i - 9, y=i % 4, z=i // 4) for i in range(20)])
+        product = a * b
+
+        self.assertEqual(product, P([s * t for s in a for t in b]))
+        self.assertEqual(str(product), str(product.ordered(lex)))
+
+    def test_pow(self):
+        x = Variable('x')
+        y = Variable('y')
+
+        # every method gives the same result of repeated products
+        for base, exp in ((x + y + 1, 7), (3*x**2 - x + 5, 6), (F(1, 2)*x**3 + 2, 5), (x*y - 2*x + 1, 4)):
+            product = base
+            for _ in range(exp - 1):
+                product = product * base
+
+            self.assertEqual(base ** exp, product)
+
+        # finite fields use repeated squaring
+        p = (x + 2).change_ring(GF(5))
+        self.assertEqual(p ** 5, (x**5 + 32).change_ring(GF(5)))
+
+        # a polynomial with a term, or without terms
+        self.assertEqual(P(M(2, x=1)) ** 3, M(8, x=3))
+        self.assertEqual(P() ** 3, P())
+        self.assertEqual(P() ** 0, 1)
+
+        # only non-negative integer exponents are allowed
+        self.assertRaises(ValueError, lambda: self.p[0] ** -2)
+        self.assertRaises(TypeError, lambda: self.p[0] ** "2")
+
+    def test_value(self):
+        x = Variable('x')
+        y = Variable('y')
+        p = F(1, 2)*x**3*y - 3*x*y**2 + 4
+
+        # the result is a number, the same of eval()
+        self.assertEqual(p.value(x=2, y=-1), p.eval(x=2, y=-1))
+        self.assertIsInstance(p.value(x=2, y=-1), int)
+        self.assertIsInstance(p.value(x=1, y=1), F)
+        self.assertIsInstance(p.value(x=1.5, y=1), float)
+
+        # also for univariate polynomials and constants
+        self.assertEqual((x**3 - 2*x + 1).value(x=3), 22)
+        self.assertEqual(P(7).value(), 7)
+        self.assertEqual(P().value(x=1), 0)
+
+        # every variable needs a value
+        self.assertRaises(ValueError, p.value, x=1)
+
+    def test_compile(self):
+        x = Variable('x')
+        y = Variable('y')
+        z = Variable('z')
+
+        p = F(1, 2)*x**5*y - 3*x**2*z**3 + 7*x*y*z + y**4 - 2
+        f = p.compile()
+
+        # the result is the same of eval()
+        for values in ((1, 2, 3), (0, -1, F(1, 3)), (5, 0, 0)):
+            self.assertEqual(f(*values), p.eval(x=values[0], y=values[1], z=values[2]))
+
+        # but it's a number
+        self.assertIsInstance(f(1, 1, 3), F)
+        self.assertIsInstance(f(2, 2, 3), int)
+
+        # if some values are missing, it works like eval()
+        self.assertEqual(f(y=1, z=1), p.eval(y=1, z=1))
+
+        # polynomials without variables
+        self.assertEqual(P(5).compile()(), 5)
+        self.assertEqual(P().compile()(), 0)
+
+        # coefficients in a finite field
+        q = p.change_ring(GF(7))
+        self.assertEqual(q.compile()(1, 2, 3), q.eval(x=1, y=2, z=3))
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_eval_array(self):
+        x = Variable('x')
+        y = Variable('y')
+        p = 3*x**2*y - x*y + 2*y**3 - 7
+
+        xs = numpy.arange(-3, 4)
+        ys = numpy.arange(5).reshape(5, 1)
+        result = p.eval_array(x=xs, y=ys)
+
+        # the arrays are broadcast, the result is the same of eval()
+        self.assertEqual(result.shape, (5, 7))
+        self.assertEqual(result.dtype, numpy.int64)
+        for i, a in enumerate(xs):
+            for j, b in enumerate(ys[:, 0]):
+                self.assertEqual(result[j, i], p.eval(x=int(a), y=int(b)))
+
+        # rational coefficients give floats, object arrays exact values
+        q = p + F(1, 3) * x
+        self.assertEqual(q.eval_array(x=xs, y=1).dtype, numpy.float64)
+        exact = q.eval_array(x=numpy.array([F(1, 2), 2], dtype=object), y=1)
+        self.assertEqual(list(exact), [q.eval(x=F(1, 2), y=1), q.eval(x=2, y=1)])
+
+        # the values which could overflow the 64-bit integers are exact
+        big = P(M(2**70, x=1), 1)
+        self.assertEqual(list(big.eval_array(x=numpy.array([1, 2]))), [2**70 + 1, 2**71 + 1])
+        self.assertEqual(list((x**5 + 1).eval_array(x=numpy.array([10**4]))), [10**20 + 1])
+        self.assertEqual(p.eval_array(x=xs, y=ys).dtype, numpy.int64)
+
+        # every variable needs a value
+        self.assertRaises(ValueError, p.eval_array, x=xs)
+
+    def test_division(self):
+        x = Variable('x')
+        y = Variable('y')
+        z = Variable('z')
+
+        # univariate division: a = q*b + r, with deg(r) < deg(b)
+        for a, b in ((x**5 - 3*x**2 + 7, 2*x**2 + x - 1), (x**4 - 1, x - 1), (3*x + 1, x**2), (P(x**3), 4)):
+            q, r = divmod(a, b)
+            self.assertEqual(q * b + r, a)
+            self.assertTrue(not r or r.degree < P(b).degree)
+            self.assertEqual(a // b, q)
+            self.assertEqual(a % b, r)
+
+        # also in finite fields
+        a = (x**4 + 3*x + 2).change_ring(GF(7))
+        b = (3*x**2 + 1).change_ring(GF(7))
+        q, r = divmod(a, b)
+        self.assertEqual(q.ring, GF(7))
+        self.assertEqual(q * b + r, a)
+
+        # multivariate division, in every order
+        p = x**3*y*z - 2*x*y**2 + z**3 - 5
+        divisors = [x*y - z, y**2 + 3*z - 1]
+
+        for order in (lex, grevlex):
+            quotients, remainder = p.divide(divisors, order)
+            self.assertEqual(sum(q * d for q, d in zip(quotients, divisors)) + remainder, p)
+
+            # no term of the remainder is divisible by a leading term
+            for divisor in divisors:
+                first = max(divisor, key=lambda t: order(t.variables))
+                for term in remainder:
+                    self.assertFalse(first.variables.divides(term.variables))
+
+        # errors
+        self.assertRaises(ZeroDivisionError, divmod, x + 1, P())
+        self.assertRaises(ZeroDivisionError, p.divide, [x, 0])
+        self.assertRaises(TypeError, lambda: (x + 1) // "x")
+        self.assertRaises(TypeError, p.divide, ["x"])
+
+    def test_derivative(self):
+        x = Variable('x')
+        y = Variable('y')
+
+        self.assertEqual((x**3 - 2*x + 5).derivative(), 3*x**2 - 2)
+        self.assertEqual((x**2*y**3 + x*y - 7).derivative('y'), 3*x**2*y**2 + x)
+        self.assertEqual(P(5).derivative(), P())
+        self.assertEqual((x**7 + x).change_ring(GF(7)).derivative(), P(1).change_ring(GF(7)))
+        self.assertRaises(ValueError, P(x*y).derivative)
+
+    def test_gcd(self):
+        x = Variable('x')
+        y = Variable('y')
+        z = Variable('z')
+
+        # the common factors are found, with integer coefficients
+        self.assertEqual((x**2 - 1).gcd(x**2 - 2*x + 1), x - 1)
+        self.assertEqual((4*x**2 - 4).gcd(6*x + 6), 2*x + 2)
+        self.assertEqual((-x**2 + 1).gcd(P()), x**2 - 1)
+        self.assertEqual(P(x/2 - F(1, 3)).gcd(x**2 - F(4, 9)), 3*x - 2)
+        self.assertEqual(P(6).gcd(15), P(3))
+        self.assertEqual((x**3 - 1).gcd(x**2 + 1), P(1))
+
+        # also with many variables
+        common = x**2*y - 3*z + 1
+        a = common * (x*y*z + 2)
+        b = common * (y**3 - x*z**2) * (x + y)
+        self.assertEqual(a.gcd(b), common)
+        self.assertEqual(b.gcd(a), common)
+        self.assertEqual((x*y**2 + x*y).gcd(y**3 - y), P(y**2 + y))
+
+        # the result doesn't depend on the unlucky points
+        self.assertEqual((4*x**2*y + y**3).gcd(-4*x**4*y**4), P(y))
+
+        # finite fields, small ones use the subresultants
+        for ring in (GF(7), GF(2)):
+            a = (x**2*y + 1).change_ring(ring) * (x + y)
+            b = (x + y).change_ring(ring) * (y**2 - x)
+            self.assertEqual(a.gcd(b), (x + y).change_ring(ring))
+
+        # the subresultants give the same results
+        for a, b in (((x**2 - 1) * (x**3 + 2*x + 5), (x**2 - 1) * (3*x - 1)), (a, b)):
+            variables = tuple(sorted(set(a.variables).union(b.variables)))
+            self.assertEqual(a._subresultant_gcd(b, variables)._normalize(), a.gcd(b))
+
+        self.assertRaises(TypeError, P(x).gcd, "x")
+
     def test_reverses(self):
         # reverse add
         self.assertEqual(19 + P(M(3)), P(22))
@@ -126,6 +432,24 @@ class Test(TestCase):
         # otherwise the result is false
         self.assertFalse(self.p[1] == {1, 7, 9})
 
+        # != is the opposite of ==, whatever the order of the terms
+        self.assertFalse(self.p[2] != P(self.m[3], self.m[1]))
+        self.assertTrue(self.p[2] != self.p[1])
+
+        # the null polynomial is equal to zero
+        self.assertEqual(P(), 0)
+
+        # terms with the same variables but different coefficients
+        self.assertNotEqual(P(M(2, x=1), 1), P(M(2, x=1), 2))
+
+        # monomials can be compared to polynomials, too
+        self.assertEqual(M(3, a=2, b=2), P(M(3, a=2, b=2)))
+        self.assertNotEqual(M(3, a=2), self.p[0])
+
+        # the hash doesn't depend on the order and it's stored
+        self.assertEqual(hash(self.p[2]), hash(P(self.m[3], self.m[1])))
+        self.assertEqual(hash(self.p[2]), self.p[2]._hash)
+
     def test_neg(self):
         # test neg
         self.assertEqual(-self.p[1], P(-self.m[4], -self.m[0]))
@@ -0,0 +1,95 @@
+from unittest import TestCase
+from fractions import Fraction as F
+
+from ruffini import Ring, ZZ, QQ, RR, GF, ModularInteger
+from ruffini import Monomial as M
+from ruffini import Polynomial as P
+
+
+class Test(TestCase):
+    def test_conversions(self):
+        # ZZ accepts only whole numbers
+        self.assertEqual(ZZ(F(6, 3)), 2)
+        self.assertIsInstance(ZZ(4.0), int)
+        self.assertRaises(ValueError, ZZ, 2.5)
+        self.assertRaises(TypeError, ZZ, "2")
+
+        # QQ keeps whole numbers as integers
+        self.assertIsInstance(QQ(F(6, 3)), int)
+        self.assertEqual(QQ(0.5), F(1, 2))
+
+        # RR converts everything to float
+        self.assertIsInstance(RR(F(1, 3)), float)
+
+        # GF(p) reduces modulo p
+        self.assertEqual(GF(7)(F(1, 2)), GF(7)(4))
+        self.assertRaises(ValueError, GF, 8)
+        self.assertRaises(TypeError, GF, 7.0)
+        self.assertRaises(ZeroDivisionError, GF(7), F(1, 7))
+
+        # rings can tell if they contain a number
+        self.assertIn(3, ZZ)
+        self.assertNotIn(0.5, ZZ)
+
+        # every ring must implement the conversion
+        self.assertRaises(TypeError, Ring)
+
+    def test_modular_integers(self):
+        a, b = GF(7)(3), GF(7)(5)
+
+        # operations are done modulo p
+        self.assertEqual(a + b, 1)
+        self.assertEqual(a - b, GF(7)(5))
+        self.assertEqual(a * b, 1)
+        self.assertEqual(a / b, 2)
+        self.assertEqual(a ** 6, 1)
+        self.assertEqual(2 - a, GF(7)(6))
+        self.assertEqual(1 / a, b)
+
+        # they're displayed with the symmetric representation
+        self.assertEqual(str(b), '-2')
+        self.assertEqual(hash(b), hash(-2))
+
+        # they're equal only to their symmetric representation,
+        # so equal objects have the same hash
+        self.assertEqual(b, -2)
+        self.assertNotEqual(b, 5)
+        self.assertEqual(len({b, -2, GF(7)(12)}), 1)
+
+        # elements of different fields can't be mixed
+        self.assertRaises(ValueError, lambda: a + GF(5)(1))
+        self.assertFalse(a == GF(5)(3))
+
+        # floats are not supported
+        self.assertRaises(TypeError, lambda: a + 0.5)
+        self.assertRaises(TypeError, ModularInteger, 0.5, 7)
+
+    def test_polynomials(self):
+        p = P(M(3, x=2), M(2, x=1), 5)
+
+        # the ring is inferred from the coefficients
+        self.assertIs(p.ring, ZZ)
+        self.assertIs((p * F(1, 2)).ring, QQ)
+        self.assertIs(p.change_ring(RR).ring, RR)
+        self.assertIs((p.change_ring(RR) * F(1, 2)).ring, RR)
+
+        # polynomials can be moved to a finite field
+        q = p.change_ring(GF(5))
+        self.assertEqual(q.ring, GF(5))
+        self.assertEqual(q * q, (p * p).change_ring(GF(5)))
+        self.assertEqual(M(2, x=1, ring=GF(5)) * 3, M(1, x=1))
+
+        # and to the floats
+        self.assertIsInstance(p.change_ring(RR)[0].coefficient, float)
+        self.assertIsInstance(M(3, ring=RR).coefficient, float)
+
+        # ZZ can't contain fractional coefficients
+        self.assertRaises(ValueError, P, M(F(1, 2), x=1), ring=ZZ)
+
+        # coefficients of a finite field can't be mixed with other numbers
+        mixed = P(M(x=2), M(1, x=1, ring=GF(5)))
+        self.assertTrue(all(isinstance(t.coefficient, ModularInteger) for t in mixed))
+        self.assertEqual(mixed ** 5, P(M(x=10), M(x=5)).change_ring(GF(5)))
+        self.assertEqual((p + q).ring, GF(5))
+        self.assertEqual((p * q).ring, GF(5))
+        self.assertRaises(ValueError, lambda: q + p.change_ring(GF(7)))
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from re import escape as escape_regex
+import copy, pickle
 
 from ruffini import *
 
@@ -30,6 +31,51 @@ class Test(TestCase):
         self.assertTrue(VariablesDict(b=0).is_empty)
         self.assertFalse(VariablesDict(c=1).is_empty)
 
+    def test_packed(self):
+        # huge exponents and non-latin letters can't be packed,
+        # but operations work the same way
+        big = 2 ** 40
+        self.assertEqual((VariablesDict(x=big) + VariablesDict(x=1))['x'], big + 1)
+        self.assertEqual((VariablesDict(x=big, y=1) - VariablesDict(x=1))['x'], big - 1)
+        self.assertEqual(VariablesDict(ω=2) + VariablesDict(x=1), VariablesDict(ω=2, x=1))
+        self.assertTrue(VariablesDict(ω=1).divides(VariablesDict(ω=2, x=1)))
+
+        # sums of packed exponents (at most 32767) that overflow
+        # their 16-bit fields give unpacked VariablesDicts
+        self.assertIs(VariablesDict(a=20000) + VariablesDict(a=20000), VariablesDict(a=40000))
+        self.assertIs(VariablesDict(a=20000, z=1) + VariablesDict(a=20000, b=1), VariablesDict(a=40000, b=1, z=1))
+        self.assertIs(VariablesDict(a=20000) * 2, VariablesDict(a=40000))
+
+        # and mixing packed and unpacked ones works too
+        self.assertIs(VariablesDict(a=40000, b=1) + VariablesDict(b=2), VariablesDict(a=40000, b=3))
+        self.assertIs(VariablesDict(a=40000) - VariablesDict(a=20000), VariablesDict(a=20000))
+        self.assertTrue(VariablesDict(a=20000).divides(VariablesDict(a=40000)))
+
+        # no borrows between fields
+        self.assertEqual(VariablesDict(a=1, b=1) - VariablesDict(b=1), VariablesDict(a=1))
+        self.assertRaises(ValueError, "variable's exponent must be positive", lambda: VariablesDict(a=1) - VariablesDict(b=1))
+
+    def test_interning(self):
+        # Equivalent VariablesDicts are the same object
+        self.assertIs(VariablesDict(x=2, y=3), VariablesDict({'Y': 3, 'x': 2.0}))
+        self.assertIs(VariablesDict(a=0), VariablesDict())
+        self.assertIsNot(VariablesDict(x=2), VariablesDict(x=3))
+
+        # VariablesDicts have a compact layout
+        self.assertFalse(hasattr(VariablesDict(x=2), '__dict__'))
+
+        # A VariablesDict is reused when given to the constructor
+        v = VariablesDict(k=4)
+        self.assertIs(VariablesDict(v), v)
+
+        # Results of the operations are interned too
+        self.assertIs(VariablesDict(x=1) + VariablesDict(x=1), VariablesDict(x=2))
+
+        # copies and pickles keep the same object
+        self.assertIs(copy.copy(v), v)
+        self.assertIs(copy.deepcopy(v), v)
+        self.assertIs(pickle.loads(pickle.dumps(v)), v)
+
     def test_setters_getters(self):
         # If a variable isn't in the dict its exponent is 0
         self.assertEqual(VariablesDict(a=2)['a'], 2)
@@ -37,6 +83,19 @@ class Test(TestCase):
         # If a variable isn't in the dict its exponent is 0
         self.assertEqual(VariablesDict()['x'], 0)
 
+        # lookups are case insensitive
+        self.assertEqual(VariablesDict(a=2)['A'], 2)
+
+        # __contains__()
+        self.assertIn('a', VariablesDict(a=2))
+        self.assertNotIn('b', VariablesDict(a=2))
+        self.assertNotIn([], VariablesDict(a=2))
+
+        # iterators are independent
+        v = VariablesDict(a=1, b=2, c=3)
+        self.assertEqual([(x, y) for x in v for y in v], [(x, y) for x in 'abc' for y in 'abc'])
+        self.assertEqual(v + v, VariablesDict(a=2, b=4, c=6))
+
         # __getitem__'s errors
         self.assertRaises(TypeError, "variable's name must be a string", VariablesDict().__getitem__, [])
         self.assertRaises(ValueError, "variable's name length must be one", VariablesDict().__getitem__, 'ab')
@@ -66,6 +125,12 @@ class Test(TestCase):
         self.assertRaises(ValueError, "variable's exponent must be positive", lambda: VariablesDict(x=2, y=3) - VariablesDict(x=3))
         self.assertRaises(TypeError, "unsupported operand type(s) for -: 'VariablesDict' and 'dict'", lambda: VariablesDict() - {})
 
+        # divides()
+        self.assertTrue(VariablesDict(x=2).divides(VariablesDict(x=2, y=3)))
+        self.assertFalse(VariablesDict(x=3).divides(VariablesDict(x=2, y=3)))
+        self.assertTrue(VariablesDict().divides(VariablesDict()))
+        self.assertRaises(TypeError, "other must be a VariablesDict, not dict", VariablesDict().divides, {})
+
         # __mul__()
         self.assertEqual(VariablesDict(a=2, b=5) * 2, VariablesDict(a=4, b=10))
         self.assertRaises(ValueError, "can't multiply a VariablesDict by a negative number", lambda: VariablesDict() * (-1))